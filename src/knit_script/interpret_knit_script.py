@@ -1,13 +1,17 @@
 """Module containing the knit_script_to_knitout function"""
 
-from typing import Any
+from __future__ import annotations
 
-from knit_graphs.Knit_Graph import Knit_Graph
-from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
+from typing import TYPE_CHECKING, Any
 
-from knit_script.debugger.knitscript_debugger import Knit_Script_Debugger
 from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
-from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger, KnitScript_Error_Log, KnitScript_Warning_Log
+
+if TYPE_CHECKING:
+    from knit_graphs.Knit_Graph import Knit_Graph
+    from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
+
+    from knit_script.debugger.knitscript_debugger import Knit_Script_Debugger
+    from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger, KnitScript_Error_Log, KnitScript_Warning_Log
 
 
 def knit_script_to_knitout(
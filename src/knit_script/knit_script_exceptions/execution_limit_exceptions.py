@@ -0,0 +1,54 @@
+"""This module contains Knit Script Exceptions that stop the execution of a knit script program from outside the program.
+
+These exceptions are raised when a program exceeds the execution limits of its context or when its execution is cancelled.
+Try-catch statements do not catch these exceptions, so they stop the program and an error.k file is written with the knitout generated before the program was stopped.
+"""
+
+from __future__ import annotations
+
+from knit_script.knit_script_exceptions.Knit_Script_Exception import Knit_Script_Exception
+
+
+class Execution_Interrupted_Exception(Knit_Script_Exception):
+    """Superclass of the exceptions raised to stop the execution of a knit script program.
+
+    Knit script programs cannot catch these exceptions in try-catch statements.
+    """
+
+
+class Execution_Limit_Exception(Execution_Interrupted_Exception):
+    """Exception raised when a knit script program exceeds one of the execution limits of its context.
+
+    Attributes:
+        limit_name (str): The name of the exceeded limit (e.g., max_statements).
+        limit (int | float): The value of the exceeded limit.
+    """
+
+    def __init__(self, limit_name: str, limit: int | float, description: str) -> None:
+        """Initialize the Execution_Limit_Exception.
+
+        Args:
+            limit_name (str): The name of the exceeded limit.
+            limit (int | float): The value of the exceeded limit.
+            description (str): A description of what exceeded the limit.
+        """
+        self.limit_name: str = limit_name
+        self.limit: int | float = limit
+        super().__init__(f"{description} exceeded the {limit_name} limit of {limit}")
+
+
+class Execution_Cancelled_Exception(Execution_Interrupted_Exception):
+    """Exception raised when the cancellation token of a knit script program's execution limits is cancelled by another thread.
+
+    Attributes:
+        reason (str | None): The reason given for cancelling the execution or None if no reason was given.
+    """
+
+    def __init__(self, reason: str | None = None) -> None:
+        """Initialize the Execution_Cancelled_Exception.
+
+        Args:
+            reason (str | None, optional): The reason given for cancelling the execution. Defaults to no reason.
+        """
+        self.reason: str | None = reason
+        super().__init__("Execution was cancelled" if reason is None else f"Execution was cancelled: {reason}")
@@ -0,0 +1,169 @@
+"""Module containing the Execution_Limits and Cancellation_Token classes.
+
+Execution limits bound the resources that a knit script program can use, so that programs that do not terminate (e.g., a while loop whose condition never changes) do not run indefinitely.
+The limits are checked in the dispatch path of statements in both the tree-walking interpreter and the register machine.
+A cancellation token lets another thread stop a program cleanly: the program stops at its next check with an exception that try-catch statements do not catch, and an error.k file is written with the knitout generated so far.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from knit_script.knit_script_exceptions.execution_limit_exceptions import Execution_Cancelled_Exception, Execution_Limit_Exception
+
+if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+
+
+class Cancellation_Token:
+    """A token that stops the execution of knit script programs when it is cancelled.
+
+    The token can be cancelled from any thread. Programs check the token periodically as they execute and stop with an Execution_Cancelled_Exception once it is cancelled.
+    A cancelled token stays cancelled, so a new token should be used for each program that can be cancelled independently.
+
+    Attributes:
+        reason (str | None): The reason given when the token was cancelled or None if no reason was given.
+        _event (threading.Event): The event that is set when the token is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.reason: str | None = None
+        self._event: threading.Event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Returns:
+            bool: True if the token has been cancelled.
+        """
+        return self._event.is_set()
+
+    def cancel(self, reason: str | None = None) -> None:
+        """Cancel the execution of the programs that check this token.
+
+        Args:
+            reason (str | None, optional): The reason for cancelling the execution, reported by the raised Execution_Cancelled_Exception. Defaults to no reason.
+        """
+        if not self._event.is_set():
+            self.reason = reason
+        self._event.set()
+
+
+class Execution_Limits:
+    """The limits on the execution of knit script programs in a context and the count of the resources used by the current program.
+
+    Each statement executed is charged against the statement limit and the knitout length is compared to the line limit.
+    The wall time and the cancellation token are checked every check_interval steps, where steps are executed statements and iterations of comprehensions,
+     so that the clock is not read for every statement and long-running comprehensions can also be stopped.
+    The scope depth is checked when a new scope (e.g., the body of a called function) is entered.
+    Limits that are None are not checked.
+
+    Note:
+        Statements compiled to bytecode are charged by STEP instructions, so programs execute the same number of statements with or without bytecode compilation.
+
+    Attributes:
+        max_statements (int | None): The maximum number of statements that a program may execute or None if the number of statements is unlimited.
+        max_knitout_lines (int | None): The maximum number of lines, including the header, in the knitout of a program or None if the knitout length is unlimited.
+        max_wall_time (float | None): The maximum number of seconds that a program may execute for or None if the execution time is unlimited.
+        max_scope_depth (int | None): The maximum depth of nested scopes below the root scope or None if the scope depth is unlimited.
+        cancellation_token (Cancellation_Token | None): The token that cancels the execution of the program or None if the program cannot be cancelled.
+        check_interval (int): The number of steps between checks of the wall time and cancellation token.
+        statements_executed (int): The number of statements executed by the current program.
+        _steps (int): The number of steps executed by the current program.
+        _next_check (int): The step at which the wall time and cancellation token are next checked.
+        _start_time (float): The monotonic time at which the current program started.
+    """
+
+    def __init__(
+        self,
+        max_statements: int | None = None,
+        max_knitout_lines: int | None = None,
+        max_wall_time: float | None = None,
+        max_scope_depth: int | None = None,
+        cancellation_token: Cancellation_Token | None = None,
+        check_interval: int = 64,
+    ) -> None:
+        """
+        Args:
+            max_statements (int | None, optional): The maximum number of statements that a program may execute. Defaults to no limit.
+            max_knitout_lines (int | None, optional): The maximum number of lines, including the header, in the knitout of a program. Defaults to no limit.
+            max_wall_time (float | None, optional): The maximum number of seconds that a program may execute for. Defaults to no limit.
+            max_scope_depth (int | None, optional): The maximum depth of nested scopes below the root scope. Defaults to no limit.
+            cancellation_token (Cancellation_Token | None, optional): The token that cancels the execution of the program. Defaults to no cancellation token.
+            check_interval (int, optional): The number of steps between checks of the wall time and cancellation token. Defaults to 64.
+        """
+        self.max_statements: int | None = max_statements
+        self.max_knitout_lines: int | None = max_knitout_lines
+        self.max_wall_time: float | None = max_wall_time
+        self.max_scope_depth: int | None = max_scope_depth
+        self.cancellation_token: Cancellation_Token | None = cancellation_token
+        self.check_interval: int = max(1, check_interval)
+        self.statements_executed: int = 0
+        self._steps: int = 0
+        self._next_check: int = 0
+        self._start_time: float = time.monotonic()
+
+    def reset(self) -> None:
+        """Reset the counts of used resources and the start time at the start of a program. The cancellation token is not reset."""
+        self.statements_executed = 0
+        self._steps = 0
+        self._next_check = 0
+        self._start_time = time.monotonic()
+
+    def charge_statement(self, context: Knit_Script_Context) -> None:
+        """Charge the execution of a statement against the limits.
+
+        Args:
+            context (Knit_Script_Context): The context executing the statement.
+
+        Raises:
+            Execution_Limit_Exception: If the program exceeds the statement, knitout line, or wall time limit.
+            Execution_Cancelled_Exception: If the cancellation token has been cancelled.
+        """
+        self.statements_executed += 1
+        if self.max_statements is not None and self.statements_executed > self.max_statements:
+            raise Execution_Limit_Exception("max_statements", self.max_statements, f"Executing {self.statements_executed} statements")
+        if self.max_knitout_lines is not None and len(context.knitout) > self.max_knitout_lines:
+            raise Execution_Limit_Exception("max_knitout_lines", self.max_knitout_lines, f"Knitout of {len(context.knitout)} lines")
+        self._steps += 1
+        if self._steps >= self._next_check:
+            self._check_clock()
+
+    def charge_step(self) -> None:
+        """Charge a step that is not a statement (e.g., an iteration of a comprehension) against the checks of the wall time and cancellation token.
+
+        Raises:
+            Execution_Limit_Exception: If the program exceeds the wall time limit.
+            Execution_Cancelled_Exception: If the cancellation token has been cancelled.
+        """
+        self._steps += 1
+        if self._steps >= self._next_check:
+            self._check_clock()
+
+    def check_scope_depth(self, depth: int) -> None:
+        """
+        Args:
+            depth (int): The depth of the scope that is being entered.
+
+        Raises:
+            Execution_Limit_Exception: If the depth exceeds the scope depth limit.
+        """
+        if self.max_scope_depth is not None and depth > self.max_scope_depth:
+            raise Execution_Limit_Exception("max_scope_depth", self.max_scope_depth, f"Entering a scope at depth {depth}")
+
+    def _check_clock(self) -> None:
+        """Check the cancellation token and wall time and schedule the next check.
+
+        Raises:
+            Execution_Limit_Exception: If the program exceeds the wall time limit.
+            Execution_Cancelled_Exception: If the cancellation token has been cancelled.
+        """
+        self._next_check = self._steps + self.check_interval
+        if self.cancellation_token is not None and self.cancellation_token.cancelled:
+            raise Execution_Cancelled_Exception(self.cancellation_token.reason)
+        if self.max_wall_time is not None:
+            elapsed_time = time.monotonic() - self._start_time
+            if elapsed_time > self.max_wall_time:
+                raise Execution_Limit_Exception("max_wall_time", self.max_wall_time, f"Executing for {elapsed_time:.3f} seconds")
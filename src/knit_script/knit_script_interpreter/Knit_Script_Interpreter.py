@@ -11,22 +11,26 @@ Attributes:
 
 from __future__ import annotations
 
-from inspect import stack
+import sys
 from typing import TYPE_CHECKING, Any
 
-from knit_graphs.Knit_Graph import Knit_Graph
-from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
-from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
-
-from knit_script.debugger.debug_protocol import Knit_Script_Debugger_Protocol
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
 from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
-from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger, KnitScript_Error_Log, KnitScript_Warning_Log
-from knit_script.knit_script_interpreter.statements.Statement import Statement
 from knit_script.knit_script_std_library.carriers import cut_active_carriers
 
 if TYPE_CHECKING:
+    from knit_graphs.Knit_Graph import Knit_Graph
+    from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+    from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
+
+    from knit_script.debugger.debug_protocol import Knit_Script_Debugger_Protocol
+    from knit_script.knit_script_interpreter.bytecode.Register_VM import Register_VM
+    from knit_script.knit_script_interpreter.Execution_Limits import Execution_Limits
     from knit_script.knit_script_interpreter.expressions.expressions import Expression
+    from knit_script.knit_script_interpreter.knit_script_context_pool import Knit_Script_Context_Pool
+    from knit_script.knit_script_interpreter.knit_script_context_snapshot import Knit_Script_Context_Snapshot
+    from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger, KnitScript_Error_Log, KnitScript_Warning_Log
+    from knit_script.knit_script_interpreter.statements.Statement import Statement
 
 
 class Knit_Script_Interpreter:
@@ -45,6 +49,12 @@ class Knit_Script_Interpreter:
         warning_logger: KnitScript_Warning_Log | None = None,
         error_logger: KnitScript_Error_Log | None = None,
         debugger: Knit_Script_Debugger_Protocol | None = None,
+        replay_loops: bool = False,
+        compile_bytecode: bool = False,
+        lazy_modules: bool = False,
+        context_pool: Knit_Script_Context_Pool | None = None,
+        transactional_try: bool = False,
+        execution_limits: Execution_Limits | None = None,
     ) -> None:
         """Initialize the knit script interpreter.
 
@@ -58,17 +68,105 @@ class Knit_Script_Interpreter:
             debugger (Knit_Script_Debugger, optional):
                 An optional debugger to attach to the knit script context.
                 Defaults to using any debugger already attached to a given context or not attaching any debugger if the context is also new.
+            replay_loops (bool, optional): If True, loop iterations that start from a recorded machine state are replayed instead of interpreted. Defaults to False.
+            compile_bytecode (bool, optional):
+                If True, statements are compiled to bytecode and executed by a register machine instead of by walking their trees, except while a debugger is attached. Defaults to False.
+            lazy_modules (bool, optional):
+                If True, knitscript modules whose top level has no side effects are executed when one of their attributes is first accessed instead of when they are imported. Defaults to False.
+            context_pool (Knit_Script_Context_Pool, optional):
+                A pool that contexts are acquired from when the context is reset, instead of constructing a new context for each program.
+                The context of a program is released to the pool when the interpreter starts its next program,
+                 so the machine state and knit graph returned by a program remain valid until the interpreter executes another program. Defaults to constructing new contexts.
+            transactional_try (bool, optional):
+                If True, the changes that the try block of a try-catch statement made to the machine state, knitout, and machine scope are rolled back before its catch block is executed. Defaults to False.
+            execution_limits (Execution_Limits, optional):
+                The limits on the statements, knitout lines, wall time, and scope depth of each program and the token that cancels programs from another thread.
+                The counts of the limits are reset at the start of each program. Defaults to unlimited execution.
         """
-        self._parser: Knit_Script_Parser = Knit_Script_Parser()
-        if context is None:
-            self._knitscript_context: Knit_Script_Context = Knit_Script_Context(
-                parser=self._parser, debugger=debugger, info_logger=info_logger, warning_logger=warning_logger, error_logger=error_logger
+        self._parser: Knit_Script_Parser = Knit_Script_Parser() if context_pool is None else context_pool.parser
+        self._context_pool: Knit_Script_Context_Pool | None = context_pool
+        self._retired_context: Knit_Script_Context | None = None  # The pooled context of the last program, released when the next program starts.
+        if context is None and context_pool is not None:
+            self._knitscript_context: Knit_Script_Context = context_pool.acquire()
+            self._configure_pooled_context(debugger, info_logger, warning_logger, error_logger, replay_loops, lazy_modules, transactional_try, execution_limits)
+        elif context is None:
+            self._knitscript_context = Knit_Script_Context(
+                parser=self._parser,
+                debugger=debugger,
+                info_logger=info_logger,
+                warning_logger=warning_logger,
+                error_logger=error_logger,
+                replay_loops=replay_loops,
+                lazy_modules=lazy_modules,
+                transactional_try=transactional_try,
+                execution_limits=execution_limits,
             )
         else:
             self._knitscript_context = context
             self._knitscript_context.parser = self._parser
             if debugger is not None:
                 self._knitscript_context.attach_debugger(debugger)
+            if replay_loops:
+                self._knitscript_context.replay_loops = True
+            if lazy_modules:
+                self._knitscript_context.lazy_modules = True
+            if transactional_try:
+                self._knitscript_context.transactional_try = True
+            if execution_limits is not None:
+                self._knitscript_context.execution_limits = execution_limits
+        if compile_bytecode:
+            self._knitscript_context.bytecode_vm = self._new_register_vm()
+
+    def _configure_pooled_context(
+        self,
+        debugger: Knit_Script_Debugger_Protocol | None,
+        info_logger: Knit_Script_Logger | None,
+        warning_logger: KnitScript_Warning_Log | None,
+        error_logger: KnitScript_Error_Log | None,
+        replay_loops: bool,
+        lazy_modules: bool,
+        transactional_try: bool,
+        execution_limits: Execution_Limits | None,
+    ) -> None:
+        """Configure a context acquired from the context pool for this interpreter.
+
+        Args:
+            debugger (Knit_Script_Debugger_Protocol | None): The debugger to attach to the context or None if no debugger is attached.
+            info_logger (Knit_Script_Logger | None): The logger to attach to the context or None to keep the logger of the context.
+            warning_logger (KnitScript_Warning_Log | None): The warning logger to attach to the context or None to keep the warning logger of the context.
+            error_logger (KnitScript_Error_Log | None): The error logger to attach to the context or None to keep the error logger of the context.
+            replay_loops (bool): If True, loop iterations that start from a recorded machine state are replayed instead of interpreted.
+            lazy_modules (bool): If True, knitscript modules whose top level has no side effects are executed when one of their attributes is first accessed.
+            transactional_try (bool): If True, the changes made by the try block of a try-catch statement are rolled back before its catch block is executed.
+            execution_limits (Execution_Limits | None): The limits on the execution of programs in the context or None if execution is unlimited.
+        """
+        context = self._knitscript_context
+        context.parser = self._parser
+        if info_logger is not None:
+            context.info_logger = info_logger
+        if warning_logger is not None:
+            context.warning_logger = warning_logger
+        if error_logger is not None:
+            context.error_logger = error_logger
+        context.replay_loops = replay_loops
+        context.lazy_modules = lazy_modules
+        context.transactional_try = transactional_try
+        context.execution_limits = execution_limits
+        if debugger is not None:
+            context.attach_debugger(debugger)
+
+    @staticmethod
+    def _new_register_vm() -> Register_VM:
+        """
+        Returns:
+            Register_VM: A new register machine to execute statements compiled to bytecode.
+
+        Note:
+            The bytecode compiler and register machine are only imported by interpreters that compile bytecode, so they do not add to the import time of the package.
+        """
+        from knit_script.knit_script_interpreter.bytecode.Register_VM import Register_VM
+
+        return Register_VM()
 
     @property
     def debugger(self) -> Knit_Script_Debugger_Protocol | None:
@@ -100,13 +198,44 @@ class Knit_Script_Interpreter:
 
         This method resets the knit script context to a clean starting state, clearing all variables, machine operations, and execution history. The parser reference is preserved.
 
+        If the interpreter has a context pool, the next context is acquired from the pool.
+        The reset context is retired and released to the pool when the next program starts, so that the results of its program are not restored to the baseline while they are in use.
+
         Note:
             This operation cannot be undone. All context state will be lost.
         """
-        self._knitscript_context = Knit_Script_Context(parser=self._parser, debugger=self.debugger)
+        compile_bytecode = self._knitscript_context.bytecode_vm is not None
+        if self._context_pool is not None:
+            retired_context = self._knitscript_context
+            debugger, replay_loops, lazy_modules, transactional_try = self.debugger, retired_context.replay_loops, retired_context.lazy_modules, retired_context.transactional_try
+            execution_limits = retired_context.execution_limits
+            self._release_retired_context()
+            if retired_context.baseline is not None:  # Contexts restored from snapshots were not acquired from the pool.
+                self._retired_context = retired_context
+            self._knitscript_context = self._context_pool.acquire()
+            self._configure_pooled_context(
+                debugger, retired_context.info_logger, retired_context.warning_logger, retired_context.error_logger, replay_loops, lazy_modules, transactional_try, execution_limits
+            )
+        else:
+            self._knitscript_context = Knit_Script_Context(
+                parser=self._parser,
+                debugger=self.debugger,
+                replay_loops=self._knitscript_context.replay_loops,
+                lazy_modules=self._knitscript_context.lazy_modules,
+                transactional_try=self._knitscript_context.transactional_try,
+                execution_limits=self._knitscript_context.execution_limits,
+            )
+        if compile_bytecode:
+            self._knitscript_context.bytecode_vm = self._new_register_vm()
         if self.debugger is not None:
             self.debugger.reset_debugger()
 
+    def _release_retired_context(self) -> None:
+        """Release the pooled context of the last program to the context pool, restoring it to its baseline."""
+        if self._context_pool is not None and self._retired_context is not None:
+            self._context_pool.release(self._retired_context)
+        self._retired_context = None
+
     def parse(self, pattern: str, pattern_is_file: bool = False) -> list[Statement]:
         """Execute the parsing process for the given knit script pattern.
 
@@ -169,7 +298,7 @@ class Knit_Script_Interpreter:
         if pattern_is_file:
             self._knitscript_context.ks_file = pattern
         else:
-            caller_file = stack()[1].filename
+            caller_file = sys._getframe(1).f_code.co_filename
             self._knitscript_context.ks_file = caller_file
 
         self._add_variables(python_variables)
@@ -187,6 +316,61 @@ class Knit_Script_Interpreter:
 
         return knitout, knitgraph, machine_state, return_val
 
+    def interpret_prefix(self, pattern: str, pattern_is_file: bool = False, **python_variables: Any) -> Knit_Script_Context_Snapshot:
+        """Execute a prefix program shared by several patterns and capture a snapshot of the context after the prefix.
+
+        The active carriers are not cut at the end of the prefix, so the suffix programs restored from the snapshot continue knitting with the carriers, loops, variables, and functions left by the prefix.
+        The interpreter context is reset after the snapshot is captured.
+
+        Args:
+            pattern (str): Either a knit script string or the filename of a knit script file containing the prefix program.
+            pattern_is_file (bool, optional): If True, treats the pattern parameter as a filename. Defaults to False.
+            **python_variables (Any): Additional keyword arguments that will be injected into the knit script execution scope as variables.
+
+        Returns:
+            Knit_Script_Context_Snapshot: A snapshot of the context after the prefix program that suffix programs can be executed from with restore_snapshot.
+
+        Note:
+            The snapshot module is only imported by interpreters that capture snapshots, so it does not add to the import time of the package.
+        """
+        from knit_script.knit_script_interpreter.knit_script_context_snapshot import Knit_Script_Context_Snapshot
+
+        if pattern_is_file:
+            self._knitscript_context.ks_file = pattern
+        else:
+            self._knitscript_context.ks_file = sys._getframe(1).f_code.co_filename
+        self._add_variables(python_variables)
+        try:
+            self._interpret_knit_script(pattern, pattern_is_file)
+            snapshot = Knit_Script_Context_Snapshot(self._knitscript_context)
+        finally:
+            self._reset_context()
+        return snapshot
+
+    def restore_snapshot(self, snapshot: Knit_Script_Context_Snapshot) -> None:
+        """Replace the interpreter context with a context restored from the given snapshot.
+
+        The next program written by the interpreter continues from the state captured by the snapshot. Resetting the context after that program discards the restored context.
+
+        Args:
+            snapshot (Knit_Script_Context_Snapshot): The snapshot to restore the context from.
+        """
+        compile_bytecode = self._knitscript_context.bytecode_vm is not None
+        debugger, replay_loops, lazy_modules = self.debugger, self._knitscript_context.replay_loops, self._knitscript_context.lazy_modules
+        transactional_try, execution_limits = self._knitscript_context.transactional_try, self._knitscript_context.execution_limits
+        if self._context_pool is not None and self._knitscript_context.baseline is not None:
+            self._context_pool.release(self._knitscript_context)
+        self._knitscript_context = snapshot.restore()
+        self._knitscript_context.parser = self._parser
+        self._knitscript_context.replay_loops = replay_loops
+        self._knitscript_context.lazy_modules = lazy_modules
+        self._knitscript_context.transactional_try = transactional_try
+        self._knitscript_context.execution_limits = execution_limits
+        self._knitscript_context.bytecode_vm = self._new_register_vm() if compile_bytecode else None
+        if debugger is not None:
+            self._knitscript_context.attach_debugger(debugger)
+            debugger.reset_debugger()
+
     def _interpret_knit_script(self, pattern: str, pattern_is_file: bool) -> tuple[list[Knitout_Line], Any | None]:
         """Interpret a knit script pattern into knitout instructions.
 
@@ -204,9 +388,12 @@ class Knit_Script_Interpreter:
             This method includes comprehensive error handling.
             If an error occurs, it will attempt to save any successfully generated knitout instructions to an error.k file before re-raising the exception.
         """
+        self._release_retired_context()
         statements = self.parse(pattern, pattern_is_file)
         if pattern_is_file:
             self._knitscript_context.print(f"\n{'=' * 20}Interpreting Knitscript from {pattern}{'=' * 20}")
+        if self._knitscript_context.execution_limits is not None:
+            self._knitscript_context.execution_limits.reset()
         return_val = self._knitscript_context.execute_statements(statements)
         return self._knitscript_context.knitout, return_val
 
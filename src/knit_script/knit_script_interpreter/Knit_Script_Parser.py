@@ -11,6 +11,7 @@ from typing import cast
 import importlib_resources
 import parglare
 from parglare import Grammar, Parser
+from parglare.tables import LRTable
 
 import knit_script.knit_script_interpreter as ks_interpreter
 from knit_script.knit_script_exceptions.parsing_exception import Parsing_Exception
@@ -26,8 +27,14 @@ class Knit_Script_Parser:
 
     This parser supports comprehensive debugging options including grammar state visualization, shift-reduce operation tracking, and layout information display.
      The parser integrates with the knit script action system to convert parsed syntax trees into executable knit script elements.
+
+    Loading the grammar and its LR table dominates the cost of creating a parser, so parsers created without debugging output share the grammar and table loaded by the first such parser.
+    Each parser still owns its parglare parser, which holds the state of a parse in progress.
     """
 
+    _SHARED_GRAMMAR: Grammar | None = None  # The knit script grammar shared by parsers without debugging output.
+    _SHARED_TABLE: LRTable | None = None  # The LR table of the shared grammar.
+
     def __init__(self, debug_grammar: bool = False, debug_parser: bool = False, debug_parser_layout: bool = False):
         """Initialize the knit script parser with debugging options.
 
@@ -40,9 +47,16 @@ class Knit_Script_Parser:
             debug_parser_layout (bool, optional): If True, provides layout information from parser including whitespace and indentation handling. Useful for debugging layout-sensitive parsing issues.
             Defaults to False.
         """
-        pg_resource_stream = importlib_resources.files(ks_interpreter).joinpath("knit_script.pg")
-        self._grammar = Grammar.from_file(pg_resource_stream, debug=debug_grammar, ignore_case=True)
-        self._parser = Parser(self._grammar, debug=debug_parser, debug_layout=debug_parser_layout, actions=action.all)
+        if debug_grammar or debug_parser or debug_parser_layout or Knit_Script_Parser._SHARED_GRAMMAR is None:
+            pg_resource_stream = importlib_resources.files(ks_interpreter).joinpath("knit_script.pg")
+            self._grammar: Grammar = Grammar.from_file(pg_resource_stream, debug=debug_grammar, ignore_case=True)
+            self._parser: Parser = Parser(self._grammar, debug=debug_parser, debug_layout=debug_parser_layout, actions=action.all)
+            if not (debug_grammar or debug_parser or debug_parser_layout):
+                Knit_Script_Parser._SHARED_GRAMMAR = self._grammar
+                Knit_Script_Parser._SHARED_TABLE = self._parser.table
+        else:
+            self._grammar = Knit_Script_Parser._SHARED_GRAMMAR
+            self._parser = Parser(self._grammar, actions=action.all, table=Knit_Script_Parser._SHARED_TABLE)
 
     def parse(self, pattern: str, pattern_is_file: bool = False) -> list[Statement]:
         """Execute the parsing code for the parglare parser.
@@ -0,0 +1,175 @@
+"""Module containing the Machine_State_Fingerprint class.
+
+This module provides the Machine_State_Fingerprint class, an incrementally maintained Zobrist hash of the machine state that a knit script context depends on.
+Replay caches, memoized function calls, and other caches use the fingerprint to decide cheaply whether two machine states are equivalent for the purposes of a script.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+from knitout_interpreter.knitout_operations.needle_instructions import Needle_Instruction
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+
+if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+
+
+class Machine_State_Fingerprint:
+    """Incrementally maintained fingerprint of the state of the knitting machine in a knit script context.
+
+    The loops held on each needle and slider are hashed by XOR-ing a random key for each combination of bed, slider, position, and loop count.
+    Every instruction that the interpreter executes is written to the context's knitout, so the needle hash is brought up to date by reading the loop counts of the needles operated on by the knitout lines added since the last update.
+    The layer assignment of the gauged sheets is hashed the same way by the gauged sheet record as layers change.
+    The remaining parts of the state (racking, carriage direction, working, active, and hooked carriers, gauge, and sheet) are small and are combined with these hashes when the fingerprint is read.
+
+    Note:
+        Changes made to the machine state directly through Python (e.g., calling methods of the machine from a script) without writing knitout are not tracked until the fingerprint is rescanned.
+
+    Attributes:
+        _context (Knit_Script_Context): The context whose machine state is fingerprinted.
+        _knitout (list[Knitout_Line]): The knitout of the context that was last read.
+        _read_lines (int): The number of lines in the knitout that have been read.
+        _loop_counts (dict[tuple[bool, bool, int], int]): The number of loops held on each needle with loops, keyed by bed, slider, and position.
+        _needle_hash (int): The Zobrist hash of the loops held on the needles.
+    """
+
+    _ZOBRIST_KEYS: dict[tuple[object, ...], int] = {}  # Random keys shared by all fingerprints, keyed by the component of the state they represent.
+    _KEY_GENERATOR: random.Random = random.Random(0x5EED)
+
+    def __init__(self, context: Knit_Script_Context) -> None:
+        """Initialize the fingerprint by scanning the machine state of the context.
+
+        Args:
+            context (Knit_Script_Context): The context whose machine state is fingerprinted.
+        """
+        self._context: Knit_Script_Context = context
+        self._knitout: list[Knitout_Line] = context.knitout
+        self._read_lines: int = 0
+        self._loop_counts: dict[tuple[bool, bool, int], int] = {}
+        self._needle_hash: int = 0
+        self.rescan()
+
+    @staticmethod
+    def zobrist_key(*state_component: object) -> int:
+        """
+        Args:
+            *state_component (object): The hashable values that identify a component of the machine state.
+
+        Returns:
+            int: The random 64-bit key of the given state component.
+        """
+        key = Machine_State_Fingerprint._ZOBRIST_KEYS.get(state_component)
+        if key is None:
+            key = Machine_State_Fingerprint._KEY_GENERATOR.getrandbits(64)
+            Machine_State_Fingerprint._ZOBRIST_KEYS[state_component] = key
+        return key
+
+    def rescan(self) -> None:
+        """Recompute the needle hash from all the needles on the machine and mark the current knitout as read."""
+        self._loop_counts.clear()
+        self._needle_hash = 0
+        machine = self._context.machine_state
+        for needles in (machine.front_loops(), machine.back_loops(), machine.front_slider_loops(), machine.back_slider_loops()):
+            for needle in needles:
+                self._set_loop_count((needle.is_front, needle.is_slider, needle.position), len(needle.held_loops))
+        self._knitout = self._context.knitout
+        self._read_lines = len(self._knitout)
+
+    def refresh_needles(self, needles: Iterable[Needle]) -> None:
+        """Update the needle hash with the loop counts of needles that were restored without writing knitout (e.g., by rolling back a machine state journal).
+
+        The lines read from a knitout that was truncated when the needles were restored are marked as unread.
+
+        Args:
+            needles (Iterable[Needle]): The needles whose loops were restored.
+        """
+        if self._knitout is self._context.knitout:
+            self._read_lines = min(self._read_lines, len(self._knitout))
+        for needle in needles:
+            self._set_loop_count((needle.is_front, needle.is_slider, needle.position), len(needle.held_loops))
+
+    def _set_loop_count(self, needle_key: tuple[bool, bool, int], loop_count: int) -> None:
+        """Update the needle hash with the number of loops held on a needle.
+
+        Args:
+            needle_key (tuple[bool, bool, int]): The bed, slider, and position of the needle.
+            loop_count (int): The number of loops held on the needle.
+        """
+        prior_count = self._loop_counts.get(needle_key, 0)
+        if prior_count == loop_count:
+            return
+        if prior_count > 0:
+            self._needle_hash ^= Machine_State_Fingerprint.zobrist_key(*needle_key, prior_count)
+        if loop_count > 0:
+            self._needle_hash ^= Machine_State_Fingerprint.zobrist_key(*needle_key, loop_count)
+            self._loop_counts[needle_key] = loop_count
+        else:
+            del self._loop_counts[needle_key]
+
+    def _read_knitout(self) -> None:
+        """Update the needle hash with the needles operated on by the knitout lines added since the last update."""
+        knitout = self._context.knitout
+        if knitout is not self._knitout or len(knitout) < self._read_lines:  # The knitout was replaced, so the lines since the last update are unknown.
+            self.rescan()
+            return
+        if len(knitout) == self._read_lines:
+            return
+        touched_needles: set[tuple[bool, bool, int]] = set()
+        for instruction in knitout[self._read_lines :]:
+            if isinstance(instruction, Needle_Instruction):
+                needle = instruction.needle
+                touched_needles.add((needle.is_front, needle.is_slider, needle.position))
+                needle_2 = instruction.needle_2
+                if isinstance(needle_2, Needle):
+                    touched_needles.add((needle_2.is_front, needle_2.is_slider, needle_2.position))
+        self._read_lines = len(knitout)
+        machine = self._context.machine_state
+        beds = (machine.back_bed, machine.front_bed)
+        for needle_key in touched_needles:
+            is_front, is_slider, position = needle_key
+            bed = beds[is_front]
+            machine_needle = bed.sliders[position] if is_slider else bed.needles[position]
+            self._set_loop_count(needle_key, len(machine_needle.held_loops))
+
+    @property
+    def needle_hash(self) -> int:
+        """
+        Returns:
+            int: The Zobrist hash of the loops held on each needle and slider of the machine.
+        """
+        self._read_knitout()
+        return self._needle_hash
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        Returns:
+            int: The fingerprint of the machine state of the context.
+        """
+        context = self._context
+        machine = context.machine_state
+        carrier_system = machine.carrier_system
+        working_carrier = context.carrier
+        hooked_carrier = carrier_system.hooked_carrier
+        gauged_sheet_record = context.gauged_sheet_record
+        return hash(
+            (
+                self.needle_hash,
+                machine.rack,
+                machine.all_needle_rack,
+                context.racking,
+                context.direction,
+                None if working_carrier is None else tuple(working_carrier.carrier_ids),
+                tuple(sorted(c.carrier_id for c in carrier_system.active_carriers)),
+                None if hooked_carrier is None else hooked_carrier.carrier_id,
+                carrier_system.searching_for_position,
+                context.gauge,
+                context.sheet.sheet,
+                gauged_sheet_record.gauge,
+                gauged_sheet_record.layer_hash,
+            )
+        )
@@ -0,0 +1,367 @@
+"""Module containing the Machine_State_Journal class.
+
+This module provides the Machine_State_Journal class, an undo log of the changes that a knit script context makes to its knitting machine, knit graph, knitout, and machine scope.
+Try-catch statements open a transaction in the journal before executing their try block and roll the transaction back before executing their catch block,
+ so an operation that fails halfway through a carriage pass does not leave partial loops, instructions, or carrier movements behind.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from knit_graphs.Loop import Loop
+from knit_graphs.Yarn import Yarn
+from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier_Set import Yarn_Carrier_Set
+
+if TYPE_CHECKING:
+    from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+    from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Gauged_Sheet_Record import Gauged_Sheet_Record
+    from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+
+
+def _attribute_image(component: Any) -> dict[str, Any]:
+    """
+    Args:
+        component (Any): The object to capture the attributes of.
+
+    Returns:
+        dict[str, Any]: The attributes of the object. Lists, sets, and dictionaries are copied, as are sets held in dictionaries (e.g., the floats of a loop).
+    """
+    image = dict(vars(component))
+    for name, value in image.items():
+        if isinstance(value, dict):
+            image[name] = {key: set(item) if isinstance(item, set) else item for key, item in value.items()}
+        elif isinstance(value, (list, set)):
+            image[name] = value.copy()
+    return image
+
+
+class _Journal_Transaction:
+    """The state of a knit script context at the start of an open transaction of a machine state journal.
+
+    Attributes:
+        undo_start (int): The index of the first undo log entry recorded in this transaction.
+        knitout (list[Knitout_Line]): The knitout of the context when the transaction started.
+        knitout_length (int): The number of lines in the knitout when the transaction started.
+        variable_scope (Knit_Script_Scope): The variable scope of the context when the transaction started.
+        child_scope (Knit_Script_Scope | None): The child scope of the variable scope when the transaction started.
+        machine_scope_attributes (dict[str, Any]): The machine settings of the variable scope when the transaction started.
+        last_carriage_pass_result (Any): The result of the last carriage pass when the transaction started.
+        yarns (set[Yarn]): The yarns of the knit graph when the transaction started.
+        gauged_sheet_record (Gauged_Sheet_Record): The gauged sheet record of the context when the transaction started.
+        layer_change_count (int): The number of layer changes in the layer journal of the gauged sheet record when the transaction started.
+        opened_layer_journal (bool): True if the transaction started the layer journal of the gauged sheet record.
+    """
+
+    def __init__(self, context: Knit_Script_Context, undo_start: int) -> None:
+        """
+        Args:
+            context (Knit_Script_Context): The context that the transaction is opened in.
+            undo_start (int): The index of the first undo log entry recorded in this transaction.
+        """
+        self.undo_start: int = undo_start
+        self.knitout: list[Knitout_Line] = context.knitout
+        self.knitout_length: int = len(context.knitout)
+        self.variable_scope: Knit_Script_Scope = context.variable_scope
+        self.child_scope: Knit_Script_Scope | None = context.variable_scope._child_scope
+        self.machine_scope_attributes: dict[str, Any] = dict(vars(context.variable_scope.machine_scope))
+        self.last_carriage_pass_result: Any = context.last_carriage_pass_result
+        self.yarns: set[Yarn] = set(context.machine_state.knit_graph.yarns)
+        self.gauged_sheet_record: Gauged_Sheet_Record = context.gauged_sheet_record
+        self.opened_layer_journal: bool = self.gauged_sheet_record.layer_journal is None
+        if self.opened_layer_journal:
+            self.gauged_sheet_record.layer_journal = []
+        assert self.gauged_sheet_record.layer_journal is not None
+        self.layer_change_count: int = len(self.gauged_sheet_record.layer_journal)
+
+
+class Machine_State_Journal:
+    """An undo log of the changes made to the machine state of a knit script context while transactions are open.
+
+    When the first transaction is opened, the journal replaces the loop-forming and loop-moving operations of the knitting machine (knit, tuck, split, drop, and xfer) with journaled operations.
+    Before each operation, the journal records the needles that the operation moves loops on or off, the loops held in the range of the operation, and the yarns of those loops and of the operation's carriers,
+    unless those objects were already recorded in the open transaction.
+    The range of an operation spans its needle, the last needles of its carriers' yarns (where the floats of new loops end), and, for transfers, the needles that transferred loops cross at the current racking.
+    The carriage, yarn insertion system, carriers, racking, and knit graph are small and are recorded when the transaction is opened.
+
+    Rolling back a transaction restores the recorded objects in the reverse order they were recorded and removes the loops made in the transaction from the knit graph and their yarns,
+    so the cost of a rollback grows with the number of needles and loops changed in the transaction instead of the size of the machine.
+    The knitout is truncated to its length at the start of the transaction, and the variable scope and its machine settings are reset to their values at the start of the transaction.
+    Transactions are nested: committing an inner transaction keeps its records so that an enclosing transaction can still roll back its changes.
+
+    Note:
+        Values of knit script variables are not rolled back. Changes made to the machine through methods other than the journaled operations are only recorded if they change the carriage, carriers, racking, or knit graph.
+
+    Attributes:
+        _context (Knit_Script_Context): The context whose changes are recorded.
+        _transactions (list[_Journal_Transaction]): The open transactions, from outermost to innermost.
+        _undo_log (list[tuple[str, Any, Any, int]]): The recorded objects of the open transactions in the order they were recorded,
+            as the kind of record, the recorded object, its captured state, and the depth of its previous record.
+        _record_depths (dict[tuple[str, int], int]): The depth of the innermost transaction that recorded each object, keyed by the kind of record and the id of the object.
+        _machine (Knitting_Machine | None): The knitting machine with journaled operations or None if no transaction is open.
+    """
+
+    _JOURNALED_OPERATIONS: tuple[str, ...] = ("knit", "tuck", "split", "drop", "xfer")
+
+    def __init__(self, context: Knit_Script_Context) -> None:
+        """
+        Args:
+            context (Knit_Script_Context): The context whose changes are recorded.
+        """
+        self._context: Knit_Script_Context = context
+        self._transactions: list[_Journal_Transaction] = []
+        self._undo_log: list[tuple[str, Any, Any, int]] = []
+        self._record_depths: dict[tuple[str, int], int] = {}
+        self._machine: Knitting_Machine | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of open transactions.
+        """
+        return len(self._transactions)
+
+    def begin(self) -> None:
+        """Open a transaction nested in any open transactions."""
+        context = self._context
+        machine = context.machine_state
+        self._transactions.append(_Journal_Transaction(context, len(self._undo_log)))
+        for component in (machine, machine.carriage, machine.carrier_system, machine.knit_graph, *machine.carrier_system.carriers):
+            self._record("attributes", component)
+        for bed in (machine.front_bed, machine.back_bed):
+            self._record("sliders", bed)
+        if self._machine is None:  # The machine's attributes are recorded by the outermost transaction before the journaled operations are set on the machine.
+            self._machine = machine
+            for operation_name in self._JOURNALED_OPERATIONS:
+                setattr(machine, operation_name, self._journaled_operation(operation_name, getattr(machine, operation_name)))
+
+    def commit(self) -> None:
+        """Close the innermost transaction and keep its changes.
+
+        Raises:
+            IndexError: If no transaction is open.
+        """
+        transaction = self._transactions.pop()
+        depth = len(self._transactions)
+        if depth == 0:
+            self._close(transaction)
+            return
+        for kind, recorded_object, _, __ in self._undo_log[transaction.undo_start :]:
+            self._record_depths[kind, id(recorded_object)] = depth  # The enclosing transaction rolls back to the states recorded by this transaction.
+        if transaction.opened_layer_journal:  # The enclosing transaction started from a different gauged sheet record.
+            transaction.gauged_sheet_record.layer_journal = None
+
+    def rollback(self) -> list[Needle]:
+        """Close the innermost transaction and undo its changes.
+
+        Returns:
+            list[Needle]: The needles whose loops were restored. The loop records of these needles may differ from their records in gauged sheet records and fingerprints.
+
+        Raises:
+            IndexError: If no transaction is open.
+        """
+        transaction = self._transactions[-1]
+        context = self._context
+        undone_records = self._undo_log[transaction.undo_start :]
+        del self._undo_log[transaction.undo_start :]
+        made_loops: list[Loop] = []
+        for kind, recorded_object, state, _ in undone_records:
+            if kind == "yarn":
+                made_loops.extend(self._loops_after(recorded_object, state["_last_loop"]))
+        for yarn in context.machine_state.knit_graph.yarns.difference(transaction.yarns):
+            made_loops.extend(self._loops_after(yarn, None))
+        restored_needles: list[Needle] = []
+        for kind, recorded_object, state, prior_depth in reversed(undone_records):
+            if kind == "sliders":
+                recorded_object._active_sliders = state
+            elif kind == "crossings":
+                self._restore_crossings(recorded_object, state)
+            else:
+                attributes = vars(recorded_object)
+                attributes.clear()
+                attributes.update(state)
+                if kind == "needle":
+                    restored_needles.append(recorded_object)
+            if prior_depth == 0:
+                del self._record_depths[kind, id(recorded_object)]
+            else:
+                self._record_depths[kind, id(recorded_object)] = prior_depth
+        knit_graph = context.machine_state.knit_graph
+        for loop in made_loops:
+            knit_graph.braid_graph.remove_loop(loop)
+            if loop in knit_graph.stitch_graph:
+                knit_graph.stitch_graph.remove_node(loop)
+            if loop in loop.yarn.loop_graph:
+                loop.yarn.loop_graph.remove_node(loop)
+        del transaction.knitout[transaction.knitout_length :]
+        context.knitout = transaction.knitout
+        context.variable_scope = transaction.variable_scope
+        transaction.variable_scope.invalidate_cached_resolutions()  # Scopes entered during the transaction are discarded without being exited.
+        transaction.variable_scope._child_scope = transaction.child_scope
+        machine_scope_attributes = vars(transaction.variable_scope.machine_scope)
+        machine_scope_attributes.clear()
+        machine_scope_attributes.update(transaction.machine_scope_attributes)
+        context.last_carriage_pass_result = transaction.last_carriage_pass_result
+        transaction.gauged_sheet_record.rollback_layers(transaction.layer_change_count)
+        self._transactions.pop()
+        if len(self._transactions) == 0:
+            self._close(transaction)
+        elif transaction.opened_layer_journal:
+            transaction.gauged_sheet_record.layer_journal = None
+        return restored_needles
+
+    def _close(self, transaction: _Journal_Transaction) -> None:
+        """Discard the records of the closed outermost transaction and restore the operations of the knitting machine.
+
+        Args:
+            transaction (_Journal_Transaction): The outermost transaction.
+        """
+        self._undo_log.clear()
+        self._record_depths.clear()
+        if self._machine is not None:
+            machine_attributes = vars(self._machine)
+            for operation_name in self._JOURNALED_OPERATIONS:
+                machine_attributes.pop(operation_name, None)
+            self._machine = None
+        if transaction.opened_layer_journal:
+            transaction.gauged_sheet_record.layer_journal = None
+
+    def _record(self, kind: str, recorded_object: Any) -> bool:
+        """Record the state of an object unless it was already recorded in the innermost open transaction.
+
+        Args:
+            kind (str): The kind of record: "attributes", "needle", or "yarn" to record the attributes of the object, "sliders" for the active sliders of a needle bed,
+                or "crossings" for the crossings of a loop in the braid graph.
+            recorded_object (Any): The object to record.
+
+        Returns:
+            bool: True if the object was recorded, False if it was already recorded.
+        """
+        depth = len(self._transactions)
+        key = (kind, id(recorded_object))
+        prior_depth = self._record_depths.get(key, 0)
+        if prior_depth >= depth:
+            return False
+        if kind == "sliders":
+            state: Any = set(recorded_object._active_sliders)
+        elif kind == "crossings":
+            state = self._crossings(recorded_object)
+        else:
+            state = _attribute_image(recorded_object)
+        self._undo_log.append((kind, recorded_object, state, prior_depth))
+        self._record_depths[key] = depth
+        return True
+
+    def _journaled_operation(self, operation_name: str, operation: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Args:
+            operation_name (str): The name of the machine operation.
+            operation (Callable[..., Any]): The machine operation, bound to the machine.
+
+        Returns:
+            Callable[..., Any]: A function that records the range of the operation before executing it.
+        """
+        crosses_loops = operation_name in ("split", "xfer")
+
+        def journaled_operation(*args: Any, **kwargs: Any) -> Any:
+            """
+            Args:
+                *args (Any): The positional arguments of the operation.
+                **kwargs (Any): The keyword arguments of the operation.
+
+            Returns:
+                Any: The result of the operation.
+            """
+            if len(self._transactions) > 0:
+                carrier_set = next((argument for argument in args if isinstance(argument, Yarn_Carrier_Set)), None)
+                needle = next(argument for argument in [*args, *kwargs.values()] if isinstance(argument, Needle))
+                self._record_operation_range(needle, carrier_set, crosses_loops)
+            return operation(*args, **kwargs)
+
+        return journaled_operation
+
+    def _record_operation_range(self, needle: Needle, carrier_set: Yarn_Carrier_Set | None, crosses_loops: bool) -> None:
+        """Record the needles, loops, and yarns that an operation on the given needle can change.
+
+        Args:
+            needle (Needle): The needle that the operation is applied to.
+            carrier_set (Yarn_Carrier_Set | None): The carriers that the operation makes loops with or None if the operation does not make loops.
+            crosses_loops (bool): True if the operation transfers loops, which crosses them with the loops held between the transferring needles.
+        """
+        machine = self._context.machine_state
+        machine_needle = machine[needle]
+        assert isinstance(machine_needle, Needle)
+        positions = [machine_needle.position]
+        if carrier_set is not None:
+            for carrier in carrier_set.get_carriers(machine.carrier_system):
+                self._record("yarn", carrier.yarn)
+                last_needle = carrier.yarn.last_needle()
+                if last_needle is not None:
+                    positions.append(last_needle.position)
+        padding = abs(machine.rack) + 1 if crosses_loops else 0
+        start = max(0, min(positions) - padding)
+        stop = min(machine.needle_count, max(positions) + padding + 1)
+        changed_needles = [machine_needle]
+        if crosses_loops:  # The transfer may move loops to any needle or slider on the opposite bed within the racking.
+            opposite_bed = machine.back_bed if machine_needle.is_front else machine.front_bed
+            changed_needles.extend(opposite_bed.needles[max(0, machine_needle.position - padding) : machine_needle.position + padding + 1])
+            changed_needles.extend(opposite_bed.sliders[max(0, machine_needle.position - padding) : machine_needle.position + padding + 1])
+        for changed_needle in changed_needles:
+            self._record("needle", changed_needle)
+        for loop_needle in [*changed_needles, *machine.front_bed.needles[start:stop], *machine.back_bed.needles[start:stop]]:  # Loops in the range are floated over or crossed.
+            for loop in loop_needle.held_loops:
+                if self._record("attributes", loop):
+                    self._record("yarn", loop.yarn)
+                if crosses_loops:
+                    self._record("crossings", loop)
+
+    def _crossings(self, loop: Loop) -> tuple[bool, list[tuple[Loop, Loop, dict[str, Any]]]]:
+        """
+        Args:
+            loop (Loop): A loop held on the machine.
+
+        Returns:
+            tuple[bool, list[tuple[Loop, Loop, dict[str, Any]]]]: True if the loop is in the braid graph and the crossing edges into and out of the loop with their attributes.
+        """
+        crossing_graph = self._context.machine_state.knit_graph.braid_graph.loop_crossing_graph
+        if loop not in crossing_graph:
+            return False, []
+        return True, [(u, v, dict(data)) for u, v, data in [*crossing_graph.in_edges(loop, data=True), *crossing_graph.out_edges(loop, data=True)]]
+
+    def _restore_crossings(self, loop: Loop, crossings: tuple[bool, list[tuple[Loop, Loop, dict[str, Any]]]]) -> None:
+        """Restore the recorded crossings of a loop in the braid graph.
+
+        Args:
+            loop (Loop): The recorded loop.
+            crossings (tuple[bool, list[tuple[Loop, Loop, dict[str, Any]]]]): True if the loop was in the braid graph and the recorded crossing edges into and out of the loop.
+        """
+        crossing_graph = self._context.machine_state.knit_graph.braid_graph.loop_crossing_graph
+        in_graph, edges = crossings
+        if loop in crossing_graph:
+            if not in_graph:
+                crossing_graph.remove_node(loop)
+                return
+            crossing_graph.remove_edges_from([*crossing_graph.in_edges(loop), *crossing_graph.out_edges(loop)])
+        crossing_graph.add_edges_from(edges)
+
+    @staticmethod
+    def _loops_after(yarn: Yarn, last_loop: Loop | None) -> list[Loop]:
+        """
+        Args:
+            yarn (Yarn): A yarn that loops may have been added to.
+            last_loop (Loop | None): The last loop on the yarn before the loops were added or None if the yarn had no loops.
+
+        Returns:
+            list[Loop]: The loops added to the end of the yarn after the given last loop, from last to first.
+        """
+        loops: list[Loop] = []
+        loop = yarn.last_loop
+        while loop is not None and loop is not last_loop:
+            loops.append(loop)
+            loop = yarn.prior_loop(loop)
+        return loops
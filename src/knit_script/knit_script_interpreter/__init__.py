@@ -10,6 +10,10 @@ Core Components
 Interpreter Classes:
     Knit_Script_Interpreter: Main interpreter class that orchestrates parsing and execution of knit script programs.
     Knit_Script_Context: Manages execution state, variable scopes, and machine interaction during program execution.
+    Knit_Script_Context_Pool: Hands out contexts that are restored to a captured baseline between programs instead of being constructed for each program.
+    Knit_Script_Context_Snapshot: Captures the complete state of a context after a prefix program so that suffix programs can be executed from restored copies of that state.
+    Machine_State_Journal: Records the changes made to the machine state in transactions so that try-catch statements can roll back a failed try block.
+    Execution_Limits: Bounds the statements, knitout lines, wall time, and scope depth of programs and holds the Cancellation_Token that stops a program from another thread.
 
 Parser Infrastructure:
     Knit_Script_Parser: Concrete parser implementation using parglare library.
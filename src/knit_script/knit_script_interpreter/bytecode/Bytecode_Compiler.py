@@ -0,0 +1,384 @@
+"""Module containing the Bytecode_Compiler class.
+
+This module provides the Opcode enumeration, the Bytecode_Program class, and the Bytecode_Compiler class, which compiles knit script statements into linear bytecode for the Register_VM.
+Control flow (code blocks, branches, and loops) is compiled into jumps and common expressions are compiled into register operations, so that they execute without the per-element wrappers of the tree-walking interpreter.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import IntEnum
+from typing import Any
+
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.function_expressions import Function_Call
+from knit_script.knit_script_interpreter.expressions.needle_set_expression import Needle_Set_Expression, Needle_Sets
+from knit_script.knit_script_interpreter.expressions.not_expression import Not_Expression
+from knit_script.knit_script_interpreter.expressions.operator_expressions import Operator, Operator_Expression
+from knit_script.knit_script_interpreter.expressions.values import constant_value, is_constant
+from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.statements.branch_statements import If_Statement
+from knit_script.knit_script_interpreter.statements.control_loop_statements import For_Each_Statement, While_Statement
+from knit_script.knit_script_interpreter.statements.Drop_Pass import Drop_Pass
+from knit_script.knit_script_interpreter.statements.express_statement import Expression_Statement
+from knit_script.knit_script_interpreter.statements.in_direction_statement import In_Direction_Statement
+from knit_script.knit_script_interpreter.statements.return_statement import Return_Statement
+from knit_script.knit_script_interpreter.statements.scoped_statement import Scoped_Statement
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+from knit_script.knit_script_interpreter.statements.Variable_Declaration import Variable_Declaration
+from knit_script.knit_script_interpreter.statements.xfer_pass_statement import Xfer_Pass_Statement
+
+
+class Opcode(IntEnum):
+    """Enumeration of the instructions of the register machine.
+
+    Each instruction is a tuple of an opcode, up to three operands (a, b, c), and the knit script element that errors raised by the instruction are associated with.
+    The operands of each opcode are listed in the comment beside it. Registers and jump targets are integer indices.
+    Each compiled statement and compiled operator expression is enclosed by instructions that open and report its warnings,
+     so that warnings are reported by every enclosing element, as the execute and evaluate wrappers of the tree-walking interpreter report them.
+    """
+
+    CONST = 0  # a: register, b: constant value.
+    LOAD = 1  # a: register, b: variable expression.
+    NEEDLE_SET = 2  # a: register, b: gauged sheet record method that collects the needle set or None for the Last_Pass.
+    EVAL = 3  # a: register, b: expression evaluated by the tree-walking interpreter.
+    CALL = 4  # a: register receiving the return value, b: function call, executed in a new call frame if it calls a knit script function and evaluated otherwise.
+    BINARY = 5  # a: register holding the left operand and receiving the result, b: operation, c: register holding the right operand.
+    NOT = 6  # a: register to negate.
+    JUMP = 7  # a: target.
+    JUMP_IF_FALSE = 8  # a: register, b: target.
+    JUMP_IF_TRUE = 9  # a: register, b: target.
+    JUMP_IF_RETURNED = 10  # a: target.
+    STORE = 11  # a: variable name, b: register.
+    STORE_GLOBAL = 12  # a: variable name, b: register.
+    RETURN = 13  # a: register.
+    ENTER_SCOPE = 14  # no operands.
+    EXIT_SCOPE = 15  # a: True if the scope collapses into its parent.
+    PRE_SCOPE = 16  # a: scoped statement, b: target if the statement's pre-scope action skips its statements.
+    ACTIVATE = 17  # a: loop-invariant expressions.
+    DEACTIVATE = 18  # no operands.
+    FOR_SETUP = 19  # a: loop slot, b: for-each statement, c: register holding the iterated value or None to evaluate the statement's list of expressions.
+    FOR_NEXT = 20  # a: loop slot, b: target when the iterations are exhausted.
+    FOR_END = 21  # a: loop slot.
+    CARRIAGE_PASS = 22  # a: carriage pass statement.
+    XFER_PASS = 23  # a: transfer pass statement.
+    EXEC = 24  # a: statement executed by the tree-walking interpreter.
+    STEP = 25  # a: compiled statement charged against the execution limits of the context. Opens the statement's warnings, which are reported by its REPORT_WARNINGS instruction.
+    OPEN_WARNINGS = 26  # no operands. Opens the warnings of a compiled expression.
+    REPORT_WARNINGS = 27  # a: compiled statement or expression that reports the warnings raised since its warnings were opened.
+
+
+_JUMP_TARGET_OPERAND: dict[Opcode, int] = {
+    Opcode.JUMP: 1,
+    Opcode.JUMP_IF_RETURNED: 1,
+    Opcode.JUMP_IF_FALSE: 2,
+    Opcode.JUMP_IF_TRUE: 2,
+    Opcode.PRE_SCOPE: 2,
+    Opcode.FOR_NEXT: 2,
+}
+
+Instruction = tuple[int, Any, Any, Any, KS_Element | None]
+
+
+class Bytecode_Program:
+    """The compiled instructions of a knit script statement.
+
+    Attributes:
+        instructions (list[Instruction]): The instructions of the program in execution order.
+        register_count (int): The number of registers used by the program.
+        loop_count (int): The number of for-each loops in the program, each of which keeps its iteration state in a loop slot of the executing frame.
+    """
+
+    def __init__(self, instructions: list[Instruction], register_count: int, loop_count: int) -> None:
+        """
+        Args:
+            instructions (list[Instruction]): The instructions of the program in execution order.
+            register_count (int): The number of registers used by the program.
+            loop_count (int): The number of for-each loops in the program.
+        """
+        self.instructions: list[Instruction] = instructions
+        self.register_count: int = register_count
+        self.loop_count: int = loop_count
+
+    @property
+    def opcodes(self) -> list[Opcode]:
+        """
+        Returns:
+            list[Opcode]: The opcode of each instruction in the program.
+        """
+        return [Opcode(instruction[0]) for instruction in self.instructions]
+
+    def disassemble(self) -> str:
+        """
+        Returns:
+            str: A human-readable listing of the instructions in the program, one instruction per line.
+        """
+        lines = []
+        for index, (opcode, a, b, c, _source) in enumerate(self.instructions):
+            operands = " ".join(str(operand) for operand in (a, b, c) if operand is not None)
+            lines.append(f"{index:4d} {Opcode(opcode).name} {operands}".rstrip())
+        return "\n".join(lines)
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+
+class Bytecode_Compiler:
+    """Compiles knit script statements and their expressions into bytecode programs.
+
+    Statements and expressions without a compiled form are executed through their tree objects by EXEC and EVAL instructions,
+     so any program can be compiled and the compiled program has the same effect as the tree-walking interpreter.
+
+    Attributes:
+        _replay_loops (bool): True if loops are executed with row replay, in which case loops are executed by the tree-walking interpreter.
+        _instructions (list[Instruction]): The instructions of the program being compiled.
+        _next_register (int): The first register not in use by the expression being compiled.
+        _register_count (int): The number of registers used by the program being compiled.
+        _loop_count (int): The number of loop slots used by the program being compiled.
+    """
+
+    def __init__(self, replay_loops: bool = False) -> None:
+        """
+        Args:
+            replay_loops (bool, optional): True if loops are executed with row replay. Defaults to False.
+        """
+        self._replay_loops: bool = replay_loops
+        self._instructions: list[Instruction] = []
+        self._next_register: int = 0
+        self._register_count: int = 0
+        self._loop_count: int = 0
+
+    def compile(self, statement: Statement) -> Bytecode_Program:
+        """
+        Args:
+            statement (Statement): The statement to compile.
+
+        Returns:
+            Bytecode_Program: The bytecode program that executes the statement.
+        """
+        self._instructions = []
+        self._next_register = 0
+        self._register_count = 0
+        self._loop_count = 0
+        self._compile_statement(statement)
+        return Bytecode_Program(self._instructions, self._register_count, self._loop_count)
+
+    def _emit(self, opcode: Opcode, a: Any = None, b: Any = None, c: Any = None, source: KS_Element | None = None) -> int:
+        """
+        Args:
+            opcode (Opcode): The opcode of the instruction.
+            a (Any, optional): The first operand. Defaults to None.
+            b (Any, optional): The second operand. Defaults to None.
+            c (Any, optional): The third operand. Defaults to None.
+            source (KS_Element | None, optional): The element that errors raised by the instruction are associated with. Defaults to None.
+
+        Returns:
+            int: The index of the emitted instruction.
+        """
+        self._instructions.append((opcode.value, a, b, c, source))
+        return len(self._instructions) - 1
+
+    def _patch_jump(self, index: int, target: int | None = None) -> None:
+        """Set the target of an emitted jump instruction.
+
+        Args:
+            index (int): The index of the jump instruction.
+            target (int | None, optional): The index of the instruction to jump to. Defaults to the next instruction to be emitted.
+        """
+        instruction = list(self._instructions[index])
+        instruction[_JUMP_TARGET_OPERAND[Opcode(instruction[0])]] = len(self._instructions) if target is None else target
+        self._instructions[index] = (instruction[0], instruction[1], instruction[2], instruction[3], instruction[4])
+
+    def _allocate_register(self) -> int:
+        """
+        Returns:
+            int: A register that is not in use by the expression being compiled.
+        """
+        register = self._next_register
+        self._next_register += 1
+        self._register_count = max(self._register_count, self._next_register)
+        return register
+
+    def _compile_statement(self, statement: Statement) -> None:
+        """Compile a statement into the program. Registers allocated for the statement's expressions are released after the statement.
+
+        Args:
+            statement (Statement): The statement to compile.
+        """
+        first_free_register = self._next_register
+        step = self._emit(Opcode.STEP, statement, source=statement)
+        if isinstance(statement, Variable_Declaration):
+            register = self._compile_value(statement._assignment._value_expression)
+            self._emit(Opcode.STORE_GLOBAL if statement._is_global else Opcode.STORE, statement._assignment.variable_name, register, source=statement)
+        elif isinstance(statement, Expression_Statement):
+            self._compile_value(statement.expression)
+        elif isinstance(statement, Return_Statement):
+            register = self._compile_value(statement._expression)
+            self._emit(Opcode.RETURN, register, source=statement)
+        elif isinstance(statement, If_Statement):
+            self._compile_if(statement)
+        elif isinstance(statement, While_Statement) and not self._replay_loops:
+            self._compile_while(statement)
+        elif isinstance(statement, For_Each_Statement) and not self._replay_loops:
+            self._compile_for_each(statement)
+        elif isinstance(statement, Scoped_Statement) and type(statement).execute is Scoped_Statement.execute:
+            self._compile_scoped(statement)
+        elif isinstance(statement, (In_Direction_Statement, Drop_Pass)):
+            self._replace_step(step, Opcode.CARRIAGE_PASS, statement)
+        elif isinstance(statement, Xfer_Pass_Statement):
+            self._replace_step(step, Opcode.XFER_PASS, statement)
+        else:
+            self._replace_step(step, Opcode.EXEC, statement)
+        if self._instructions[step][0] == Opcode.STEP.value:  # Statements executed by the tree-walking interpreter report their own warnings.
+            self._emit(Opcode.REPORT_WARNINGS, statement)
+        self._next_register = first_free_register
+
+    def _replace_step(self, step: int, opcode: Opcode, statement: Statement) -> None:
+        """Replace the STEP instruction of a statement executed by the tree-walking interpreter with the instruction that executes it, because its execute method charges it against the execution limits.
+
+        Args:
+            step (int): The index of the statement's STEP instruction, which is the last emitted instruction.
+            opcode (Opcode): The opcode of the instruction that executes the statement.
+            statement (Statement): The statement executed by the instruction.
+        """
+        self._instructions[step] = (opcode.value, statement, None, None, statement)
+
+    def _compile_statements(self, statements: list[Statement], returned_target: int | None = None) -> list[int]:
+        """Compile a sequence of statements that stops when a statement returns.
+
+        Args:
+            statements (list[Statement]): The statements to compile in execution order.
+            returned_target (int | None, optional): The instruction to jump to when a statement returns. Defaults to the instruction after the statements.
+
+        Returns:
+            list[int]: The indices of the emitted jumps that are taken when a statement returns.
+        """
+        returned_jumps = []
+        for statement in statements:
+            self._compile_statement(statement)
+            returned_jumps.append(self._emit(Opcode.JUMP_IF_RETURNED, returned_target))
+        if returned_target is None:
+            for jump in returned_jumps:
+                self._patch_jump(jump)
+        return returned_jumps
+
+    def _compile_scoped(self, statement: Scoped_Statement) -> None:
+        """
+        Args:
+            statement (Scoped_Statement): The code block or other scoped statement to compile, executed in a new scope.
+        """
+        self._emit(Opcode.ENTER_SCOPE)
+        pre_scope = self._emit(Opcode.PRE_SCOPE, statement, source=statement)
+        self._compile_statements(list(statement._subscope_statements))
+        self._patch_jump(pre_scope)
+        self._emit(Opcode.EXIT_SCOPE, statement._collapse_scope_into_parent)
+
+    def _compile_if(self, statement: If_Statement) -> None:
+        """
+        Args:
+            statement (If_Statement): The branch to compile.
+        """
+        condition = self._compile_value(statement._condition)
+        false_jump = self._emit(Opcode.JUMP_IF_FALSE, condition)
+        self._compile_statement(statement._true_statement)
+        if statement._false_statement is None:
+            self._patch_jump(false_jump)
+        else:
+            end_jump = self._emit(Opcode.JUMP)
+            self._patch_jump(false_jump)
+            self._compile_statement(statement._false_statement)
+            self._patch_jump(end_jump)
+
+    def _compile_while(self, statement: While_Statement) -> None:
+        """
+        Args:
+            statement (While_Statement): The while loop to compile.
+        """
+        self._emit(Opcode.ACTIVATE, statement._invariants)
+        condition_start = len(self._instructions)
+        condition = self._compile_value(statement._condition)
+        exit_jump = self._emit(Opcode.JUMP_IF_FALSE, condition)
+        self._next_register = condition
+        self._compile_statement(statement._statement)
+        self._emit(Opcode.JUMP, condition_start)
+        self._patch_jump(exit_jump)
+        self._emit(Opcode.DEACTIVATE)
+
+    def _compile_for_each(self, statement: For_Each_Statement) -> None:
+        """
+        Args:
+            statement (For_Each_Statement): The for-each loop to compile.
+        """
+        loop_slot = self._loop_count
+        self._loop_count += 1
+        iterated_register = self._compile_value(statement._iter_expression) if isinstance(statement._iter_expression, Expression) else None
+        self._emit(Opcode.FOR_SETUP, loop_slot, statement, iterated_register, source=statement)
+        if iterated_register is not None:
+            self._next_register = iterated_register
+        next_iteration = self._emit(Opcode.FOR_NEXT, loop_slot, source=statement)
+        if statement._reuse_body_scope:  # The body's statements execute in the body scope entered by the first iteration.
+            assert isinstance(statement._statement, Scoped_Statement)
+            self._compile_statements(list(statement._statement._subscope_statements), returned_target=next_iteration)
+        else:
+            self._compile_statement(statement._statement)
+        self._emit(Opcode.JUMP, next_iteration)
+        self._patch_jump(next_iteration)
+        self._emit(Opcode.FOR_END, loop_slot)
+
+    def _compile_value(self, value: Expression | Any) -> int:
+        """
+        Args:
+            value (Expression | Any): The expression to compile or a value that is assigned without evaluation.
+
+        Returns:
+            int: The register that holds the value after the compiled instructions execute.
+        """
+        register = self._allocate_register()
+        if isinstance(value, Expression):
+            self._compile_expression(value, register)
+        else:
+            self._emit(Opcode.CONST, register, value)
+        return register
+
+    def _compile_expression(self, expression: Expression, register: int) -> None:
+        """
+        Args:
+            expression (Expression): The expression to compile.
+            register (int): The register that holds the value of the expression after the compiled instructions execute.
+        """
+        if isinstance(expression, Variable_Expression):
+            self._emit(Opcode.LOAD, register, expression, source=expression)
+        elif is_constant(expression):
+            try:
+                value = constant_value(expression)
+            except Exception:  # Errors are raised when the expression is evaluated.
+                self._emit(Opcode.EVAL, register, expression, source=expression)
+            else:
+                self._emit(Opcode.CONST, register, value)
+        elif isinstance(expression, Function_Call):
+            self._emit(Opcode.CALL, register, expression, source=expression)
+        elif isinstance(expression, Needle_Set_Expression):
+            sheet_access: Callable[..., Any] | None = None if expression.kp_set is Needle_Sets.Last_Pass else expression.kp_set.sheet_access()
+            self._emit(Opcode.NEEDLE_SET, register, sheet_access, source=expression)
+        elif isinstance(expression, Not_Expression):
+            self._emit(Opcode.OPEN_WARNINGS)
+            self._compile_expression(expression._negated_expression, register)
+            self._emit(Opcode.NOT, register, source=expression)
+            self._emit(Opcode.REPORT_WARNINGS, expression)
+        elif isinstance(expression, Operator_Expression):
+            self._emit(Opcode.OPEN_WARNINGS)
+            self._compile_expression(expression.lhs, register)
+            if expression.op is Operator.And or expression.op is Operator.Or:  # Short-circuit: the right-hand side is only evaluated if it determines the result.
+                short_circuit = self._emit(Opcode.JUMP_IF_FALSE if expression.op is Operator.And else Opcode.JUMP_IF_TRUE, register)
+                self._compile_expression(expression.rhs, register)
+                self._patch_jump(short_circuit)
+            else:
+                first_free_register = self._next_register
+                rhs_register = self._allocate_register()
+                self._compile_expression(expression.rhs, rhs_register)
+                self._emit(Opcode.BINARY, register, expression.op.operation, rhs_register, source=expression)
+                self._next_register = first_free_register
+            self._emit(Opcode.REPORT_WARNINGS, expression)
+        else:
+            self._emit(Opcode.EVAL, register, expression, source=expression)
@@ -0,0 +1,369 @@
+"""Module containing the Register_VM class.
+
+This module provides the Register_VM class, which executes the bytecode programs produced by the Bytecode_Compiler, and the Call_Frame and For_Each_State classes that hold the state of executing programs.
+Each statement executed by the virtual machine (e.g., a top-level statement or the body of a called function) executes in its own call frame on the virtual machine's frame stack.
+Calls to knit script functions compiled as CALL instructions are trampolined: the body of the called function executes in a frame pushed onto the frame stack by the same dispatch loop,
+ so the depth of recursive knit script functions is bounded by memory rather than by the Python stack.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from knit_script.knit_script_interpreter.bytecode.Bytecode_Compiler import Bytecode_Compiler, Bytecode_Program, Opcode
+from knit_script.knit_script_interpreter.expressions.Loop_Invariant_Expression import Loop_Invariant_Expression
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.ks_element import KS_Element, annotate_error, report_warnings
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.scope.variable_space import Variable_Space
+from knit_script.knit_script_interpreter.statements.control_loop_statements import For_Each_Statement
+from knit_script.knit_script_interpreter.statements.function_dec_statement import Function_Signature
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+
+_CONST = Opcode.CONST.value
+_LOAD = Opcode.LOAD.value
+_NEEDLE_SET = Opcode.NEEDLE_SET.value
+_EVAL = Opcode.EVAL.value
+_CALL = Opcode.CALL.value
+_BINARY = Opcode.BINARY.value
+_NOT = Opcode.NOT.value
+_JUMP = Opcode.JUMP.value
+_JUMP_IF_FALSE = Opcode.JUMP_IF_FALSE.value
+_JUMP_IF_TRUE = Opcode.JUMP_IF_TRUE.value
+_JUMP_IF_RETURNED = Opcode.JUMP_IF_RETURNED.value
+_STORE = Opcode.STORE.value
+_STORE_GLOBAL = Opcode.STORE_GLOBAL.value
+_RETURN = Opcode.RETURN.value
+_ENTER_SCOPE = Opcode.ENTER_SCOPE.value
+_EXIT_SCOPE = Opcode.EXIT_SCOPE.value
+_PRE_SCOPE = Opcode.PRE_SCOPE.value
+_ACTIVATE = Opcode.ACTIVATE.value
+_DEACTIVATE = Opcode.DEACTIVATE.value
+_FOR_SETUP = Opcode.FOR_SETUP.value
+_FOR_NEXT = Opcode.FOR_NEXT.value
+_FOR_END = Opcode.FOR_END.value
+_CARRIAGE_PASS = Opcode.CARRIAGE_PASS.value
+_XFER_PASS = Opcode.XFER_PASS.value
+_EXEC = Opcode.EXEC.value
+_STEP = Opcode.STEP.value
+_OPEN_WARNINGS = Opcode.OPEN_WARNINGS.value
+_REPORT_WARNINGS = Opcode.REPORT_WARNINGS.value
+
+
+class For_Each_State:
+    """The iteration state of an executing for-each loop.
+
+    Attributes:
+        statement (For_Each_Statement): The executing for-each loop.
+        iterator (Iterator[Any]): The iterator over the values of the loop.
+        new_variable_names (set[str]): The loop variables that were not defined before the loop and are deleted when the loop ends.
+        variable_names (list[str]): The names of the loop variables.
+        variable_space (Variable_Space | None): The variable space holding the loop variables when the loop reuses its body scope, set by the first iteration.
+        body_scope (Knit_Script_Scope | None): The scope reused by all iterations of the body when the loop reuses its body scope, entered by the first iteration.
+    """
+
+    def __init__(self, statement: For_Each_Statement, iterable: Iterable[Any], new_variable_names: set[str]) -> None:
+        """
+        Args:
+            statement (For_Each_Statement): The executing for-each loop.
+            iterable (Iterable[Any]): The values to iterate over.
+            new_variable_names (set[str]): The loop variables that were not defined before the loop.
+        """
+        self.statement: For_Each_Statement = statement
+        self.iterator: Iterator[Any] = iter(iterable)
+        self.new_variable_names: set[str] = new_variable_names
+        self.variable_names: list[str] = [v.variable_name for v in statement._variables]
+        self.variable_space: Variable_Space | None = None
+        self.body_scope: Knit_Script_Scope | None = None
+
+
+class Call_Frame:
+    """The state of one executing bytecode program.
+
+    Attributes:
+        program (Bytecode_Program): The executing program.
+        signature (Function_Signature | None): The called function if the program is the body of a trampolined call, or None if the frame executes a statement for the tree-walking interpreter.
+        return_register (int | None): The register of the calling frame that receives the return value of a trampolined call.
+        pc (int): The index of the next instruction to execute when the frame resumes after a trampolined call returns.
+        registers (list[Any]): The values held in the registers of the program.
+        loops (list[For_Each_State | None]): The iteration state of each executing for-each loop in the program, indexed by loop slot.
+        activations (list[tuple[list[Loop_Invariant_Expression], list[int | None]]]):
+            The loop-invariant expressions activated by each executing loop and their prior activations, in the order the loops started.
+        warning_marks (list[int]): The number of warnings caught when each executing compiled element (or trampolined call made by the frame) opened its warnings, innermost last.
+    """
+
+    def __init__(self, program: Bytecode_Program, signature: Function_Signature | None = None, return_register: int | None = None) -> None:
+        """
+        Args:
+            program (Bytecode_Program): The program to execute in this frame.
+            signature (Function_Signature | None, optional): The called function if the program is the body of a trampolined call. Defaults to None.
+            return_register (int | None, optional): The register of the calling frame that receives the return value of a trampolined call. Defaults to None.
+        """
+        self.program: Bytecode_Program = program
+        self.signature: Function_Signature | None = signature
+        self.return_register: int | None = return_register
+        self.pc: int = 0
+        self.registers: list[Any] = [None] * program.register_count
+        self.loops: list[For_Each_State | None] = [None] * program.loop_count
+        self.activations: list[tuple[list[Loop_Invariant_Expression], list[int | None]]] = []
+        self.warning_marks: list[int] = []
+
+    def activate(self, invariants: list[Loop_Invariant_Expression], context: Knit_Script_Context) -> None:
+        """Activate the loop-invariant expressions of a loop that starts executing.
+
+        Args:
+            invariants (list[Loop_Invariant_Expression]): The loop-invariant expressions of the loop.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        self.activations.append((invariants, [invariant.activate(context) for invariant in invariants]))
+
+    def deactivate(self) -> None:
+        """Restore the prior activations of the loop-invariant expressions of the most recently started loop."""
+        invariants, prior_activations = self.activations.pop()
+        for invariant, prior_activation in zip(invariants, prior_activations, strict=True):
+            invariant.deactivate(prior_activation)
+
+
+class Register_VM:
+    """Executes knit script statements by compiling them into bytecode programs and running the programs on a register machine.
+
+    Programs are compiled on the first execution of a statement and cached for later executions.
+    Errors raised by an instruction are annotated with the location of the element the instruction was compiled from, as in the tree-walking interpreter.
+    Warnings are reported by each compiled element and trampolined call that encloses the instruction that raised them, in the same order as the tree-walking interpreter reports them.
+
+    Note:
+        The register machine must not be used while a debugger is attached to the context, because compiled statements do not pause for the debugger.
+
+    Attributes:
+        frames (list[Call_Frame]): The stack of executing call frames. The last frame is the frame of the innermost executing statement.
+        _programs (dict[int, tuple[Statement, Bytecode_Program]]): The compiled program of each executed statement keyed by the id of the statement.
+    """
+
+    def __init__(self) -> None:
+        self.frames: list[Call_Frame] = []
+        self._programs: dict[int, tuple[Statement, Bytecode_Program]] = {}
+
+    def program(self, statement: Statement, context: Knit_Script_Context) -> Bytecode_Program:
+        """
+        Args:
+            statement (Statement): The statement to execute.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+
+        Returns:
+            Bytecode_Program: The compiled program of the statement.
+        """
+        compiled = self._programs.get(id(statement))
+        if compiled is None:
+            compiled = statement, Bytecode_Compiler(replay_loops=context.replay_loops).compile(statement)
+            self._programs[id(statement)] = compiled
+        return compiled[1]
+
+    def execute(self, statement: Statement, context: Knit_Script_Context) -> None:
+        """Execute the compiled program of the statement in a new call frame.
+
+        Warnings reported by the statement are issued to the caller, as the execute wrapper of the statement issues them in the tree-walking interpreter.
+
+        Args:
+            statement (Statement): The statement to execute.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        self.frames.append(Call_Frame(self.program(statement, context)))
+        base_depth = len(self.frames)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self._run(base_depth, context, caught)
+        finally:
+            del self.frames[base_depth - 1 :]
+        for warning in caught:
+            if not isinstance(warning.source, KS_Element):
+                warnings.warn(warning.message, stacklevel=1)
+
+    @staticmethod
+    def _report_warnings(element: KS_Element, context: Knit_Script_Context, caught: list[warnings.WarningMessage], warning_mark: int) -> None:
+        """Report the warnings caught since the given element opened its warnings, as if they were caught by the execute or evaluate wrapper of the element.
+
+        Args:
+            element (KS_Element): The compiled element or trampolined function call that reports the warnings.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            caught (list[warnings.WarningMessage]): The warnings caught while executing the program. The reported warnings are replaced by the warnings the element issues.
+            warning_mark (int): The number of caught warnings when the element opened its warnings.
+        """
+        element_warnings = caught[warning_mark:]
+        del caught[warning_mark:]
+        report_warnings(element, context, element_warnings)  # Re-issued warnings are caught again for the enclosing element.
+
+    def _run(self, base_depth: int, context: Knit_Script_Context, caught: list[warnings.WarningMessage]) -> None:
+        """Execute the instructions of the frame at the given depth of the frame stack and of the trampolined calls it makes.
+
+        Args:
+            base_depth (int): The depth of the frame stack with the frame to execute on top. Execution ends when that frame's program ends.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            caught (list[warnings.WarningMessage]): The warnings caught while executing the program.
+        """
+        frames = self.frames
+        frame = frames[-1]
+        instructions = frame.program.instructions
+        registers = frame.registers
+        warning_marks = frame.warning_marks
+        instruction_count = len(instructions)
+        pc = 0
+        try:
+            while True:
+                while pc < instruction_count:
+                    opcode, a, b, c, _source = instructions[pc]
+                    pc += 1
+                    if opcode == _LOAD:
+                        registers[a] = b.lookup(context)
+                    elif opcode == _CONST:
+                        registers[a] = b
+                    elif opcode == _BINARY:
+                        registers[a] = b(registers[a], registers[c])
+                    elif opcode == _JUMP_IF_RETURNED:
+                        if context.variable_scope.returned:
+                            pc = a
+                    elif opcode == _STEP:
+                        warning_marks.append(len(caught))
+                        if context.execution_limits is not None:
+                            context.execution_limits.charge_statement(context)
+                    elif opcode == _JUMP_IF_FALSE:
+                        if not registers[a]:
+                            pc = b
+                    elif opcode == _JUMP:
+                        pc = a
+                    elif opcode == _STORE:
+                        context.variable_scope[a] = registers[b]
+                    elif opcode == _REPORT_WARNINGS:
+                        warning_mark = warning_marks.pop()
+                        if len(caught) > warning_mark:
+                            Register_VM._report_warnings(a, context, caught, warning_mark)
+                    elif opcode == _OPEN_WARNINGS:
+                        warning_marks.append(len(caught))
+                    elif opcode == _EVAL:
+                        registers[a] = b.evaluate(context)
+                    elif opcode == _CALL:
+                        signature = b.trampolined_signature(context)
+                        if signature is None:
+                            registers[a] = b.evaluate(context)
+                        else:  # Push a frame for the body of the called function and continue in it.
+                            warning_marks.append(len(caught))  # The call reports the warnings of its arguments and body when it returns.
+                            signature.enter_call(context, b.args, b.kwargs)
+                            frame.pc = pc
+                            frame = Call_Frame(self.program(signature.body, context), signature, a)
+                            frames.append(frame)
+                            instructions = frame.program.instructions
+                            registers = frame.registers
+                            warning_marks = frame.warning_marks
+                            instruction_count = len(instructions)
+                            pc = 0
+                    elif opcode == _FOR_NEXT:
+                        state = frame.loops[a]
+                        assert state is not None
+                        try:
+                            value = next(state.iterator)
+                        except StopIteration:
+                            pc = b
+                            continue
+                        values = state.statement._iteration_values(value)
+                        if not state.statement._reuse_body_scope:
+                            for variable_name, variable_value in zip(state.variable_names, values, strict=True):
+                                context.variable_scope[variable_name] = variable_value
+                        elif state.variable_space is None or state.body_scope is None:  # First iteration declares the loop variables and enters the body scope.
+                            for variable_name, variable_value in zip(state.variable_names, values, strict=True):
+                                state.variable_space = context.variable_scope.declare_local(variable_name, variable_value)
+                            state.body_scope = context.enter_sub_scope()
+                        else:
+                            for variable_name, variable_value in zip(state.variable_names, values, strict=True):
+                                state.variable_space[variable_name] = variable_value
+                            state.body_scope.clear_return()  # a return does not stop the iterations of a loop.
+                    elif opcode == _NEEDLE_SET:
+                        registers[a] = context.last_carriage_pass_result if b is None else b(context.gauged_sheet_record, context.sheet.sheet)
+                    elif opcode in (_CARRIAGE_PASS, _XFER_PASS, _EXEC):
+                        a.execute(context)
+                    elif opcode == _ENTER_SCOPE:
+                        context.enter_sub_scope()
+                    elif opcode == _EXIT_SCOPE:
+                        context.exit_current_scope(collapse_into_parent=a)
+                    elif opcode == _PRE_SCOPE:
+                        if not a.pre_scope_action(context):
+                            pc = b
+                    elif opcode == _NOT:
+                        registers[a] = not registers[a]
+                    elif opcode == _JUMP_IF_TRUE:
+                        if registers[a]:
+                            pc = b
+                    elif opcode == _RETURN:
+                        context.variable_scope.return_value = registers[a]
+                    elif opcode == _STORE_GLOBAL:
+                        context.variable_scope.set_global(a, registers[b])
+                    elif opcode == _FOR_SETUP:
+                        Register_VM._setup_for_each(frame, a, b, b._get_iterable(context) if c is None else registers[c], context)
+                    elif opcode == _FOR_END:
+                        Register_VM._end_for_each(frame, a, context)
+                    elif opcode == _ACTIVATE:
+                        frame.activate(a, context)
+                    elif opcode == _DEACTIVATE:
+                        frame.deactivate()
+                    else:
+                        raise ValueError(f"Unknown opcode {opcode}")
+                if len(frames) == base_depth:
+                    return
+                # Return from a trampolined call to the calling frame.
+                assert frame.signature is not None and frame.return_register is not None
+                return_value = frame.signature.exit_call(context)
+                return_register = frame.return_register
+                frames.pop()
+                frame = frames[-1]
+                instructions = frame.program.instructions
+                registers = frame.registers
+                warning_marks = frame.warning_marks
+                instruction_count = len(instructions)
+                pc = frame.pc
+                registers[return_register] = return_value
+                warning_mark = warning_marks.pop()
+                if len(caught) > warning_mark:
+                    Register_VM._report_warnings(instructions[pc - 1][2], context, caught, warning_mark)
+        except Exception as e:
+            source = instructions[pc - 1][4]
+            if source is not None:
+                annotate_error(source, context, e)
+            for exited_frame in frames[base_depth - 1 :]:
+                while len(exited_frame.activations) > 0:  # Restore the loop-invariant expressions of loops exited by the error.
+                    exited_frame.deactivate()
+            raise
+
+    @staticmethod
+    def _setup_for_each(frame: Call_Frame, loop_slot: int, statement: For_Each_Statement, iterated_value: Any, context: Knit_Script_Context) -> None:
+        """Start executing a for-each loop.
+
+        Args:
+            frame (Call_Frame): The frame executing the loop.
+            loop_slot (int): The slot of the loop in the frame.
+            statement (For_Each_Statement): The for-each loop.
+            iterated_value (Any): The value of the loop's iterable expression. Values that are not iterable are iterated as a single value.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        iterable = iterated_value if isinstance(iterated_value, Iterable) else [iterated_value]
+        new_variable_names = {v.variable_name for v in statement._variables if v.variable_name not in context.variable_scope}
+        frame.loops[loop_slot] = For_Each_State(statement, iterable, new_variable_names)
+        frame.activate(statement._invariants, context)
+
+    @staticmethod
+    def _end_for_each(frame: Call_Frame, loop_slot: int, context: Knit_Script_Context) -> None:
+        """Finish executing a for-each loop whose iterations are exhausted.
+
+        Args:
+            frame (Call_Frame): The frame executing the loop.
+            loop_slot (int): The slot of the loop in the frame.
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        state = frame.loops[loop_slot]
+        assert state is not None
+        frame.loops[loop_slot] = None
+        if state.body_scope is not None:
+            context.exit_current_scope(collapse_into_parent=True)
+        frame.deactivate()
+        for new_variable_name in state.new_variable_names:
+            del context.variable_scope[new_variable_name]
@@ -0,0 +1,36 @@
+"""
+Knit Script Bytecode Package
+============================
+
+This package provides an alternative execution engine for knit script programs that compiles the statement and expression trees produced by the parser into linear bytecode.
+The bytecode is executed by a small register machine instead of by walking the tree, which avoids the error annotation and debugging wrappers of every executed element.
+
+The tree-walking interpreter remains the reference implementation. The register machine is only used when it is enabled on the context and no debugger is attached.
+
+Modules Overview
+----------------
+
+Bytecode_Compiler:
+    Opcode: Enumeration of the instructions of the register machine.
+    Bytecode_Program: The compiled instructions of a statement.
+    Bytecode_Compiler: Compiles statements and expressions into bytecode programs.
+
+Register_VM:
+    Call_Frame: The registers, loop states, and active loop invariants of one executing bytecode program.
+    Register_VM: Executes bytecode programs with a stack of call frames, so the depth of recursive knit script functions is bounded by memory rather than the Python stack.
+
+Compilation Overview
+--------------------
+
+Compiled Control Flow:
+    - Code blocks, with statements, branches, while loops, and for-each loops are compiled into jumps between the instructions of their bodies.
+    - Variable declarations, returns, and expression statements are compiled into register operations.
+
+Compiled Expressions:
+    - Literal values, variable lookups, needle sets, unary not, and binary operators (including short-circuiting 'and' and 'or').
+    - Function calls, which are trampolined: calls to knit script functions push a frame for the function's body onto the frame stack instead of recursing in Python.
+
+Fallbacks:
+    - Carriage passes and transfer passes execute their statements with dedicated opcodes.
+    - All other statements and expressions (e.g., method calls, imports, try-catch statements) are executed by the tree-walking interpreter.
+"""
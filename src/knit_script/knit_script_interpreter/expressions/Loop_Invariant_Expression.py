@@ -0,0 +1,102 @@
+"""Module containing the Loop_Invariant_Expression class.
+
+This module provides the Loop_Invariant_Expression class, which wraps an expression whose value cannot change while a loop executes.
+The wrapped expression is evaluated once per execution of the loop and its value is reused by every later iteration.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+
+
+class Loop_Invariant_Expression(Expression):
+    """An expression hoisted out of the iterations of a loop.
+
+    Each execution of the owning loop activates the expression with a new activation number.
+    The first evaluation in an activation evaluates the wrapped expression and later evaluations in the same activation reuse its value.
+    Loops restore the prior activation when they exit, so a loop re-entered recursively from its own body does not reuse values computed in the recursive execution.
+
+    Note:
+        Lists, dictionaries, and sets are copied before they are returned because the wrapped expression would otherwise build a new collection on every evaluation.
+
+    Attributes:
+        _expression (Expression): The loop-invariant expression.
+        _loop_activation (int | None): The activation of the current execution of the owning loop or None if the value is not cached (e.g., outside the loop or while debugging).
+        _value_activation (int | None): The activation in which the cached value was computed.
+        _value (Any): The cached value of the expression.
+    """
+
+    _activations: int = 0  # The number of activations of loop-invariant expressions. Used to number new activations.
+
+    def __init__(self, expression: Expression) -> None:
+        """Initialize the Loop_Invariant_Expression.
+
+        Args:
+            expression (Expression): The loop-invariant expression to wrap. The wrapper is located at the position of this expression.
+        """
+        super().__init__(expression.parser_node)
+        self._expression: Expression = expression
+        self._loop_activation: int | None = None
+        self._value_activation: int | None = None
+        self._value: Any = None
+
+    @property
+    def expression(self) -> Expression:
+        """
+        Returns:
+            Expression: The wrapped loop-invariant expression.
+        """
+        return self._expression
+
+    def activate(self, context: Knit_Script_Context) -> int | None:
+        """Start caching the value of the expression for a new execution of the owning loop.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter. Values are not cached while a debugger is attached.
+
+        Returns:
+            int | None: The prior activation, to be restored when the loop exits.
+        """
+        prior_activation = self._loop_activation
+        if context.debugger is None:
+            Loop_Invariant_Expression._activations += 1
+            self._loop_activation = Loop_Invariant_Expression._activations
+        else:
+            self._loop_activation = None
+        return prior_activation
+
+    def deactivate(self, prior_activation: int | None) -> None:
+        """Restore the activation that preceded the execution of the owning loop.
+
+        Args:
+            prior_activation (int | None): The activation returned by the matching call to activate.
+        """
+        self._loop_activation = prior_activation
+
+    def evaluate(self, context: Knit_Script_Context) -> Any:
+        """Evaluate the wrapped expression once per activation of the owning loop.
+
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The value of the wrapped expression.
+        """
+        activation = self._loop_activation
+        if activation is None:
+            return self._expression.evaluate(context)
+        if self._value_activation != activation:
+            self._value = self._expression.evaluate(context)
+            self._value_activation = activation
+        value = self._value
+        return copy.copy(value) if isinstance(value, (list, dict, set)) else value
+
+    def __str__(self) -> str:
+        return str(self._expression)
+
+    def __repr__(self) -> str:
+        return repr(self._expression)
@@ -5,6 +5,9 @@ It supports accessing attributes from both knit script objects and underlying Py
 and specialized handling for machine and sheet-specific needle collections.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
 from typing import Any
 
 from parglare.parser import LRStackNode
@@ -12,6 +15,7 @@ from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 from virtual_knitting_machine.machine_components.needles.Sheet_Identifier import Sheet_Identifier
 from virtual_knitting_machine.machine_components.needles.Sheet_Needle import Sheet_Needle
+from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier_Set import Yarn_Carrier_Set
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
@@ -19,6 +23,7 @@ from knit_script.knit_script_interpreter.expressions.function_expressions import
 from knit_script.knit_script_interpreter.expressions.needle_set_expression import Needle_Set_Expression, Needle_Sets
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.lazy_module import Lazy_Knit_Script_Module
 from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
 from knit_script.knit_script_interpreter.statements.function_dec_statement import Function_Signature
 
@@ -30,6 +35,11 @@ class Attribute_Accessor_Expression(Expression):
     It can access attributes from Python objects as well as specialized knit script objects like machines and sheet identifiers.
     The class supports chained attribute access and provides specialized handling for needle set expressions.
 
+    The kind of attribute access is fixed when the expression is parsed.
+    Needle set access keeps a monomorphic inline cache of the bound access method for the type of the last evaluated parent.
+    Method calls on knitscript modules keep an inline cache of the resolved function that is valid until the scope version of the function name changes.
+    Accessing an attribute of a lazily imported knitscript module executes the module if it has not been executed yet.
+
     Attributes:
         parent (list[Expression]): List of parent expressions in the access chain.
         attribute (Expression): The attribute being accessed from the parent.
@@ -56,6 +66,12 @@ class Attribute_Accessor_Expression(Expression):
             self.attribute = attribute
         if isinstance(self.attribute, Function_Call):
             self._is_method_call = True
+        self._parent_accessor: Attribute_Accessor_Expression | None = None
+        self._cached_parent_type: type | None = None
+        self._cached_needle_set_access: Callable[[Knit_Script_Context, Any], Any] | None = None
+        self._cached_module: Knit_Script_Scope | None = None
+        self._cached_method: Any = None
+        self._cached_version: int = -1
 
     @property
     def is_method_call(self) -> bool:
@@ -74,7 +90,16 @@ class Attribute_Accessor_Expression(Expression):
         if len(self.parent) == 1:
             return self.parent[0]
         else:
-            return Attribute_Accessor_Expression(self.parser_node, self.parent[:-1], self.parent[1])
+            return self._get_parent_accessor()
+
+    def _get_parent_accessor(self) -> Attribute_Accessor_Expression:
+        """
+        Returns:
+            Attribute_Accessor_Expression: The accessor for the parent path of a chain of accessors. The accessor is created once and reused for each evaluation.
+        """
+        if self._parent_accessor is None:
+            self._parent_accessor = Attribute_Accessor_Expression(self.parser_node, self.parent[:-1], self.parent[-1])
+        return self._parent_accessor
 
     def parent_path(self, require_var_names: bool = True) -> str:
         """
@@ -132,10 +157,52 @@ class Attribute_Accessor_Expression(Expression):
             parent_source: Expression = self.parent[0]
             parent = parent_source.evaluate(context)
         else:  # recursively process parent path
-            parent_accessor = Attribute_Accessor_Expression(self.parser_node, self.parent[:-1], self.parent[-1])
-            parent = parent_accessor.evaluate(context)
+            parent = self._get_parent_accessor().evaluate(context)
         return parent
 
+    def _needle_set_access(self, parent: Any) -> Callable[[Knit_Script_Context, Any], Any]:
+        """
+        Args:
+            parent (Any): The evaluated parent object to access a needle set from.
+
+        Returns:
+            Callable[[Knit_Script_Context, Any], Any]: The method used to access the needle set from parents of the given parent's type. Accessing the Last_Pass from a machine or sheet gives None.
+
+        Raises:
+            AttributeError: If the needle set cannot be accessed from the parent.
+        """
+        parent_type = type(parent)
+        if parent_type is not self._cached_parent_type or self._cached_needle_set_access is None:
+            assert isinstance(self.attribute, Needle_Set_Expression)
+            kp_set = self.attribute.kp_set
+            if kp_set is Needle_Sets.Last_Pass and isinstance(parent, (Knitting_Machine, Sheet_Identifier)):  # The last pass is not a needle set of machines or sheets.
+                self._cached_needle_set_access = lambda _context, _parent: None
+            elif isinstance(parent, Knitting_Machine):
+                machine_access = kp_set.machine_access()
+                self._cached_needle_set_access = lambda _context, machine: machine_access(machine)
+            elif isinstance(parent, Sheet_Identifier):
+                sheet_access = kp_set.sheet_access()
+                self._cached_needle_set_access = lambda context, sheet_identifier: sheet_access(context.gauged_sheet_record, sheet_identifier.sheet)
+            else:
+                raise AttributeError(f"Cannot access needle-set attribute {kp_set} from {self.parent} <{parent}>")
+            self._cached_parent_type = parent_type
+        return self._cached_needle_set_access
+
+    def _module_attribute(self, module: Knit_Script_Scope, attribute_name: str) -> Any:
+        """
+        Args:
+            module (Knit_Script_Scope): The knitscript module to access the attribute from.
+            attribute_name (str): The name of the attribute to access.
+
+        Returns:
+            Any: The value of the attribute in the module. Repeated access to the same module reuses the cached value until the scope version of the attribute name changes.
+        """
+        if module is not self._cached_module or self._cached_version != Knit_Script_Scope.scope_version(attribute_name):
+            self._cached_method = module[attribute_name]
+            self._cached_module = module
+            self._cached_version = Knit_Script_Scope.scope_version(attribute_name)
+        return self._cached_method
+
     def evaluate(self, context: Knit_Script_Context) -> Any:
         """Evaluate the expression to access the specified attribute.
 
@@ -149,66 +216,16 @@ class Attribute_Accessor_Expression(Expression):
             AttributeError: If the attribute cannot be accessed from the parent object.
         """
         parent = self._evaluate_parent(context)
+        if isinstance(parent, Lazy_Knit_Script_Module):
+            parent.load()
         if isinstance(self.attribute, Variable_Expression):  # variable name, access directly from parent instance
             attr = getattr(parent, self.attribute.variable_name)
             return attr.evaluate(context) if isinstance(attr, Expression) else attr
         elif isinstance(self.attribute, Needle_Set_Expression):  # get needle set from machine or sheet specification
-            kp_set = Needle_Sets[self.attribute.set_str]
-            if isinstance(parent, Knitting_Machine):
-                if kp_set is Needle_Sets.Front_Needles:
-                    return context.machine_state.front_needles()
-                elif kp_set is Needle_Sets.Back_Needles:
-                    return context.machine_state.back_needles()
-                elif kp_set is Needle_Sets.Front_Sliders:
-                    return context.machine_state.front_sliders()
-                elif kp_set is Needle_Sets.Back_Sliders:
-                    return context.machine_state.back_sliders()
-                elif kp_set is Needle_Sets.Front_Loops:
-                    return context.machine_state.front_loops()
-                elif kp_set is Needle_Sets.Back_Loops:
-                    return context.machine_state.back_loops()
-                elif kp_set is Needle_Sets.Needles:
-                    return context.machine_state.all_needles()
-                elif kp_set is Needle_Sets.Front_Slider_Loops:
-                    return context.machine_state.front_slider_loops()
-                elif kp_set is Needle_Sets.Back_Slider_Loops:
-                    return context.machine_state.back_slider_loops()
-                elif kp_set is Needle_Sets.Sliders:
-                    return context.machine_state.all_sliders()
-                elif kp_set is Needle_Sets.Loops:
-                    return context.machine_state.all_loops()
-                elif kp_set is Needle_Sets.Slider_Loops:
-                    return context.machine_state.all_slider_loops()
-            elif isinstance(parent, Sheet_Identifier):
-                if kp_set is Needle_Sets.Front_Needles:
-                    return context.gauged_sheet_record.front_needles(parent.sheet)
-                elif kp_set is Needle_Sets.Back_Needles:
-                    return context.gauged_sheet_record.back_needles(parent.sheet)
-                elif kp_set is Needle_Sets.Front_Sliders:
-                    return context.gauged_sheet_record.front_sliders(parent.sheet)
-                elif kp_set is Needle_Sets.Back_Sliders:
-                    return context.gauged_sheet_record.back_sliders(parent.sheet)
-                elif kp_set is Needle_Sets.Front_Loops:
-                    return context.gauged_sheet_record.front_loops(parent.sheet)
-                elif kp_set is Needle_Sets.Back_Loops:
-                    return context.gauged_sheet_record.back_loops(parent.sheet)
-                elif kp_set is Needle_Sets.Needles:
-                    return context.gauged_sheet_record.all_needles(parent.sheet)
-                elif kp_set is Needle_Sets.Front_Slider_Loops:
-                    return context.gauged_sheet_record.front_slider_loops(parent.sheet)
-                elif kp_set is Needle_Sets.Back_Slider_Loops:
-                    return context.gauged_sheet_record.back_slider_loops(parent.sheet)
-                elif kp_set is Needle_Sets.Sliders:
-                    return context.gauged_sheet_record.all_sliders(parent.sheet)
-                elif kp_set is Needle_Sets.Loops:
-                    return context.gauged_sheet_record.all_loops(parent.sheet)
-                elif kp_set is Needle_Sets.Slider_Loops:
-                    return context.gauged_sheet_record.all_slider_loops(parent.sheet)
-            else:
-                raise AttributeError(f"Cannot access needle-set attribute {kp_set} from {self.parent} <{parent}>")
+            return self._needle_set_access(parent)(context, parent)
         elif isinstance(self.attribute, Function_Call):
             method_name = self.attribute.func_name.variable_name
-            attribute = parent[method_name] if isinstance(parent, Knit_Script_Scope) else getattr(parent, method_name)
+            attribute = self._module_attribute(parent, method_name) if isinstance(parent, Knit_Script_Scope) else getattr(parent, method_name)
             if isinstance(attribute, Function_Signature):
                 return_value = attribute.execute(context, self.attribute.args, self.attribute.kwargs)
                 return return_value
@@ -221,11 +238,12 @@ class Attribute_Accessor_Expression(Expression):
             if isinstance(attribute, Needle):
                 if isinstance(parent, Knitting_Machine):
                     if isinstance(attribute, Sheet_Needle):  # assume actual position instead of sheet conversion
-                        return parent[Needle(attribute.is_front, attribute.sheet_pos)]
+                        return parent[context.get_needle(attribute.is_front, attribute.sheet_pos, global_needle=True)]
                     else:
                         return parent[attribute]
                 elif isinstance(parent, Sheet_Identifier):
-                    sheet_needle = parent.get_needle(attribute)
+                    sheet_pos = attribute.sheet_pos if isinstance(attribute, Sheet_Needle) else attribute.position
+                    sheet_needle = context.get_needle(attribute.is_front, sheet_pos, isinstance(attribute, Slider_Needle), sheet=parent.sheet, gauge=parent.gauge)
                     return context.machine_state[sheet_needle]
             elif isinstance(attribute, Yarn_Carrier_Set) and len(attribute) == 1:
                 return context.machine_state.carrier_system[attribute[0]]
@@ -19,8 +19,11 @@ class Carrier_Expression(Expression):
 
     This expression type is essential for yarn carrier operations in knit script programs, allowing developers to reference specific carriers by their conventional string identifiers.
 
+    The carrier id is parsed once when the expression is built.
+
     Attributes:
         _carrier_str (str): The original carrier string identifier from the source code.
+        _carrier_id (int): The id of the carrier parsed from the carrier string.
     """
 
     def __init__(self, parser_node: LRStackNode, carrier_str: str) -> None:
@@ -32,11 +35,12 @@ class Carrier_Expression(Expression):
         """
         super().__init__(parser_node)
         self._carrier_str: str = carrier_str
+        self._carrier_id: int = int(carrier_str[1:])
 
     def evaluate(self, context: Knit_Script_Context) -> Yarn_Carrier:
         """Evaluate the expression to get the corresponding yarn carrier.
 
-        Parses the carrier string to extract the carrier ID number and retrieves the corresponding Yarn_Carrier object from the knitting machine's carrier system.
+        Retrieves the Yarn_Carrier object with the parsed carrier ID from the knitting machine's carrier system.
 
         Args:
             context (Knit_Script_Context): The current context of the knit_script_interpreter.
@@ -45,8 +49,6 @@ class Carrier_Expression(Expression):
             Yarn_Carrier: The carrier object with the specified ID from the machine's carrier system.
 
         Raises:
-            ValueError: If the carrier string format is invalid or cannot be parsed.
             KeyError: If the extracted carrier ID does not exist in the machine's carrier system.
         """
-        carrier = Yarn_Carrier(int(self._carrier_str[1:]))
-        return context.machine_state[carrier]
+        return context.get_carrier(self._carrier_id)
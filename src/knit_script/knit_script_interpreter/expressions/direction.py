@@ -34,6 +34,14 @@ class Pass_Direction_Expression(Expression):
         super().__init__(parser_node)
         self._dir_word: str = dir_word
 
+    @property
+    def direction_word(self) -> str:
+        """
+        Returns:
+            str: The direction keyword from the source code.
+        """
+        return self._dir_word
+
     def evaluate(self, context: Knit_Script_Context) -> Carriage_Pass_Direction:
         """Evaluate the expression to get the corresponding carriage pass direction.
 
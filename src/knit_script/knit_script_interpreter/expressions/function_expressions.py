@@ -25,13 +25,16 @@ class Function_Call(Expression):
     This class provides the bridge between knit script function call syntax and the underlying function execution mechanisms,
     whether they are knit script functions with their own scopes or Python functions integrated into the knit script environment.
 
+    Calls with side-effect free arguments keep an inline cache of the last knit script function they called and the inlined expression of that call.
+    While the same function is called and no debugger is attached, the call evaluates the inlined expression instead of executing the function in a new scope.
+
     Attributes:
         kwargs (list[Assignment]): The list of assignments used to set keyword arguments.
         args (list[Expression]): The list of expressions to fill in positional arguments.
         func_name (Variable_Expression): The name of the function to call.
     """
 
-    def __init__(self, parser_node: LRStackNode, func_name: Variable_Expression, args: list[Expression], kwargs: list[Assignment]) -> None:
+    def __init__(self, parser_node: LRStackNode, func_name: Variable_Expression, args: list[Expression], kwargs: list[Assignment], inlinable_arguments: bool = False) -> None:
         """Initialize the Function_Call.
 
         Args:
@@ -39,11 +42,46 @@ class Function_Call(Expression):
             func_name (Variable_Expression): Name of the function to call.
             args (list[Expression]): The list of argument expressions to evaluate and pass as positional parameters.
             kwargs (list[Assignment]): The list of assignments to evaluate and pass as keyword parameters.
+            inlinable_arguments (bool, optional): If True, evaluating the arguments has no side effects and the call may be inlined. Defaults to False.
         """
         super().__init__(parser_node)
         self.kwargs: list[Assignment] = kwargs
         self.args: list[Expression] = args
         self.func_name: Variable_Expression = func_name
+        self._inlinable_arguments: bool = inlinable_arguments
+        self._inlined_signature: Function_Signature | None = None
+        self._inlined_expression: Expression | None = None
+
+    def _inlined_call(self, function_signature: Function_Signature) -> Expression | None:
+        """
+        Args:
+            function_signature (Function_Signature): The knit script function called.
+
+        Returns:
+            Expression | None: The inlined expression of this call to the given function or None if the call cannot be inlined. The expression is created once and reused while the same function is called.
+        """
+        if function_signature is not self._inlined_signature:
+            self._inlined_expression = function_signature.inline_call(self, self.args, self.kwargs)
+            self._inlined_signature = function_signature
+        return self._inlined_expression
+
+    def trampolined_signature(self, context: Knit_Script_Context) -> Function_Signature | None:
+        """
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Function_Signature | None:
+                The called knit script function if the call can be executed by entering the call, executing the function's body, and exiting the call
+                 (i.e., it is not memoized or inlined), or None if the call must be evaluated.
+        """
+        if self.func_name.variable_name not in context.variable_scope:
+            return None
+        function_signature = context.variable_scope[self.func_name.variable_name]
+        if not isinstance(function_signature, Function_Signature) or not function_signature.trampolined:
+            return None
+        inlined = self._inlinable_arguments and context.debugger is None and self._inlined_call(function_signature) is not None
+        return None if inlined else function_signature
 
     def evaluate(self, context: Knit_Script_Context) -> Any:
         """Find function in scope, fill parameters and then execute.
@@ -63,6 +101,10 @@ class Function_Call(Expression):
         if self.func_name.variable_name in context.variable_scope:
             function_signature = context.variable_scope[self.func_name.variable_name]
             if isinstance(function_signature, Function_Signature):
+                if self._inlinable_arguments and context.debugger is None:
+                    inlined_expression = self._inlined_call(function_signature)
+                    if inlined_expression is not None:
+                        return inlined_expression.evaluate(context)
                 return function_signature.execute(context, self.args, self.kwargs)
             else:
                 args = [arg.evaluate(context) for arg in self.args]
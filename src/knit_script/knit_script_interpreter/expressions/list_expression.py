@@ -12,6 +12,7 @@ from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.values import is_constant
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
 
@@ -53,9 +54,12 @@ class Knit_Script_List(Expression):
 
     The Knit_Script_List class implements list literal expressions in knit script programs.
     It supports mixed-type elements and handles unpacking operations within list construction, following Python's list syntax and behavior.
+    Lists of only constant values are evaluated once and each later evaluation returns a new copy of those values.
 
     Attributes:
         expressions (list[Expression]): The expressions to evaluate and include in the list.
+        _is_constant (bool): True if all expressions in the list are constant values.
+        _constant_values (tuple[Any, ...] | None): The values of a constant list after its first evaluation.
     """
 
     def __init__(self, parser_node: LRStackNode, expressions: list[Expression]) -> None:
@@ -67,6 +71,8 @@ class Knit_Script_List(Expression):
         """
         super().__init__(parser_node)
         self.expressions: list[Expression] = expressions
+        self._is_constant: bool = all(is_constant(exp) for exp in expressions)
+        self._constant_values: tuple[Any, ...] | None = None
 
     def evaluate(self, context: Knit_Script_Context) -> list[Any]:
         """Evaluate the expression to create a list.
@@ -79,6 +85,10 @@ class Knit_Script_List(Expression):
         Returns:
             list[Any]: List of expression evaluations at current context, with unpacked elements properly expanded.
         """
+        if self._is_constant:
+            if self._constant_values is None:
+                self._constant_values = tuple(exp.evaluate(context) for exp in self.expressions)
+            return list(self._constant_values)
         values: list[Any] = []
         for exp in self.expressions:
             if isinstance(exp, Unpack):
@@ -228,6 +238,22 @@ class Comprehension(Expression):
         self._variables: list[Variable_Expression] = variables
         self._var_name: str | None = self._variables[0].variable_name if len(self._variables) == 1 else None
 
+    @property
+    def variables(self) -> list[Variable_Expression]:
+        """
+        Returns:
+            list[Variable_Expression]: The variables assigned on each iteration of the comprehension.
+        """
+        return self._variables
+
+    @property
+    def iter_expression(self) -> Expression:
+        """
+        Returns:
+            Expression: The expression that evaluates to the iterable of the comprehension.
+        """
+        return self._iter_exp
+
     def _get_iterable(self, context: Knit_Script_Context) -> Iterable[Any]:
         iter_val = self._iter_exp.evaluate(context)
         return iter_val if isinstance(iter_val, Iterable) else [iter_val]
@@ -254,7 +280,10 @@ class Comprehension(Expression):
             if var_expression.variable_name not in context.variable_scope:
                 new_var_names.add(var_expression.variable_name)
         values = []
+        execution_limits = context.execution_limits
         for var in iterable:
+            if execution_limits is not None:  # Iterations are charged so that long-running comprehensions can be cancelled.
+                execution_limits.charge_step()
             if self._var_name is not None:
                 context.variable_scope[self._var_name] = var  # update iterator variable in scope
             else:  # multiple vars to unpack
@@ -24,8 +24,13 @@ class Needle_Expression(Expression):
 
     Examples: "f5" (front needle 5), "bs3" (back slider needle 3), "f10" (front needle 10)
 
+    The needle string is parsed once when the expression is built.
+
     Attributes:
         _needle_str (str): The original needle string identifier from the source code.
+        _is_front (bool): True if the needle is on the front bed.
+        _is_slider (bool): True if the needle is a slider needle.
+        _position (int): The position of the needle in the current sheet.
     """
 
     def __init__(self, parser_node: LRStackNode, needle_str: str) -> None:
@@ -37,12 +42,17 @@ class Needle_Expression(Expression):
         """
         super().__init__(parser_node)
         self._needle_str: str = needle_str
+        self._is_front: bool = "f" in needle_str
+        self._is_slider: bool = "s" in needle_str
+        num_str = needle_str[1:]  # cut bed off
+        if self._is_slider:
+            num_str = num_str[1:]  # cut slider off
+        self._position: int = int(num_str)
 
     def evaluate(self, context: Knit_Script_Context) -> Needle:
         """Evaluate the expression to create a needle object.
 
-        Parses the needle string identifier to extract bed position, slider status, and needle position,
-         then creates the appropriate Needle object using the current gauging configuration from the context.
+        Gets the Needle object at the parsed bed position, slider status, and needle position using the current gauging configuration from the context.
 
         Args:
             context (Knit_Script_Context): The current context of the knit_script_interpreter.
@@ -53,10 +63,4 @@ class Needle_Expression(Expression):
         Note:
             The needle type (regular or sheet needle) depends on the current gauge setting in the context. The position is interpreted relative to the current sheet and gauge configuration.
         """
-        is_front = "f" in self._needle_str
-        slider = "s" in self._needle_str
-        num_str = self._needle_str[1:]  # cut bed off
-        if slider:
-            num_str = num_str[1:]  # cut slider off
-        pos = int(num_str)
-        return context.get_needle(is_front, pos, slider)
+        return context.get_needle(self._is_front, self._position, self._is_slider)
@@ -6,14 +6,18 @@ It includes the Needle_Sets enumeration that defines available needle collection
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import Enum
+from typing import Any
 
 from parglare.parser import LRStackNode
+from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Gauged_Sheet_Record import Gauged_Sheet_Record
 
 
 class Needle_Sets(Enum):
@@ -40,6 +44,57 @@ class Needle_Sets(Enum):
     Front_Slider_Loops = "Front_Slider_Loops"
     Back_Slider_Loops = "Back_Slider_Loops"
 
+    def machine_access(self) -> Callable[[Knitting_Machine], list[Any]]:
+        """
+        Returns:
+            Callable[[Knitting_Machine], list[Any]]: The knitting machine method that collects this set of needles.
+
+        Raises:
+            KeyError: If this needle set cannot be collected from a knitting machine (i.e., Last_Pass).
+        """
+        return _MACHINE_NEEDLE_SETS[self]
+
+    def sheet_access(self) -> Callable[[Gauged_Sheet_Record, int], list[Any]]:
+        """
+        Returns:
+            Callable[[Gauged_Sheet_Record, int], list[Any]]: The gauged sheet record method that collects this set of needles from a given sheet.
+
+        Raises:
+            KeyError: If this needle set cannot be collected from a sheet (i.e., Last_Pass).
+        """
+        return _SHEET_NEEDLE_SETS[self]
+
+
+_MACHINE_NEEDLE_SETS: dict[Needle_Sets, Callable[[Knitting_Machine], list[Any]]] = {
+    Needle_Sets.Needles: Knitting_Machine.all_needles,
+    Needle_Sets.Front_Needles: Knitting_Machine.front_needles,
+    Needle_Sets.Back_Needles: Knitting_Machine.back_needles,
+    Needle_Sets.Sliders: Knitting_Machine.all_sliders,
+    Needle_Sets.Front_Sliders: Knitting_Machine.front_sliders,
+    Needle_Sets.Back_Sliders: Knitting_Machine.back_sliders,
+    Needle_Sets.Loops: Knitting_Machine.all_loops,
+    Needle_Sets.Front_Loops: Knitting_Machine.front_loops,
+    Needle_Sets.Back_Loops: Knitting_Machine.back_loops,
+    Needle_Sets.Slider_Loops: Knitting_Machine.all_slider_loops,
+    Needle_Sets.Front_Slider_Loops: Knitting_Machine.front_slider_loops,
+    Needle_Sets.Back_Slider_Loops: Knitting_Machine.back_slider_loops,
+}
+
+_SHEET_NEEDLE_SETS: dict[Needle_Sets, Callable[[Gauged_Sheet_Record, int], list[Any]]] = {
+    Needle_Sets.Needles: Gauged_Sheet_Record.all_needles,
+    Needle_Sets.Front_Needles: Gauged_Sheet_Record.front_needles,
+    Needle_Sets.Back_Needles: Gauged_Sheet_Record.back_needles,
+    Needle_Sets.Sliders: Gauged_Sheet_Record.all_sliders,
+    Needle_Sets.Front_Sliders: Gauged_Sheet_Record.front_sliders,
+    Needle_Sets.Back_Sliders: Gauged_Sheet_Record.back_sliders,
+    Needle_Sets.Loops: Gauged_Sheet_Record.all_loops,
+    Needle_Sets.Front_Loops: Gauged_Sheet_Record.front_loops,
+    Needle_Sets.Back_Loops: Gauged_Sheet_Record.back_loops,
+    Needle_Sets.Slider_Loops: Gauged_Sheet_Record.all_slider_loops,
+    Needle_Sets.Front_Slider_Loops: Gauged_Sheet_Record.front_slider_loops,
+    Needle_Sets.Back_Slider_Loops: Gauged_Sheet_Record.back_slider_loops,
+}
+
 
 class Needle_Set_Expression(Expression):
     """Evaluates keywords to sets of needles on the machine.
@@ -49,9 +104,12 @@ class Needle_Set_Expression(Expression):
 
     This expression type allows knit scripts to easily reference common needle collections without having to manually specify individual needles or ranges.
     The collections respect the current sheet and gauge settings, returning needles appropriate for the current knitting context.
+    The method used to collect the needle set is resolved once when the expression is parsed.
 
     Attributes:
         _set_str (str): The string identifier for the needle set to retrieve.
+        _kp_set (Needle_Sets): The needle set to retrieve.
+        _sheet_access (Callable[[Gauged_Sheet_Record, int], list[Any]] | None): The gauged sheet record method that collects the needle set or None if the set is the Last_Pass.
     """
 
     def __init__(self, parser_node: LRStackNode, set_str: str) -> None:
@@ -63,6 +121,8 @@ class Needle_Set_Expression(Expression):
         """
         super().__init__(parser_node)
         self._set_str: str = set_str
+        self._kp_set: Needle_Sets = Needle_Sets[set_str]
+        self._sheet_access: Callable[[Gauged_Sheet_Record, int], list[Any]] | None = None if self._kp_set is Needle_Sets.Last_Pass else self._kp_set.sheet_access()
 
     @property
     def set_str(self) -> str:
@@ -73,6 +133,14 @@ class Needle_Set_Expression(Expression):
         """
         return self._set_str
 
+    @property
+    def kp_set(self) -> Needle_Sets:
+        """
+        Returns:
+            Needle_Sets: The set of needles to collect.
+        """
+        return self._kp_set
+
     def evaluate(self, context: Knit_Script_Context) -> list[Needle] | dict[Needle, Needle | None] | list[Slider_Needle]:
         """Evaluate the expression to get the specified needle set.
 
@@ -90,30 +158,6 @@ class Needle_Set_Expression(Expression):
             All needle sets except Last_Pass return lists of needles.
             Last_Pass may return a dictionary mapping source needles to destination needles for transfer operations, or a simple list for other operations.
         """
-        kp_set = Needle_Sets[self._set_str]
-        if kp_set is Needle_Sets.Front_Needles:
-            return context.gauged_sheet_record.front_needles(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Back_Needles:
-            return context.gauged_sheet_record.back_needles(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Front_Sliders:
-            return context.gauged_sheet_record.front_sliders(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Back_Sliders:
-            return context.gauged_sheet_record.back_sliders(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Front_Loops:
-            return context.gauged_sheet_record.front_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Back_Loops:
-            return context.gauged_sheet_record.back_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Needles:
-            return context.gauged_sheet_record.all_needles(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Front_Slider_Loops:
-            return context.gauged_sheet_record.front_slider_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Back_Slider_Loops:
-            return context.gauged_sheet_record.back_slider_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Sliders:
-            return context.gauged_sheet_record.all_sliders(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Loops:
-            return context.gauged_sheet_record.all_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Slider_Loops:
-            return context.gauged_sheet_record.all_slider_loops(context.sheet.sheet)
-        elif kp_set is Needle_Sets.Last_Pass:
+        if self._sheet_access is None:
             return context.last_carriage_pass_result
+        return self._sheet_access(context.gauged_sheet_record, context.sheet.sheet)
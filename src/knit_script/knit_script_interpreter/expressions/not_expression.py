@@ -32,6 +32,14 @@ class Not_Expression(Expression):
         super().__init__(parser_node)
         self._negated_expression: Expression = negated_expression
 
+    @property
+    def negated_expression(self) -> Expression:
+        """
+        Returns:
+            Expression: The expression to logically negate.
+        """
+        return self._negated_expression
+
     def evaluate(self, context: Knit_Script_Context) -> bool:
         """Evaluate the expression to get the logical negation result.
 
@@ -6,6 +6,8 @@ It includes the Operator enumeration that defines available operators and their
 
 from __future__ import annotations
 
+import operator
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
@@ -68,38 +70,35 @@ class Operator(Enum):
         Note:
             Arithmetic operators return numeric results, comparison operators return booleans, logical operators follow Python's short-circuit evaluation, and membership operators return booleans.
         """
-        if self is Operator.Add:
-            return lhs + rhs
-        elif self is Operator.Sub:
-            return lhs - rhs
-        elif self is Operator.Div:
-            return lhs / rhs
-        elif self is Operator.Mod:
-            return lhs % rhs
-        elif self is Operator.Mul:
-            return lhs * rhs
-        elif self is Operator.Exp:
-            return lhs**rhs
-        elif self is Operator.LT:
-            return lhs < rhs
-        elif self is Operator.LTE:
-            return lhs <= rhs
-        elif self is Operator.GT:
-            return lhs > rhs
-        elif self is Operator.GTE:
-            return lhs >= rhs
-        elif self is Operator.Equal:
-            return lhs == rhs
-        elif self is Operator.NE:
-            return lhs != rhs
-        elif self is Operator.Is:
-            return lhs is rhs
-        elif self is Operator.In:
-            return lhs in rhs
-        elif self is Operator.And:
-            return lhs and rhs
-        elif self is Operator.Or:
-            return lhs or rhs
+        return _OPERATIONS[self](lhs, rhs)
+
+    @property
+    def operation(self) -> Callable[[Any, Any], Any]:
+        """
+        Returns:
+            Callable[[Any, Any], Any]: The function that applies this operator to a left and right operand.
+        """
+        return _OPERATIONS[self]
+
+
+_OPERATIONS: dict[Operator, Callable[[Any, Any], Any]] = {
+    Operator.Add: operator.add,
+    Operator.Sub: operator.sub,
+    Operator.Div: operator.truediv,
+    Operator.Mod: operator.mod,
+    Operator.Mul: operator.mul,
+    Operator.Exp: operator.pow,
+    Operator.LT: operator.lt,
+    Operator.LTE: operator.le,
+    Operator.GT: operator.gt,
+    Operator.GTE: operator.ge,
+    Operator.Equal: operator.eq,
+    Operator.NE: operator.ne,
+    Operator.Is: operator.is_,
+    Operator.In: lambda lhs, rhs: lhs in rhs,
+    Operator.And: lambda lhs, rhs: lhs and rhs,
+    Operator.Or: lambda lhs, rhs: lhs or rhs,
+}
 
 
 class Operator_Expression(Expression):
@@ -109,11 +108,15 @@ class Operator_Expression(Expression):
     It takes two operand expressions and an operator, evaluates the operands in the current context, and applies the specified operation to produce a result.
 
     This expression type is fundamental to knit script programs, enabling arithmetic calculations, logical operations, comparisons, and other binary operations between any types of expressions.
+    The operator is resolved to its operation when the expression is parsed.
+    The 'and' and 'or' operators short-circuit and only evaluate the right-hand side when it determines the result.
 
     Attributes:
         _lhs (Expression): The left-hand side expression operand.
         op_str (str): The string representation of the operator.
         _rhs (Expression): The right-hand side expression operand.
+        _op (Operator): The operator applied to the operands.
+        _operation (Callable[[Any, Any], Any]): The function that applies the operator to the evaluated operands.
     """
 
     def __init__(self, parser_node: LRStackNode, lhs: Expression, op_str: str, rhs: Expression) -> None:
@@ -129,11 +132,43 @@ class Operator_Expression(Expression):
         self._rhs: Expression = rhs
         self.op_str: str = op_str
         self._lhs: Expression = lhs
+        self._op: Operator = Operator.get_op(op_str)
+        self._operation: Callable[[Any, Any], Any] = self._op.operation
+        if self._op is Operator.And:
+            self._evaluate_operation: Callable[[Knit_Script_Context], Any] = self._evaluate_and
+        elif self._op is Operator.Or:
+            self._evaluate_operation = self._evaluate_or
+        else:
+            self._evaluate_operation = self._evaluate_binary_operation
+
+    @property
+    def lhs(self) -> Expression:
+        """
+        Returns:
+            Expression: The left-hand side expression operand.
+        """
+        return self._lhs
+
+    @property
+    def rhs(self) -> Expression:
+        """
+        Returns:
+            Expression: The right-hand side expression operand.
+        """
+        return self._rhs
+
+    @property
+    def op(self) -> Operator:
+        """
+        Returns:
+            Operator: The operator applied to the operands.
+        """
+        return self._op
 
     def evaluate(self, context: Knit_Script_Context) -> Any:
         """Evaluate the expression to perform the binary operation.
 
-        Evaluates both operand expressions in the current context, retrieves the corresponding operator, and applies the operation to the evaluated operands.
+        Evaluates the operand expressions in the current context and applies the operation to the evaluated operands.
 
         Args:
             context (Knit_Script_Context): The current context of the knit_script_interpreter.
@@ -141,7 +176,34 @@ class Operator_Expression(Expression):
         Returns:
             Any: The result of applying the operator to the evaluated operands, with type depending on the operator and operand types.
         """
-        first_num = self._lhs.evaluate(context)
-        op = Operator.get_op(self.op_str)
-        second_num = self._rhs.evaluate(context)
-        return op.operate(first_num, second_num)
+        return self._evaluate_operation(context)
+
+    def _evaluate_binary_operation(self, context: Knit_Script_Context) -> Any:
+        """
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The result of applying the operation to both evaluated operands.
+        """
+        return self._operation(self._lhs.evaluate(context), self._rhs.evaluate(context))
+
+    def _evaluate_and(self, context: Knit_Script_Context) -> Any:
+        """
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The left-hand side value if it is falsy, otherwise the right-hand side value. The right-hand side is only evaluated if the left-hand side is truthy.
+        """
+        return self._lhs.evaluate(context) and self._rhs.evaluate(context)
+
+    def _evaluate_or(self, context: Knit_Script_Context) -> Any:
+        """
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The left-hand side value if it is truthy, otherwise the right-hand side value. The right-hand side is only evaluated if the left-hand side is falsy.
+        """
+        return self._lhs.evaluate(context) or self._rhs.evaluate(context)
@@ -27,6 +27,11 @@ class _Context_Free_Value(Expression):
     These expressions have fixed values that don't depend on variable state, machine configuration, or other runtime information.
 
     This base class provides a common interface for context-free evaluation and standardizes the string representation behavior for all literal value expressions.
+    The value is computed on the first evaluation and reused by all later evaluations.
+
+    Attributes:
+        _cached_value (Any): The value computed by the first evaluation of this expression.
+        _value_is_cached (bool): True if the value of this expression has been computed.
     """
 
     def __init__(self, parser_node: LRStackNode):
@@ -36,6 +41,8 @@ class _Context_Free_Value(Expression):
             parser_node (LRStackNode): The parser node from the parse tree.
         """
         super().__init__(parser_node)
+        self._cached_value: Any = None
+        self._value_is_cached: bool = False
 
     def evaluate(self, context: Knit_Script_Context) -> Any:
         """Evaluate the expression using context-free evaluation.
@@ -46,7 +53,10 @@ class _Context_Free_Value(Expression):
         Returns:
             Any: The constant value represented by this expression.
         """
-        return self.context_free_evaluation()
+        if not self._value_is_cached:
+            self._cached_value = self.context_free_evaluation()
+            self._value_is_cached = True
+        return self._cached_value
 
     def context_free_evaluation(self) -> Any:
         """Get the evaluated value without requiring execution context.
@@ -59,6 +69,62 @@ class _Context_Free_Value(Expression):
         pass
 
 
+def is_constant(expression: Expression) -> bool:
+    """
+    Args:
+        expression (Expression): The expression to check.
+
+    Returns:
+        bool: True if the expression evaluates to a constant value that does not depend on the context, False otherwise.
+    """
+    return isinstance(expression, _Context_Free_Value)
+
+
+def constant_value(expression: Expression) -> Any:
+    """
+    Args:
+        expression (Expression): The constant expression to evaluate.
+
+    Returns:
+        Any: The value of the constant expression.
+
+    Raises:
+        TypeError: If the expression is not constant.
+    """
+    if not isinstance(expression, _Context_Free_Value):
+        raise TypeError(f"Cannot evaluate {expression} without a context")
+    return expression.context_free_evaluation()
+
+
+class Constant_Value(_Context_Free_Value):
+    """Precomputed value of an expression that only depends on constant values.
+
+    The Constant_Value class replaces constant subexpressions (e.g., arithmetic between literals) when a program is parsed.
+    It keeps the parser node of the expression it replaces so that the source location of errors and the string representation of the expression are unchanged.
+
+    Attributes:
+        _value (Any): The precomputed value of the replaced expression.
+    """
+
+    def __init__(self, parser_node: LRStackNode, value: Any) -> None:
+        """Initialize the Constant_Value expression.
+
+        Args:
+            parser_node (LRStackNode): The parser node of the replaced expression.
+            value (Any): The precomputed value of the replaced expression.
+        """
+        super().__init__(parser_node)
+        self._value: Any = value
+
+    def context_free_evaluation(self) -> Any:
+        """Get the precomputed value.
+
+        Returns:
+            Any: The precomputed value of the replaced expression.
+        """
+        return self._value
+
+
 class None_Value(_Context_Free_Value):
     """Used to represent None values.
 
@@ -10,6 +10,8 @@ from parglare.parser import LRStackNode
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.scope.variable_space import Variable_Space
 
 
 class Variable_Expression(Expression):
@@ -22,10 +24,19 @@ class Variable_Expression(Expression):
     This expression type is fundamental to knit script programs, enabling access to all types of variables including user-defined variables,
     function parameters, machine state variables, and built-in constants.
 
+    Each variable expression keeps a monomorphic inline cache of its last resolution.
+    Machine scope and python scope variables never change where they resolve, so they are classified once.
+    Local and global variables cache the variable space that holds them, which is valid until the scope version of the variable name changes.
+
     Attributes:
         _variable_name (str): The name of the variable to access from the current scope.
     """
 
+    _UNRESOLVED: int = 0
+    _MACHINE_VARIABLE: int = 1
+    _PYTHON_VARIABLE: int = 2
+    _SCOPED_VARIABLE: int = 3
+
     def __init__(self, parser_node: LRStackNode, variable_name: str) -> None:
         """Initialize the Variable_Expression.
 
@@ -35,6 +46,11 @@ class Variable_Expression(Expression):
         """
         super().__init__(parser_node)
         self._variable_name: str = variable_name
+        self._resolution_kind: int = Variable_Expression._UNRESOLVED
+        self._python_value: Any = None
+        self._cached_space: Variable_Space | None = None
+        self._cached_version: int = -1
+        self._cached_context: Knit_Script_Context | None = None
 
     @property
     def variable_name(self) -> str:
@@ -50,6 +66,47 @@ class Variable_Expression(Expression):
 
         Performs variable lookup in the current execution context using the scope resolution system.
          This follows the knit script scoping hierarchy, searching through local scopes, parent scopes, module scopes, and global scopes to find the variable.
+         Lookups that hit the inline cache skip the scope walk.
+
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The value of the variable found in the lowest applicable scope level.
+        """
+        if self._resolution_kind == Variable_Expression._SCOPED_VARIABLE:
+            if self._cached_version == Knit_Script_Scope.scope_version(self._variable_name) and self._cached_context is context:
+                assert self._cached_space is not None
+                return self._cached_space[self._variable_name]
+        elif self._resolution_kind == Variable_Expression._MACHINE_VARIABLE:
+            return context.variable_scope.machine_scope[self._variable_name]
+        elif self._resolution_kind == Variable_Expression._PYTHON_VARIABLE:
+            return self._python_value
+        return self._resolve(context)
+
+    def lookup(self, context: Knit_Script_Context) -> Any:
+        """Get the value of the variable without the error annotation of evaluate when the lookup hits the inline cache.
+
+        Lookups that miss the cache are evaluated, so that the errors and warnings of the full lookup are associated with this expression.
+
+        Args:
+            context (Knit_Script_Context): The current context of the knit_script_interpreter.
+
+        Returns:
+            Any: The value of the variable found in the lowest applicable scope level.
+        """
+        if self._resolution_kind == Variable_Expression._SCOPED_VARIABLE:
+            if self._cached_version == Knit_Script_Scope.scope_version(self._variable_name) and self._cached_context is context:
+                assert self._cached_space is not None
+                return self._cached_space[self._variable_name]
+        elif self._resolution_kind == Variable_Expression._MACHINE_VARIABLE:
+            return context.variable_scope.machine_scope[self._variable_name]
+        elif self._resolution_kind == Variable_Expression._PYTHON_VARIABLE:
+            return self._python_value
+        return self.evaluate(context)
+
+    def _resolve(self, context: Knit_Script_Context) -> Any:
+        """Perform a full lookup of the variable and update the inline cache with the resolution.
 
         Args:
             context (Knit_Script_Context): The current context of the knit_script_interpreter.
@@ -57,4 +114,21 @@ class Variable_Expression(Expression):
         Returns:
             Any: The value of the variable found in the lowest applicable scope level.
         """
-        return context.variable_scope[self.variable_name]
+        scope = context.variable_scope
+        if self._variable_name in scope.machine_scope:
+            self._resolution_kind = Variable_Expression._MACHINE_VARIABLE
+            return scope.machine_scope[self._variable_name]
+        python_value, in_python_scope = Knit_Script_Scope.get_value_from_python_scope(self._variable_name)
+        if in_python_scope:
+            self._resolution_kind = Variable_Expression._PYTHON_VARIABLE
+            self._python_value = python_value
+            return python_value
+        value = scope[self._variable_name]  # Full lookup raises errors and warnings.
+        self._cached_space = scope.resolved_variable_space(self._variable_name)
+        if self._cached_space is None:  # Lookup cannot be cached.
+            self._resolution_kind = Variable_Expression._UNRESOLVED
+        else:
+            self._resolution_kind = Variable_Expression._SCOPED_VARIABLE
+            self._cached_version = Knit_Script_Scope.scope_version(self._variable_name)
+            self._cached_context = context
+        return value
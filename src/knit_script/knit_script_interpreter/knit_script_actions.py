@@ -35,6 +35,7 @@ from knit_script.knit_script_interpreter.expressions.operator_expressions import
 from knit_script.knit_script_interpreter.expressions.values import (
     Bed_Value,
     Boolean_Value,
+    Constant_Value,
     Float_Value,
     Header_ID_Value,
     Int_Value,
@@ -42,6 +43,8 @@ from knit_script.knit_script_interpreter.expressions.values import (
     Machine_Type_Value,
     None_Value,
     String_Value,
+    constant_value,
+    is_constant,
 )
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.expressions.xfer_pass_racking import Xfer_Pass_Racking
@@ -56,9 +59,12 @@ from knit_script.knit_script_interpreter.statements.control_loop_statements impo
 from knit_script.knit_script_interpreter.statements.Drop_Pass import Drop_Pass
 from knit_script.knit_script_interpreter.statements.express_statement import Expression_Statement
 from knit_script.knit_script_interpreter.statements.function_dec_statement import Function_Declaration
+from knit_script.knit_script_interpreter.statements.Function_Inliner import Function_Inliner
+from knit_script.knit_script_interpreter.statements.Function_Purity import Function_Purity
 from knit_script.knit_script_interpreter.statements.Import_Statement import Import_Statement
 from knit_script.knit_script_interpreter.statements.in_direction_statement import In_Direction_Statement
 from knit_script.knit_script_interpreter.statements.instruction_statements import Pause_Statement
+from knit_script.knit_script_interpreter.statements.Loop_Invariants import Loop_Invariants
 from knit_script.knit_script_interpreter.statements.Print import Print
 from knit_script.knit_script_interpreter.statements.Push_Statement import Push_Statement
 from knit_script.knit_script_interpreter.statements.return_statement import Return_Statement
@@ -120,6 +126,26 @@ def _in_enum(item: str | Enum, enumeration: Iterable) -> bool:
         return False
 
 
+def _fold_constants(exp: Expression) -> Expression:
+    """Replace an operation on constant values with its precomputed value.
+
+    Args:
+        exp (Expression): The expression to fold.
+
+    Returns:
+        Expression: A constant value expression with the parser node of the given expression if all of its operands are constant, otherwise the given expression.
+        Operations that raise an error are not folded so that the error is raised when the program is executed.
+    """
+    try:
+        if isinstance(exp, Operator_Expression) and is_constant(exp.lhs) and is_constant(exp.rhs):
+            return Constant_Value(exp.parser_node, exp.op.operate(constant_value(exp.lhs), constant_value(exp.rhs)))
+        elif isinstance(exp, Not_Expression) and is_constant(exp.negated_expression):
+            return Constant_Value(exp.parser_node, not constant_value(exp.negated_expression))
+    except Exception:
+        return exp
+    return exp
+
+
 # basic expressions and statements
 @typed_action
 def identifier(parser_node: LRStackNode, node: str) -> Expression:
@@ -364,7 +390,7 @@ def f_string_section(parser_node: LRStackNode, __: list, exp: Expression | None
 
 
 @typed_action
-def formatted_string(parser_node: LRStackNode, __: list, sections: list[Expression]) -> Formatted_String_Value:
+def formatted_string(parser_node: LRStackNode, __: list, sections: list[Expression]) -> Formatted_String_Value | Constant_Value:
     """Create a formatted string expression.
 
     Args:
@@ -373,9 +399,20 @@ def formatted_string(parser_node: LRStackNode, __: list, sections: list[Expressi
         sections (list[Expression]): F string sections parsed as expressions.
 
     Returns:
-        Formatted_String_Value: Formatted string expression that combines sections.
+        Formatted_String_Value | Constant_Value: Formatted string expression that combines sections. Adjacent constant sections are combined into one section and strings without formatted expressions are precomputed.
     """
-    return Formatted_String_Value(parser_node, sections)
+    folded_sections: list[Expression] = []
+    for section in sections:
+        if len(folded_sections) > 0 and is_constant(section) and is_constant(folded_sections[-1]):
+            prior_section = folded_sections[-1]
+            folded_sections[-1] = Constant_Value(prior_section.parser_node, f"{constant_value(prior_section)}{constant_value(section)}")
+        else:
+            folded_sections.append(section)
+    if len(folded_sections) == 0:
+        return Constant_Value(parser_node, "")
+    elif len(folded_sections) == 1 and is_constant(folded_sections[0]):
+        return Constant_Value(parser_node, str(constant_value(folded_sections[0])))
+    return Formatted_String_Value(parser_node, folded_sections)
 
 
 @typed_action
@@ -417,7 +454,7 @@ def function_call(parser_node: LRStackNode, __: list, func_name: Variable_Expres
     else:
         params = args[0]
         kwargs = args[1]
-    return Function_Call(parser_node, func_name, params, kwargs)
+    return Function_Call(parser_node, func_name, params, kwargs, Function_Inliner.has_inlinable_arguments(params, kwargs))
 
 
 @typed_action
@@ -644,7 +681,8 @@ def while_statement(parser_node: LRStackNode, __: list, condition: Expression, w
     Returns:
         While_Statement: While loop statement for conditional iteration.
     """
-    return While_Statement(parser_node, condition, while_block)
+    invariants = Loop_Invariants.hoist(while_block, [], [condition])
+    return While_Statement(parser_node, condition, while_block, invariants)
 
 
 @typed_action
@@ -661,10 +699,13 @@ def for_each_statement(parser_node: LRStackNode, __: list, variables: list[Varia
     Returns:
         For_Each_Statement: For each loop statement for iterating over collections.
     """
+    variable_names = [v.variable_name for v in variables]
+    invariants = Loop_Invariants.hoist(block, variable_names)
+    reuse_body_scope = Loop_Invariants.reuses_body_scope(block, variable_names)
     if len(iters) == 1:
-        return For_Each_Statement(parser_node, variables, iters[0], block)
+        return For_Each_Statement(parser_node, variables, iters[0], block, invariants, reuse_body_scope)
     else:
-        return For_Each_Statement(parser_node, variables, iters, block)
+        return For_Each_Statement(parser_node, variables, iters, block, invariants, reuse_body_scope)
 
 
 @typed_action
@@ -827,9 +868,14 @@ def param_list(_parser_node: LRStackNode, __: list, args: list[Variable_Expressi
 
 @typed_action
 def function_declaration(
-    parser_node: LRStackNode, __: list, func_name: Variable_Expression, params: tuple[list[Variable_Expression], list[Assignment]] | None, block: Statement
+    parser_node: LRStackNode,
+    __: list,
+    func_name: Variable_Expression,
+    params: tuple[list[Variable_Expression], list[Assignment]] | None,
+    block: Statement,
+    state_pure: list | None = None,
 ) -> Function_Declaration:
-    """Create a function declaration.
+    """Create a function declaration and classify whether the function is machine-independent or can be inlined by static analysis of its body.
 
     Args:
         parser_node (LRStackNode): The parser element that created this value.
@@ -837,6 +883,7 @@ def function_declaration(
         func_name (Variable_Expression): Name of the function being declared.
         params (tuple[list[Variable_Expression], list[Assignment]] | None): Parameter list as tuple of positional and keyword parameters.
         block (Statement): Function body statement to execute when called.
+        state_pure (list | None, optional): The pure decorator if the function is declared pure and its calls are memoized. Defaults to None.
 
     Returns:
         Function_Declaration: The function declaration that defines a callable function.
@@ -845,7 +892,10 @@ def function_declaration(
         params = [], []
     args = params[0]
     kwargs = params[1]
-    return Function_Declaration(parser_node, func_name.variable_name, args, kwargs, block)
+    parameter_names = [a.variable_name for a in args] + [k.variable_name for k in kwargs]
+    machine_independent = Function_Purity.is_machine_independent(block, parameter_names)
+    inline_body = Function_Inliner.inline_body(func_name.variable_name, block, parameter_names)
+    return Function_Declaration(parser_node, func_name.variable_name, args, kwargs, block, state_pure is not None, machine_independent, inline_body)
 
 
 @typed_action
@@ -857,7 +907,7 @@ def expression(parser_node: LRStackNode, nodes: list[str | KS_Element | Expressi
         nodes (list[str | KS_Element | Expression | None]): Parser nodes to combine into an expression.
 
     Returns:
-        Expression: Combined expression based on the parser nodes and operators.
+        Expression: Combined expression based on the parser nodes and operators. Operations on constant values are replaced by their precomputed values.
     """
     if len(nodes) == 1:
         return cast(Expression, nodes[0])
@@ -865,19 +915,20 @@ def expression(parser_node: LRStackNode, nodes: list[str | KS_Element | Expressi
         return cast(Expression, nodes[1])
     elif len(nodes) == 4:
         if nodes[1] == "is":
-            is_op = Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[1]), cast(Expression, nodes[3]))
+            is_op = _fold_constants(Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[1]), cast(Expression, nodes[3])))
             if nodes[2] is not None:
-                return Not_Expression(parser_node, is_op)
+                return _fold_constants(Not_Expression(parser_node, is_op))
             else:
                 return is_op
         else:  # not in operation
-            return Not_Expression(parser_node, Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[2]), cast(Expression, nodes[3])))
+            in_op = _fold_constants(Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[2]), cast(Expression, nodes[3])))
+            return _fold_constants(Not_Expression(parser_node, in_op))
     else:
-        return Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[1]), cast(Expression, nodes[2]))
+        return _fold_constants(Operator_Expression(parser_node, cast(Expression, nodes[0]), cast(str, nodes[1]), cast(Expression, nodes[2])))
 
 
 @typed_action
-def negation(parser_node: LRStackNode, __: list, exp: Expression) -> Not_Expression:
+def negation(parser_node: LRStackNode, __: list, exp: Expression) -> Expression:
     """Create a negation expression.
 
     Args:
@@ -886,9 +937,9 @@ def negation(parser_node: LRStackNode, __: list, exp: Expression) -> Not_Express
         exp (Expression): Expression to negate.
 
     Returns:
-        Not_Expression: Negation expression that inverts the boolean value.
+        Expression: Negation expression that inverts the boolean value or the precomputed negation of a constant value.
     """
-    return Not_Expression(parser_node, exp)
+    return _fold_constants(Not_Expression(parser_node, exp))
 
 
 @typed_action
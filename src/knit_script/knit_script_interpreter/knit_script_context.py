@@ -17,7 +17,6 @@ from virtual_knitting_machine.Knitting_Machine_Specification import Knitting_Mac
 from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 from virtual_knitting_machine.machine_components.needles.Sheet_Identifier import Sheet_Identifier
-from virtual_knitting_machine.machine_components.needles.Sheet_Needle import Sheet_Needle, Slider_Sheet_Needle
 from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier_Set import Yarn_Carrier, Yarn_Carrier_Set
 
@@ -25,11 +24,19 @@ from knit_script.debugger.debug_protocol import Knit_Script_Debuggable_Protocol,
 from knit_script.debugger.enter_frame_decorator import enters_new_scope
 from knit_script.debugger.exit_frame_decorator import exits_scope
 from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger, KnitScript_Error_Log, KnitScript_Logging_Level, KnitScript_Warning_Log
+from knit_script.knit_script_interpreter.Machine_State_Fingerprint import Machine_State_Fingerprint
+from knit_script.knit_script_interpreter.Machine_State_Journal import Machine_State_Journal
 from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Gauged_Sheet_Record import Gauged_Sheet_Record
+from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Sheet_Needle_Table import Sheet_Needle_Table
+from knit_script.knit_script_interpreter.scope.import_resolution_index import Import_Resolution_Index
 from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.scope.module_registry import Knit_Script_Module_Registry
 from knit_script.knit_script_std_library.carriers import cut_active_carriers
 
 if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.bytecode.Register_VM import Register_VM
+    from knit_script.knit_script_interpreter.Execution_Limits import Execution_Limits
+    from knit_script.knit_script_interpreter.knit_script_context_baseline import Knit_Script_Context_Baseline
     from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
     from knit_script.knit_script_interpreter.statements.Statement import Statement
 
@@ -50,6 +57,22 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
         parser (Knit_Script_Parser): Parser instance used for processing knit script code.
         last_carriage_pass_result (list[Needle] | dict[Needle, Needle | NOne]): Results from the most recent carriage pass operation.
         knitout (list[Knitout_Line]): List of knitout instructions generated during execution.
+        replay_loops (bool): If True, loop bodies that only depend on the state of the machine are replayed from recorded iterations.
+        lazy_modules (bool): If True, knitscript modules without side effects are executed when they are first accessed instead of when they are imported.
+        transactional_try (bool): If True, the changes made by the try block of a try-catch statement are rolled back before its catch block is executed.
+        execution_limits (Execution_Limits | None): The limits on the statements, knitout lines, wall time, and scope depth of programs executed in this context and their cancellation token, or None if execution is unlimited.
+        bytecode_vm (Register_VM | None): The register machine that executes statements compiled to bytecode or None if statements are executed by walking their trees.
+        module_registry (Knit_Script_Module_Registry): The knit script modules imported into this context, keyed by the resolved path of the module file.
+        import_index (Import_Resolution_Index): The index that resolves the sources of import statements in this context and caches failed resolutions.
+        baseline (Knit_Script_Context_Baseline | None): The captured state that a context pool restores this context to when it is released or None if the context is not pooled.
+        machine_journal (Machine_State_Journal): The journal that records changes to the machine state while transactions are open.
+        pass_plans (dict[tuple, Any]): The validated carriage pass plans shared by repeated passes in this context, keyed by the instructions and the bed, position, and slider flag of each needle.
+        pure_calls (dict[tuple, Any]): The recorded calls of pure functions in this context and their return values, ordered from least to most recently used.
+        machine_independent_calls (dict[tuple, Any]): The return values of calls to machine-independent functions in this context keyed by the values of their parameters, ordered from least to most recently used.
+        print_recordings (list[list[tuple[str, Any, KnitScript_Logging_Level]]]): The open recordings of printed messages, each receiving the message, source, and log type of every message printed while it is open.
+        _needle_table (dict[tuple[bool, int, bool], Needle]): Flyweight table of needles outside of gauged sheets keyed by bed, position, and slider.
+        _carrier_table (dict[int, Yarn_Carrier]): Flyweight table of the carriers on the machine keyed by carrier id.
+        _state_fingerprint (Machine_State_Fingerprint): The incrementally maintained fingerprint of the machine state.
     """
 
     def __init__(
@@ -63,6 +86,10 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
         info_logger: Knit_Script_Logger | None = None,
         warning_logger: KnitScript_Warning_Log | None = None,
         error_logger: KnitScript_Error_Log | None = None,
+        replay_loops: bool = False,
+        lazy_modules: bool = False,
+        transactional_try: bool = False,
+        execution_limits: Execution_Limits | None = None,
     ):
         """Initialize the knit script context.
 
@@ -76,6 +103,10 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
             info_logger (Knit_Script_Logger, optional): The logger to attach to this context. Defaults to a standard logger which outputs only to console.
             warning_logger (KnitScript_Warning_Log, optional): The warning logger to attach to this context. Defaults to a standard warning logger which outputs only to console.
             error_logger (KnitScript_Error_Log, optional): The error logger to attach to this context. Defaults to a standard error logger which outputs only to console.
+            replay_loops (bool, optional): If True, loop iterations that start from a recorded state are replayed from the knitout of an earlier iteration instead of being interpreted. Defaults to False.
+            lazy_modules (bool, optional): If True, knitscript modules without side effects are executed when they are first accessed instead of when they are imported. Defaults to False.
+            transactional_try (bool, optional): If True, the changes made by the try block of a try-catch statement are rolled back before its catch block is executed. Defaults to False.
+            execution_limits (Execution_Limits | None, optional): The limits on the execution of programs in this context and their cancellation token. Defaults to unlimited execution.
         """
         if machine_specification is None:
             machine_specification = Knitting_Machine_Specification()
@@ -95,6 +126,22 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
         self.info_logger: Knit_Script_Logger = info_logger if info_logger is not None else Knit_Script_Logger()
         self.warning_logger: KnitScript_Warning_Log = warning_logger if warning_logger is not None else KnitScript_Warning_Log()
         self.error_logger: KnitScript_Error_Log = error_logger if error_logger is not None else KnitScript_Error_Log()
+        self._needle_table: dict[tuple[bool, int, bool], Needle] = {}
+        self._carrier_table: dict[int, Yarn_Carrier] = {}
+        self.replay_loops: bool = replay_loops
+        self.lazy_modules: bool = lazy_modules
+        self.transactional_try: bool = transactional_try
+        self.execution_limits: Execution_Limits | None = execution_limits
+        self.bytecode_vm: Register_VM | None = None
+        self.module_registry: Knit_Script_Module_Registry = Knit_Script_Module_Registry()
+        self.import_index: Import_Resolution_Index = Import_Resolution_Index()
+        self.baseline: Knit_Script_Context_Baseline | None = None
+        self.machine_journal: Machine_State_Journal = Machine_State_Journal(self)
+        self.pass_plans: dict[tuple, Any] = {}
+        self.pure_calls: dict[tuple, Any] = {}
+        self.machine_independent_calls: dict[tuple, Any] = {}
+        self.print_recordings: list[list[tuple[str, Any, KnitScript_Logging_Level]]] = []
+        self._state_fingerprint: Machine_State_Fingerprint = Machine_State_Fingerprint(self)
 
     @property
     def version(self) -> int:
@@ -137,6 +184,8 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
         elif isinstance(message, BaseException):
             log_type = KnitScript_Logging_Level.error
             message = str(message)
+        for print_recording in self.print_recordings:
+            print_recording.append((message, source, log_type))
         source_line = f" from {repr(source)}:\n\t" if source is not None else ""
         if log_type is KnitScript_Logging_Level.debug:
             if self.debugger is not None:
@@ -170,7 +219,12 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
 
         Returns:
             Knit_Script_Scope: The scope that was entered and is now active.
+
+        Raises:
+            Execution_Limit_Exception: If the new scope is deeper than the scope depth limit of the context's execution limits.
         """
+        if self.execution_limits is not None:
+            self.execution_limits.check_scope_depth(self.variable_scope.depth + 1)
         if function_name is not None:
             self.variable_scope = self.variable_scope.enter_new_scope(function_name, is_function=True, module_scope=module_scope)
         elif module_name is not None:
@@ -190,7 +244,11 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
             bool: True if the scope exited into a parent scope. False, otherwise.
         """
         new_variable_scope = self.variable_scope.exit_current_scope(collapse_into_parent)
-        self.variable_scope = Knit_Script_Scope(self, parent=None) if new_variable_scope is None else new_variable_scope
+        if new_variable_scope is None:
+            self.variable_scope = Knit_Script_Scope(self, parent=None)
+            Knit_Script_Scope.invalidate_cached_resolutions()  # The globals of the exited root scope are no longer accessible.
+        else:
+            self.variable_scope = new_variable_scope
         return new_variable_scope is not None
 
     @property
@@ -299,6 +357,20 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
         """
         self.variable_scope.Gauge = value
 
+    @property
+    def state_fingerprint(self) -> int:
+        """Get a fingerprint of the machine state that the instructions generated by the interpreter depend on.
+
+        The fingerprint covers the loops held on each needle and slider of both beds, the racking and carriage direction, the working, active, and hooked carriers,
+         and the current gauge, sheet, and layer assignment of the gauged sheets.
+        Two states with the same fingerprint produce the same knitout from statements that only depend on the machine state.
+        The fingerprint is maintained incrementally from the knitout executed in this context, so reading it only costs time proportional to the knitout added since the last read.
+
+        Returns:
+            int: The fingerprint of the current machine state.
+        """
+        return self._state_fingerprint.fingerprint
+
     def attach_debugger(self, debugger: Knit_Script_Debugger_Protocol) -> None:
         """
         Attaches the given debugger to this knitout execution.
@@ -340,12 +412,13 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
     def execute_statement(self, statement: Statement) -> None:
         """
         Execute the given statement in the current context.
+        The statement is executed by the bytecode register machine if one is set and no debugger is attached.
 
         Args:
             statement (Statement): The statement to execute.
         """
         try:
-            statement.execute(self)
+            self.execute_body(statement)
         except Exception as e:
             try:
                 self.knitout.extend(cut_active_carriers(self.machine_state))
@@ -356,6 +429,36 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
                 e.add_note(f"Couldn't produce valid error.k file because of error: {cut_e}")
             raise
 
+    def execute_body(self, statement: Statement) -> None:
+        """
+        Execute the given statement (e.g., the body of a function) in the current context without writing an error.k file if it fails.
+        The statement is executed by the bytecode register machine if one is set and no debugger is attached.
+
+        Args:
+            statement (Statement): The statement to execute.
+        """
+        if self.bytecode_vm is not None and self.debugger is None:
+            self.bytecode_vm.execute(statement, self)
+        else:
+            statement.execute(self)
+
+    def begin_transaction(self) -> None:
+        """Open a transaction in the machine state journal, nested in any open transactions."""
+        self.machine_journal.begin()
+
+    def commit_transaction(self) -> None:
+        """Close the innermost open transaction and keep the changes made since it was opened."""
+        self.machine_journal.commit()
+
+    def rollback_transaction(self) -> None:
+        """Close the innermost open transaction and undo the changes made to the machine state, knitout, and machine scope since it was opened.
+
+        The gauged sheet record and the machine state fingerprint are updated with the loops of the restored needles.
+        """
+        restored_needles = self.machine_journal.rollback()
+        self.gauged_sheet_record.record_needles(needle for needle in restored_needles if not needle.is_slider)
+        self._state_fingerprint.refresh_needles(restored_needles)
+
     def get_needle(self, is_front: bool, pos: int, is_slider: bool = False, global_needle: bool = False, sheet: int | None = None, gauge: int | None = None) -> Needle:
         """Get a needle based on current gauging configuration.
 
@@ -369,21 +472,42 @@ class Knit_Script_Context(Knit_Script_Debuggable_Protocol):
 
         Returns:
             Needle: Needle based on current gauging configuration.
+
+        Note:
+            Needles are interned in flyweight tables, so repeated requests for the same needle in the same sheet and gauge return the same needle instance.
+            Sheet needles come from the shared table for their sheet and gauge; other needles come from the table of this context.
         """
-        if sheet is None:
-            sheet = self.sheet.sheet
-        if gauge is None:
-            gauge = self.gauge
-        if global_needle or gauge == 1:
-            if is_slider:
-                return Slider_Needle(is_front, pos)
-            else:
-                return Needle(is_front, pos)
-        else:
-            if is_slider:
-                return Slider_Sheet_Needle(is_front, pos, sheet, gauge)
-            else:
-                return Sheet_Needle(is_front, pos, sheet, gauge)
+        if not global_needle:
+            if gauge is None:
+                gauge = self.gauge
+            if gauge != 1:
+                if sheet is None:
+                    sheet = self.sheet.sheet
+                return Sheet_Needle_Table.get_table(sheet, gauge).sheet_needle(is_front, pos, is_slider)
+        key = (is_front, pos, is_slider)
+        needle = self._needle_table.get(key)
+        if needle is None:
+            needle = Slider_Needle(is_front, pos) if is_slider else Needle(is_front, pos)
+            self._needle_table[key] = needle
+        return needle
+
+    def get_carrier(self, carrier_id: int) -> Yarn_Carrier:
+        """Get the carrier on the machine with the given id.
+
+        Args:
+            carrier_id (int): The id of the carrier.
+
+        Returns:
+            Yarn_Carrier: The carrier on the machine with the given id. Carriers are interned in a flyweight table for this context.
+
+        Raises:
+            KeyError: If the carrier id does not exist in the machine's carrier system.
+        """
+        carrier = self._carrier_table.get(carrier_id)
+        if carrier is None:
+            carrier = self.machine_state.carrier_system[carrier_id]
+            self._carrier_table[carrier_id] = carrier
+        return carrier
 
     def get_machine_needle(self, is_front: bool, pos: int, is_slider: bool = False, global_needle: bool = False, sheet: int | None = None, gauge: int | None = None) -> Needle:
         """Get the exact needle instance in use on the machine state.
@@ -0,0 +1,126 @@
+"""Baseline of a knit script context that the context can be restored to between programs.
+
+This module provides the Knit_Script_Context_Baseline class, which captures the state of a knit script context before it executes any program and restores the context to that state in place.
+Constructing a context allocates every needle and slider on both beds of a new knitting machine,
+ so restoring the machine of an existing context is faster than constructing a new context for each program.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from knit_graphs.Knit_Graph import Knit_Graph
+from knit_graphs.Yarn import Yarn_Properties
+from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier import Yarn_Carrier
+from virtual_knitting_machine.machine_constructed_knit_graph.Machine_Knit_Yarn import Machine_Knit_Yarn
+
+from knit_script.knit_script_interpreter.Machine_State_Fingerprint import Machine_State_Fingerprint
+from knit_script.knit_script_interpreter.Machine_State_Journal import Machine_State_Journal
+from knit_script.knit_script_interpreter.scope.import_resolution_index import Import_Resolution_Index
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.scope.module_registry import Knit_Script_Module_Registry
+
+if TYPE_CHECKING:
+    from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+    from virtual_knitting_machine.machine_components.needles.Needle import Needle
+    from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
+
+    from knit_script.knit_script_interpreter.Execution_Limits import Execution_Limits
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+
+
+class Knit_Script_Context_Baseline:
+    """The captured state of a knit script context that has not executed any program.
+
+    The baseline records the attributes of the knitting machine, its needle beds, carriage, yarn insertion system, and carriers.
+    Restoring the baseline empties the needles that hold loops and resets the attributes of each machine component, so the needles and carriers of the machine are reused.
+    The knit graph, yarns, knitout, variable scopes, imported modules, and import index of the context are replaced by new objects,
+     so the knitout and knit graph produced by an earlier program are not changed by the programs executed after the context is restored.
+
+    Note:
+        The knitting machine of the context is restored in place. A machine state returned from a program executed in the context is reset when the context is restored.
+        The flyweight needle and carrier tables of the context are kept because they hold the needles and carriers of the restored machine.
+
+    Attributes:
+        context (Knit_Script_Context): The context that this baseline restores.
+        _needles (tuple[list[Needle], list[Slider_Needle], list[Needle], list[Slider_Needle]]): The lists of needles and sliders on each bed of the machine.
+        _component_attributes (list[tuple[Any, dict[str, Any]]]): The attributes of each component of the machine in the baseline state.
+        _carrier_yarns (list[tuple[Yarn_Carrier, Yarn_Properties]]): The properties of the yarn held by each carrier.
+        _header (tuple[Knitout_Line, ...]): The knitout header lines that start the knitout of the context.
+        _version (int): The knitout version of the context.
+        _replay_loops (bool): The loop replay setting of the context.
+        _lazy_modules (bool): The lazy module setting of the context.
+        _transactional_try (bool): The transactional try setting of the context.
+        _execution_limits (Execution_Limits | None): The execution limits of the context.
+    """
+
+    def __init__(self, context: Knit_Script_Context) -> None:
+        """Capture the baseline of the given context.
+
+        Args:
+            context (Knit_Script_Context): A context that has not executed any program.
+
+        Raises:
+            ValueError: If the machine of the context holds loops.
+        """
+        machine = context.machine_state
+        self._needles: tuple[list[Needle], list[Slider_Needle], list[Needle], list[Slider_Needle]] = (
+            machine.front_bed.needles,
+            machine.front_bed.sliders,
+            machine.back_bed.needles,
+            machine.back_bed.sliders,
+        )
+        if any(needle.held_loops for needles in self._needles for needle in needles):
+            raise ValueError("Cannot capture the baseline of a context whose machine holds loops")
+        self.context: Knit_Script_Context = context
+        components: list[Any] = [machine, machine.front_bed, machine.back_bed, machine.carriage, machine.carrier_system, *machine.carrier_system.carriers]
+        self._component_attributes: list[tuple[Any, dict[str, Any]]] = [(component, dict(vars(component))) for component in components]
+        self._carrier_yarns: list[tuple[Yarn_Carrier, Yarn_Properties]] = [(carrier, carrier.yarn.properties) for carrier in machine.carrier_system.carriers]
+        self._header: tuple[Knitout_Line, ...] = tuple(context.knitout)
+        self._version: int = context.version
+        self._replay_loops: bool = context.replay_loops
+        self._lazy_modules: bool = context.lazy_modules
+        self._transactional_try: bool = context.transactional_try
+        self._execution_limits: Execution_Limits | None = context.execution_limits
+
+    def restore(self) -> None:
+        """Restore the context to the captured baseline.
+
+        The needles that hold loops are emptied and the attributes of each machine component are reset to their baseline values.
+        Containers held by the machine components are copied, so they are not shared with the baseline.
+        The context is given a new knit graph and yarns, a new knitout starting with the baseline header, a new root scope, no imported modules, and no memoized calls of pure functions.
+        Any debugger attached to the context is detached.
+        """
+        context = self.context
+        for needles in self._needles:
+            for needle in needles:
+                if needle.held_loops:
+                    needle.held_loops = []
+        for component, attributes in self._component_attributes:
+            component_attributes = vars(component)
+            component_attributes.clear()
+            for name, value in attributes.items():
+                component_attributes[name] = value.copy() if isinstance(value, (list, set, dict)) else value
+        knit_graph = Knit_Graph()
+        context.machine_state.knit_graph = knit_graph
+        for carrier, yarn_properties in self._carrier_yarns:
+            carrier._yarn = Machine_Knit_Yarn(carrier, yarn_properties, knit_graph=knit_graph)
+        context.detach_debugger()
+        context.ks_file = None
+        context.version = self._version
+        context.knitout = list(self._header)
+        context.last_carriage_pass_result = {}
+        context.variable_scope = Knit_Script_Scope(context, None)
+        Knit_Script_Scope.invalidate_cached_resolutions()
+        context.replay_loops = self._replay_loops
+        context.lazy_modules = self._lazy_modules
+        context.transactional_try = self._transactional_try
+        context.execution_limits = self._execution_limits
+        context.bytecode_vm = None
+        context.module_registry = Knit_Script_Module_Registry()
+        context.import_index = Import_Resolution_Index()
+        context.machine_journal = Machine_State_Journal(context)
+        context.pure_calls = {}
+        context.machine_independent_calls = {}
+        context.print_recordings = []
+        context._state_fingerprint = Machine_State_Fingerprint(context)
@@ -0,0 +1,81 @@
+"""Pool of knit script contexts that are restored to their baseline between programs.
+
+This module provides the Knit_Script_Context_Pool class, which hands out knit script contexts for a machine specification and restores released contexts to the baseline captured when they were constructed.
+Services that interpret many short programs reuse the knitting machines of released contexts instead of constructing a new context for each program.
+"""
+
+from __future__ import annotations
+
+from virtual_knitting_machine.Knitting_Machine_Specification import Knitting_Machine_Specification
+
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knit_script_context_baseline import Knit_Script_Context_Baseline
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+
+
+class Knit_Script_Context_Pool:
+    """A pool of knit script contexts with the same machine specification, parser, and knitout version.
+
+    Contexts are acquired from the pool before executing a program and released to the pool after the program's results are no longer needed.
+    A released context is restored to its baseline (see Knit_Script_Context_Baseline), so the next program executed in it starts from the same state as a newly constructed context.
+
+    Note:
+        The knitting machine of a released context is restored in place, so the machine state of a program must be used before its context is released.
+        The knitout and knit graph of a program are replaced when its context is restored and remain valid after the context is released.
+        Interpreters with a context pool release the context of a program when they start their next program, so the machine state they return stays valid until then.
+
+    Attributes:
+        machine_specification (Knitting_Machine_Specification): The specification of the machines of the contexts in the pool.
+        parser (Knit_Script_Parser): The parser shared by the contexts in the pool.
+        knitout_version (int): The knitout version of the contexts in the pool.
+        max_idle_contexts (int): The maximum number of restored contexts that are kept in the pool. Released contexts beyond this limit are discarded.
+        _idle_contexts (list[Knit_Script_Context]): The restored contexts that are ready to be acquired.
+    """
+
+    def __init__(self, machine_specification: Knitting_Machine_Specification | None = None, parser: Knit_Script_Parser | None = None, knitout_version: int = 2, max_idle_contexts: int = 8) -> None:
+        """Initialize an empty context pool.
+
+        Args:
+            machine_specification (Knitting_Machine_Specification, optional): Specification for the machines of the pooled contexts. Defaults to Knitting_Machine_Specification().
+            parser (Knit_Script_Parser | None, optional): Parser shared by the pooled contexts. Defaults to a new parser.
+            knitout_version (int, optional): Version number of the knitout generated by the pooled contexts. Defaults to 2.
+            max_idle_contexts (int, optional): The maximum number of restored contexts that are kept for reuse. Defaults to 8.
+        """
+        self.machine_specification: Knitting_Machine_Specification = machine_specification if machine_specification is not None else Knitting_Machine_Specification()
+        self.parser: Knit_Script_Parser = parser if parser is not None else Knit_Script_Parser()
+        self.knitout_version: int = knitout_version
+        self.max_idle_contexts: int = max_idle_contexts
+        self._idle_contexts: list[Knit_Script_Context] = []
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of restored contexts ready to be acquired.
+        """
+        return len(self._idle_contexts)
+
+    def acquire(self) -> Knit_Script_Context:
+        """
+        Returns:
+            Knit_Script_Context: A restored context from the pool or a new context with a captured baseline if no restored contexts are available.
+        """
+        if len(self._idle_contexts) > 0:
+            return self._idle_contexts.pop()
+        context = Knit_Script_Context(machine_specification=self.machine_specification, parser=self.parser, knitout_version=self.knitout_version)
+        context.baseline = Knit_Script_Context_Baseline(context)
+        return context
+
+    def release(self, context: Knit_Script_Context) -> None:
+        """Restore the given context to its baseline and keep it for reuse if the pool is not full.
+
+        Args:
+            context (Knit_Script_Context): A context acquired from this pool.
+
+        Raises:
+            ValueError: If the context was not acquired from a context pool.
+        """
+        if context.baseline is None:
+            raise ValueError("Cannot release a context that was not acquired from a context pool")
+        context.baseline.restore()
+        if len(self._idle_contexts) < self.max_idle_contexts and all(idle_context is not context for idle_context in self._idle_contexts):
+            self._idle_contexts.append(context)
@@ -0,0 +1,176 @@
+"""Snapshot of a knit script context that programs can be executed from without executing the program that produced the snapshot.
+
+This module provides the Knit_Script_Context_Snapshot class, which captures the complete state of a knit script context after a prefix program and restores independent copies of that state.
+Patterns that share a long prelude (e.g., carrier setup, a cast-on, and waste yarn) execute the prelude once and execute each suffix program in a context restored from the snapshot.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Sheet_Needle_Table import Sheet_Needle_Table
+
+if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+
+
+def _new_hashable_object(object_class: type, scalar_attributes: dict[str, Any]) -> Any:
+    """
+    Args:
+        object_class (type): The class of the object to create.
+        scalar_attributes (dict[str, Any]): The attributes of the object that hold scalar values.
+
+    Returns:
+        Any: A new object of the given class with only its scalar attributes set.
+    """
+    new_object = cast(Any, object_class).__new__(object_class)
+    vars(new_object).update(scalar_attributes)
+    return new_object
+
+
+class _Context_Pickler(pickle.Pickler):
+    """Pickler that replaces the objects shared between a context and its restored copies with references to those objects.
+
+    Attributes:
+        shared_objects (dict[int, Any]): The objects referenced by the pickled state, keyed by their persistent id.
+        _replaced_objects (dict[int, Any]): The objects of the context that are replaced when the state is restored, keyed by their id.
+    """
+
+    _SHARED_TYPES: tuple[type, ...] = (KS_Element, Knitout_Line, Sheet_Needle_Table, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+    _SCALAR_TYPES: tuple[type, ...] = (bool, int, float, str, Enum, type(None))
+
+    def __init__(self, file: io.BytesIO, replaced_objects: dict[int, Any]) -> None:
+        """
+        Args:
+            file (io.BytesIO): The buffer to write the pickled state to.
+            replaced_objects (dict[int, Any]): The objects of the context that are replaced when the state is restored, keyed by their id and mapped to their replacement.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared_objects: dict[int, Any] = {}
+        self._replaced_objects: dict[int, Any] = replaced_objects
+
+    def persistent_id(self, obj: Any) -> int | None:
+        """
+        Args:
+            obj (Any): An object referenced by the pickled state.
+
+        Returns:
+            int | None: The persistent id of a shared or replaced object or None if the object is copied into the pickled state.
+        """
+        object_id = id(obj)
+        if object_id in self._replaced_objects:
+            self.shared_objects[object_id] = self._replaced_objects[object_id]
+            return object_id
+        elif isinstance(obj, self._SHARED_TYPES):
+            self.shared_objects[object_id] = obj
+            return object_id
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduce objects that define their own hash so that they are created with their scalar attributes set.
+
+        Loops and needles are hashed by their ids and positions and are keys of dictionaries that they reference through other objects (e.g., a loop's yarn),
+         so they may be hashed while they are restored, before the attributes that hold other objects are set.
+
+        Args:
+            obj (Any): An object referenced by the pickled state.
+
+        Returns:
+            Any: The reduction of an object with a custom hash or NotImplemented to pickle the object normally.
+        """
+        object_class: Any = type(obj)
+        if object_class.__hash__ is object.__hash__ or object_class.__hash__ is None or object_class.__reduce_ex__ is not object.__reduce_ex__ or not hasattr(obj, "__dict__"):
+            return NotImplemented
+        attributes = vars(obj)
+        scalar_attributes = {name: value for name, value in attributes.items() if isinstance(value, self._SCALAR_TYPES)}
+        return _new_hashable_object, (object_class, scalar_attributes), {name: value for name, value in attributes.items() if name not in scalar_attributes}
+
+
+class _Context_Unpickler(pickle.Unpickler):
+    """Unpickler that resolves references to the objects shared between a context and its restored copies.
+
+    Attributes:
+        _shared_objects (dict[int, Any]): The shared objects keyed by their persistent id.
+    """
+
+    def __init__(self, file: io.BytesIO, shared_objects: dict[int, Any]) -> None:
+        """
+        Args:
+            file (io.BytesIO): The buffer to read the pickled state from.
+            shared_objects (dict[int, Any]): The shared objects keyed by their persistent id.
+        """
+        super().__init__(file)
+        self._shared_objects: dict[int, Any] = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        """
+        Args:
+            pid (Any): The persistent id of a shared object.
+
+        Returns:
+            Any: The shared object with the given persistent id.
+        """
+        return self._shared_objects[pid]
+
+
+class Knit_Script_Context_Snapshot:
+    """The complete state of a knit script context at the end of a prefix program.
+
+    The snapshot covers the knitting machine and its knit graph, the variable scopes and the functions and modules declared in them, the knitout, the gauged sheet records, and the machine state fingerprint.
+    The state is serialized when the snapshot is taken, so later changes to the context do not change the snapshot, and each restored context is an independent copy of the state.
+
+    Objects that are not changed by executing programs are shared between the context and its restored copies instead of being copied:
+    the parsed knit script elements, the knitout lines that were already generated, the flyweight sheet needle tables, Python modules and functions,
+    and the parser, loggers, register machine, and import index of the context.
+    Restored contexts have no debugger or execution limits and are not returned to a context pool.
+
+    Note:
+        Snapshots can be restored in worker processes forked after the snapshot was taken because the shared objects are inherited by forked processes.
+        Snapshots cannot be sent to other processes because the shared objects are referenced by identity.
+
+    Attributes:
+        _state (bytes): The serialized state of the context.
+        _shared_objects (dict[int, Any]): The objects shared with restored contexts, keyed by their persistent id in the serialized state.
+    """
+
+    def __init__(self, context: Knit_Script_Context) -> None:
+        """Capture the state of the given context.
+
+        Args:
+            context (Knit_Script_Context): The context to capture the state of.
+        """
+        shared_context_objects = [context.parser, context.info_logger, context.warning_logger, context.error_logger, context.bytecode_vm, context.import_index]
+        replaced_objects: dict[int, Any] = {id(shared_object): shared_object for shared_object in shared_context_objects if shared_object is not None}
+        if context.debugger is not None:
+            replaced_objects[id(context.debugger)] = None
+        if context.baseline is not None:
+            replaced_objects[id(context.baseline)] = None
+        if context.execution_limits is not None:
+            replaced_objects[id(context.execution_limits)] = None
+        buffer = io.BytesIO()
+        pickler = _Context_Pickler(buffer, replaced_objects)
+        pickler.dump(context)
+        self._state: bytes = buffer.getvalue()
+        self._shared_objects: dict[int, Any] = pickler.shared_objects
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of bytes in the serialized state of the context.
+        """
+        return len(self._state)
+
+    def restore(self) -> Knit_Script_Context:
+        """
+        Returns:
+            Knit_Script_Context: A new context in the captured state, independent of the snapshot's context and of other contexts restored from the snapshot.
+        """
+        context: Knit_Script_Context = _Context_Unpickler(io.BytesIO(self._state), self._shared_objects).load()
+        return context
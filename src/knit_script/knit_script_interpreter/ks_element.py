@@ -6,10 +6,12 @@ It provides common functionality for accessing parser node information, location
 
 from __future__ import annotations
 
+import copy
 import os
 import warnings
 from collections.abc import Callable
 from functools import wraps
+from types import MethodType
 from typing import ParamSpec, TypeVar, cast
 
 from parglare.common import Location
@@ -101,6 +103,56 @@ class KS_Element(Debuggable_Element):
         context_str = context_str.rstrip(";")
         return context_str
 
+    def copy_tree(self, substitutions: dict[int, KS_Element] | None = None, copies: dict[int, KS_Element] | None = None) -> KS_Element:
+        """Copy this element and the elements nested in it, sharing the parser nodes and other values of the original.
+
+        Copies of a tree do not share the caches that elements fill as they execute, as long as the copied tree has not been executed.
+
+        Args:
+            substitutions (dict[int, KS_Element] | None, optional): The elements that replace elements in the copy, keyed by the id of the replaced element. Defaults to no substitutions.
+            copies (dict[int, KS_Element] | None, optional):
+                The copies already made, keyed by the id of the copied element, so that elements shared in the original are shared in the copy. Defaults to an empty set of copies.
+
+        Returns:
+            KS_Element: A copy of this element and all elements nested in it with the substitutions applied.
+        """
+        if substitutions is None:
+            substitutions = {}
+        if copies is None:
+            copies = {}
+        substitute = substitutions.get(id(self))
+        if substitute is not None:
+            return substitute
+        element_copy = copies.get(id(self))
+        if element_copy is None:
+            element_copy = copy.copy(self)
+            copies[id(self)] = element_copy
+            for attribute_name, value in vars(self).items():
+                if isinstance(value, MethodType) and value.__self__ is self:  # Methods selected when the element was created must be bound to the copy.
+                    setattr(element_copy, attribute_name, MethodType(value.__func__, element_copy))
+                else:
+                    setattr(element_copy, attribute_name, KS_Element._copied_value(value, substitutions, copies))
+        return element_copy
+
+    @staticmethod
+    def _copied_value(value: object, substitutions: dict[int, KS_Element], copies: dict[int, KS_Element]) -> object:
+        """
+        Args:
+            value (object): The value of an attribute of a copied element.
+            substitutions (dict[int, KS_Element]): The elements that replace elements in the copy, keyed by the id of the replaced element.
+            copies (dict[int, KS_Element]): The copies already made, keyed by the id of the copied element.
+
+        Returns:
+            object: The copy of an element, a copy of a list or tuple with the elements nested in it copied, or the given value if it does not hold elements.
+        """
+        if isinstance(value, KS_Element):
+            return value.copy_tree(substitutions, copies)
+        elif isinstance(value, (list, tuple)):
+            copied_values = [KS_Element._copied_value(v, substitutions, copies) for v in value]
+            if any(c is not v for c, v in zip(copied_values, value, strict=True)):
+                return type(value)(copied_values)
+        return value
+
     def __hash__(self) -> int:
         return hash((self.location.start_position, self.location.end_position, self.file_name))
 
@@ -115,6 +167,42 @@ class KS_Element(Debuggable_Element):
 _P = ParamSpec("_P")  # Captures all parameters for methods that start with the instruction
 _R = TypeVar("_R")  # Captures return type for methods that start with the instruction
 
+_KS_ERROR_NOTE: str = "Error Raised when Executing Knitscript Program"
+
+
+def annotate_error(element: KS_Element, context: Knit_Script_Context, error: Exception) -> None:
+    """Annotate an error with its location in the knitscript file and report it to the context, unless the error was already annotated by a more specific element.
+
+    Args:
+        element (KS_Element): The knitscript element that raised the error.
+        context (Knit_Script_Context): The context in which the element was executed.
+        error (Exception): The raised error.
+    """
+    if not hasattr(error, "__notes__") or _KS_ERROR_NOTE not in error.__notes__:
+        error.add_note(_KS_ERROR_NOTE)
+        error.add_note(f"\t{error.__class__.__name__} at <{element.position_context}> in {element.location_str}")
+        context.print(error, element, KnitScript_Logging_Level.error)
+
+
+def report_warnings(element: KS_Element, context: Knit_Script_Context, caught: list[warnings.WarningMessage]) -> None:
+    """Report warnings caught while executing an element to the context and re-issue them.
+
+    Warnings that are not already associated with a more specific element are associated with the given element.
+
+    Args:
+        element (KS_Element): The knitscript element that was executed.
+        context (Knit_Script_Context): The context in which the element was executed.
+        caught (list[warnings.WarningMessage]): The warnings caught while executing the element.
+    """
+    caught_warnings = []
+    for warning in caught:
+        if not isinstance(warning.source, KS_Element):
+            warning.source = element
+            context.print(warning.message, element, KnitScript_Logging_Level.warning)
+            caught_warnings.append(warning)
+    for warning in caught_warnings:
+        warnings.warn(warning.message, stacklevel=1)
+
 
 def associate_error(execution_method: Callable[_P, _R]) -> Callable[_P, _R]:
     """
@@ -125,7 +213,8 @@ def associate_error(execution_method: Callable[_P, _R]) -> Callable[_P, _R]:
     Returns:
         Callable[[KS_Element,], Any]: The wrapped method.
     """
-    ks_error_note: str = "Error Raised when Executing Knitscript Program"
+
+    charges_statement = execution_method.__name__ == "execute"  # Executed statements are charged against the execution limits of the context.
 
     @wraps(execution_method)
     def annotate_errors(*args: _P.args, **kwargs: _P.kwargs) -> _R:
@@ -136,28 +225,20 @@ def associate_error(execution_method: Callable[_P, _R]) -> Callable[_P, _R]:
         """
         self: KS_Element = cast(KS_Element, args[0] if len(args) >= 1 else kwargs["self"])
         context: Knit_Script_Context = cast(Knit_Script_Context, args[1] if len(args) > 1 else kwargs["context"])
-        caught_warnings = []
 
         try:
+            if charges_statement and context.execution_limits is not None:
+                context.execution_limits.charge_statement(context)
             with warnings.catch_warnings(record=True) as caught:
                 warnings.simplefilter("always")
                 return_val = execution_method(*args, **kwargs)
-            for warning in caught:
-                if not isinstance(warning.source, KS_Element):
-                    warning.source = self
-                    context.print(warning.message, self, KnitScript_Logging_Level.warning)
-                    caught_warnings.append(warning)
-            for warning in caught_warnings:
-                warnings.warn(warning.message, stacklevel=1)
+            report_warnings(self, context, caught)
             return return_val
         except Exception as e:
-            if not hasattr(e, "__notes__") or ks_error_note not in e.__notes__:
-                e.add_note(ks_error_note)
-                e.add_note(f"\t{e.__class__.__name__} at <{self.position_context}> in {self.location_str}")
-                context.print(e, self, KnitScript_Logging_Level.error)
+            annotate_error(self, context, e)
             raise
 
-    if execution_method.__name__ == "execute":  # Wrapping an execute method which must also be debuggable.
+    if charges_statement:  # Wrapping an execute method which must also be debuggable.
         return debug_knitscript_statement(annotate_errors)
     else:  # Evaluations of expressions are not marked as debuggable, but their errors are annotated.
         return annotate_errors
@@ -28,6 +28,9 @@ Machine State Management:
 
 Module Management:
     Knit_Script_Module: Handles module imports and namespace organization.
+    Knit_Script_Module_Registry: Tracks the knit script modules imported into a context and shares parsed module files between contexts.
+    Import_Resolution_Index: Resolves import sources to Python modules or knit script module files and caches failed resolutions.
+    Lazy_Knit_Script_Module: Module scope that executes the statements of a side-effect free module when it is first accessed.
 
 Supporting Classes:
     Gauged_Sheet_Record: Manages sheet configurations for different gauge settings
@@ -49,6 +52,7 @@ Module System:
     - Python module integration.
     - Knit script module imports.
     - Namespace path resolution.
+    - Knit script modules executed once per context and re-imports rebound from the module registry.
 
 Error Handling:
     - Custom exceptions for invalid gauge/sheet values.
@@ -8,15 +8,19 @@ The module handles complex operations like sheet peeling, layer management, and
 
 from __future__ import annotations
 
-from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Comment_Line
-from knitout_interpreter.knitout_operations.needle_instructions import Xfer_Instruction
+from collections.abc import Iterable
+
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Comment_Line, Knitout_Line
+from knitout_interpreter.knitout_operations.needle_instructions import Needle_Instruction, Xfer_Instruction
 from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
-from virtual_knitting_machine.machine_components.needles.Sheet_Needle import Sheet_Needle, get_sheet_needle
+from virtual_knitting_machine.machine_components.needles.Sheet_Needle import Sheet_Needle
 from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 
 from knit_script.knit_script_exceptions.gauge_sheet_exceptions import Lost_Sheet_Loops_Exception, Sheet_Peeling_Blocked_Loops_Exception, Sheet_Peeling_Stacked_Loops_Exception
+from knit_script.knit_script_interpreter.Machine_State_Fingerprint import Machine_State_Fingerprint
 from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Sheet import Sheet
+from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Sheet_Needle_Table import Sheet_Needle_Table
 
 
 class Gauged_Sheet_Record:
@@ -31,6 +35,8 @@ class Gauged_Sheet_Record:
         knitting_machine (Knitting_Machine): The knitting machine being managed.
         gauge (int): The gauge value determining the number of sheets.
         sheets (list[Sheet]): List of Sheet objects, one for each gauge level.
+        layer_hash (int): Zobrist hash of the layer assignments that differ from the initial assignment, maintained as layers change.
+        layer_journal (list[tuple[int, int]] | None): The needle positions and prior layers of the layer changes made while a machine state journal has an open transaction or None if layer changes are not journaled.
     """
 
     def __init__(self, gauge: int, knitting_machine: Knitting_Machine) -> None:
@@ -47,6 +53,8 @@ class Gauged_Sheet_Record:
         self.gauge: int = gauge
         self.sheets: list[Sheet] = [Sheet(s, self.gauge, self.knitting_machine) for s in range(0, gauge)]
         self._needle_pos_to_layer: dict[int, int] = {n: n % self.gauge for n in range(0, self.knitting_machine.needle_count)}
+        self.layer_hash: int = 0
+        self.layer_journal: list[tuple[int, int]] | None = None
 
     def record_needle(self, needle: Needle) -> None:
         """Record the state of the given needle assuming it is not moved for sheets.
@@ -57,9 +65,40 @@ class Gauged_Sheet_Record:
             needle (Needle): The needle to record the state of. Can be any type of needle, which will be converted to a Sheet_Needle if necessary.
         """
         if not isinstance(needle, Sheet_Needle):
-            needle = get_sheet_needle(needle, self.gauge, needle.is_slider)
+            needle = Sheet_Needle_Table.get_sheet_needle(needle, self.gauge, needle.is_slider)
         self.sheets[needle.sheet].record_needle(needle)
 
+    def record_needles(self, needles: Iterable[Needle]) -> None:
+        """Record the state of all the given needles assuming they are not moved for sheets.
+
+        Each needle position is only recorded once, in the order of its last occurrence in the given needles, so the result matches recording each needle in order.
+
+        Args:
+            needles (Iterable[Needle]): The needles to record the state of. Needles that are not Sheet_Needles will be converted to Sheet_Needles.
+        """
+        last_needle_at_position: dict[tuple[int, bool], Needle] = {}
+        for needle in needles:
+            key = (needle.position, needle.is_slider)
+            if key in last_needle_at_position:
+                del last_needle_at_position[key]
+            last_needle_at_position[key] = needle
+        for needle in last_needle_at_position.values():
+            self.record_needle(needle)
+
+    def record_instructions(self, instructions: Iterable[Knitout_Line]) -> None:
+        """Record the state of all needles operated on by the given instructions after they have been executed.
+
+        Args:
+            instructions (Iterable[Knitout_Line]): The executed knitout lines. Lines that are not needle instructions are ignored.
+        """
+        recorded_needles: list[Needle] = []
+        for instruction in instructions:
+            if isinstance(instruction, Needle_Instruction):
+                recorded_needles.append(instruction.needle)
+                if isinstance(instruction.needle_2, Needle) and instruction.needle_2.position != instruction.needle.position:
+                    recorded_needles.append(instruction.needle_2)
+        self.record_needles(recorded_needles)
+
     def peel_sheet_relative_to_active_sheet(self, active_sheet: int) -> tuple[list[Knitout_Comment_Line | Xfer_Instruction], list[int]]:
         """Move loops out of the way of the active sheet based on needle layer positions.
 
@@ -80,15 +119,15 @@ class Gauged_Sheet_Record:
         peel_order_to_needles: dict[int, list[Needle]] = {i: [] for i in range(0, self.gauge)}
         same_layer_needles: list[int] = []
 
+        front_needles = self.knitting_machine.front_needles()
+        back_needles = self.knitting_machine.back_needles()
         for needle_pos, needle_layer in self._needle_pos_to_layer.items():
-            back_needle = self.knitting_machine[Needle(False, needle_pos)]
-            back_sheet_needle = get_sheet_needle(back_needle, self.gauge)
-            front_needle = self.knitting_machine[Needle(True, needle_pos)]
-            sheet_of_needle = back_sheet_needle.sheet
-            sheet_pos = back_sheet_needle.sheet_pos
+            back_needle = back_needles[needle_pos]
+            front_needle = front_needles[needle_pos]
+            sheet_pos = Sheet_Needle.get_sheet_pos(needle_pos, self.gauge)
+            sheet_of_needle = Sheet_Needle.get_sheet(needle_pos, sheet_pos, self.gauge)
             if (back_needle.has_loops or front_needle.has_loops) and sheet_of_needle != active_sheet:
-                active_sheet_needle = Sheet_Needle(True, sheet_pos, active_sheet, self.gauge)
-                active_sheet_layer = self._needle_pos_to_layer[active_sheet_needle.position]
+                active_sheet_layer = self._needle_pos_to_layer[Sheet_Needle.get_actual_pos(sheet_pos, active_sheet, self.gauge)]
                 if active_sheet_layer == needle_layer:
                     same_layer_needles.append(needle_pos)
                 if needle_layer < active_sheet_layer and back_needle.has_loops:  # needle is in front of the active sheet but has loops on the back.
@@ -129,7 +168,7 @@ class Gauged_Sheet_Record:
         sheet = self.sheets[sheet_id]
 
         for f, b in zip(self.front_needles(sheet_id), self.back_needles(sheet_id), strict=False):
-            sheet_needle = get_sheet_needle(f, self.gauge)
+            sheet_needle = Sheet_Needle_Table.get_sheet_needle(f, self.gauge)
             front_had_loops, back_had_loops = sheet.loop_record[sheet_needle.position]
             had_loops = front_had_loops or back_had_loops
             has_loops = f.has_loops or b.has_loops
@@ -186,9 +225,9 @@ class Gauged_Sheet_Record:
         if isinstance(needle_pos, Sheet_Needle):
             sheet_needle = needle_pos
         elif isinstance(needle_pos, Needle):
-            sheet_needle = get_sheet_needle(needle_pos, self.gauge)
+            sheet_needle = Sheet_Needle_Table.get_sheet_needle(needle_pos, self.gauge)
         else:
-            sheet_needle = get_sheet_needle(Needle(True, needle_pos), self.gauge)
+            sheet_needle = Sheet_Needle_Table.get_sheet_needle_at_position(True, needle_pos, self.gauge)
         return [s.get_matching_sheet_needle(sheet_needle) for s in self.sheets]
 
     def set_layer_position(self, needle_pos: int | Needle, layer_value: int, push_forward: bool = True, push_backward: bool = False, swap: bool = False) -> None:
@@ -213,10 +252,10 @@ class Gauged_Sheet_Record:
             sheet_needle = needle_pos
             needle_pos = needle_pos.position
         elif isinstance(needle_pos, Needle):
-            sheet_needle = get_sheet_needle(needle_pos, self.gauge)
+            sheet_needle = Sheet_Needle_Table.get_sheet_needle(needle_pos, self.gauge)
             needle_pos = needle_pos.position
         else:
-            sheet_needle = get_sheet_needle(Needle(True, needle_pos), self.gauge)
+            sheet_needle = Sheet_Needle_Table.get_sheet_needle_at_position(True, needle_pos, self.gauge)
         sheet_needles = self.sheet_needles_at_needle_position(needle_pos)
         sheet_needles_current_layers = {sn: self.get_layer_at_position(sn) for sn in sheet_needles}
         sheet_needle_with_target_layer = None
@@ -254,8 +293,8 @@ class Gauged_Sheet_Record:
             position_b = position_b.position
         a_layer = self.get_layer_at_position(position_a)
         b_layer = self.get_layer_at_position(position_b)
-        self._needle_pos_to_layer[position_a] = b_layer
-        self._needle_pos_to_layer[position_b] = a_layer
+        self._set_layer(position_a, b_layer)
+        self._set_layer(position_b, a_layer)
 
     def push_layer_backward(self, needle_position: int | Needle, pushed_layers: int = 1) -> None:
         """Change the layer positions of needles at the sheet positions relative to the given needle position.
@@ -278,7 +317,34 @@ class Gauged_Sheet_Record:
         for sheet_needle, current_layer in sheet_needles_current_layers.items():
             rotated_sheet_index = (sheet_needle.sheet + pushed_layers) % self.gauge
             rotated_sheet_needle = sheet_needles[rotated_sheet_index]
-            self._needle_pos_to_layer[rotated_sheet_needle.position] = current_layer
+            self._set_layer(rotated_sheet_needle.position, current_layer)
+
+    def _set_layer(self, needle_pos: int, layer: int) -> None:
+        """Set the layer at a needle position and update the layer hash.
+
+        Args:
+            needle_pos (int): The needle position to set the layer of.
+            layer (int): The layer to assign to the needle position.
+        """
+        if self.layer_journal is not None:
+            self.layer_journal.append((needle_pos, self._needle_pos_to_layer[needle_pos]))
+        self.layer_hash ^= Machine_State_Fingerprint.zobrist_key("layer", needle_pos, self._needle_pos_to_layer[needle_pos]) ^ Machine_State_Fingerprint.zobrist_key("layer", needle_pos, layer)
+        self._needle_pos_to_layer[needle_pos] = layer
+
+    def rollback_layers(self, change_count: int) -> None:
+        """Undo the layer changes recorded in the layer journal after the given number of changes.
+
+        Args:
+            change_count (int): The number of changes in the layer journal to keep.
+        """
+        layer_journal = self.layer_journal
+        if layer_journal is None:
+            return
+        self.layer_journal = None
+        for needle_pos, layer in reversed(layer_journal[change_count:]):
+            self._set_layer(needle_pos, layer)
+        del layer_journal[change_count:]
+        self.layer_journal = layer_journal
 
     def push_layer_forward(self, needle_position: int, pushed_layers: int = 1) -> None:
         """Change the layer positions of needles at the sheet positions relative to the given needle position.
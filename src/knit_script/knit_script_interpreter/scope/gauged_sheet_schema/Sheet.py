@@ -17,6 +17,7 @@ from virtual_knitting_machine.machine_components.needles.Sheet_Needle import She
 from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 
 from knit_script.knit_script_exceptions.gauge_sheet_exceptions import Sheet_Value_Exception
+from knit_script.knit_script_interpreter.scope.gauged_sheet_schema.Sheet_Needle_Table import Sheet_Needle_Table
 
 
 class Sheet:
@@ -52,6 +53,7 @@ class Sheet:
             raise Sheet_Value_Exception(sheet_number, gauge)
         self.gauge = gauge
         self.sheet_number = sheet_number
+        self._needle_table: Sheet_Needle_Table = Sheet_Needle_Table.get_table(sheet_number, gauge)
         # in-sheet needle position -> Recorded loop on Front, Recorded loop on Back
         self.loop_record: dict[int, tuple[bool, bool]] = {f.position: (f.has_loops, b.has_loops) for f, b in zip(self.front_needles(), self.back_needles(), strict=False)}
 
@@ -89,7 +91,7 @@ class Sheet:
     def sheet_needle(self, is_front: bool, in_sheet_position: int, is_slider: bool = False) -> Sheet_Needle:
         """Get a Sheet_Needle from this sheet set with the given parameters.
 
-        Creates a sheet needle object that belongs to this sheet with the specified characteristics. The needle will be positioned according to the sheet's gauge configuration.
+        Gets the sheet needle that belongs to this sheet with the specified characteristics from the flyweight table of this sheet. The needle will be positioned according to the sheet's gauge configuration.
 
         Args:
             is_front (bool): If True, return a needle on the front bed. Otherwise, return a back-bed needle.
@@ -99,9 +101,7 @@ class Sheet:
         Returns:
             Sheet_Needle: A Sheet_Needle from this sheet with the specified parameters, properly configured for the sheet's gauge and position.
         """
-        if is_slider:
-            return Slider_Sheet_Needle(is_front, in_sheet_position, self.sheet_number, self.gauge)
-        return Sheet_Needle(is_front, in_sheet_position, self.sheet_number, self.gauge)
+        return self._needle_table.sheet_needle(is_front, in_sheet_position, is_slider)
 
     def get_matching_sheet_needle(self, other_sheet_needle: Sheet_Needle) -> Sheet_Needle:
         """Get a sheet needle belonging to this sheet at the same sheet position as a given sheet needle.
@@ -311,10 +311,7 @@ class Sheet_Identifier:
         pos = needle.position
         if isinstance(needle, Sheet_Needle):
             pos = needle.sheet_pos
-        if isinstance(needle, Slider_Needle):
-            return Slider_Sheet_Needle(needle.is_front, pos, self.sheet, self.gauge)
-        else:
-            return Sheet_Needle(needle.is_front, pos, self.sheet, self.gauge)
+        return Sheet_Needle_Table.get_table(self.sheet, self.gauge).sheet_needle(needle.is_front, pos, isinstance(needle, Slider_Needle))
 
     def needle(self, is_front: bool, position: int) -> Sheet_Needle:
         """
@@ -323,7 +320,7 @@ class Sheet_Identifier:
         :param position: position within the sheet
         :return: the specified sheet needle
         """
-        return Sheet_Needle(is_front, position, self.sheet, self.gauge)
+        return Sheet_Needle_Table.get_table(self.sheet, self.gauge).sheet_needle(is_front, position)
 
     def __str__(self) -> str:
         return f"s{self.sheet}:g{self.gauge}"
@@ -0,0 +1,105 @@
+"""Module containing the Sheet_Needle_Table class.
+
+This module provides the Sheet_Needle_Table class, a flyweight table of the sheet needles in one sheet of a gauging schema.
+Sheet needles are converted from needle positions whenever instructions are recorded on sheets, sheets are peeled, or needles are accessed in a gauge.
+The tables are shared by all sheets with the same sheet and gauge values so that these conversions do not allocate new needles.
+"""
+
+from __future__ import annotations
+
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+from virtual_knitting_machine.machine_components.needles.Sheet_Needle import Sheet_Needle, Slider_Sheet_Needle
+
+
+class Sheet_Needle_Table:
+    """Flyweight table of the sheet needles in a sheet at a given gauge.
+
+    The table holds one list of needles for each combination of bed and slider, indexed by the position of the needle in the sheet.
+    The lists are filled on first use up to the largest position requested, so later requests for needles in the sheet are answered by indexing.
+    Sheet needles are only used to identify needle positions; the machine state holds its own needle instances with the loops, so the table's needles are never modified.
+
+    Attributes:
+        sheet (int): The sheet of the needles in the table.
+        gauge (int): The gauge of the needles in the table.
+    """
+
+    _TABLES: dict[tuple[int, int], Sheet_Needle_Table] = {}  # Shared tables keyed by sheet and gauge.
+    _MAX_TABLE_SIZE: int = 2048  # Positions beyond this are off any supported bed and are not stored in the table.
+
+    def __init__(self, sheet: int, gauge: int) -> None:
+        """Initialize an empty table of sheet needles.
+
+        Args:
+            sheet (int): The sheet of the needles in the table.
+            gauge (int): The gauge of the needles in the table.
+        """
+        self.sheet: int = sheet
+        self.gauge: int = gauge
+        self._needles: tuple[tuple[list[Sheet_Needle], list[Sheet_Needle]], tuple[list[Sheet_Needle], list[Sheet_Needle]]] = (([], []), ([], []))  # indexed by is_front, then is_slider.
+
+    @staticmethod
+    def get_table(sheet: int, gauge: int) -> Sheet_Needle_Table:
+        """
+        Args:
+            sheet (int): The sheet of the needles in the table.
+            gauge (int): The gauge of the needles in the table.
+
+        Returns:
+            Sheet_Needle_Table: The shared table of sheet needles for the given sheet and gauge.
+        """
+        key = (sheet, gauge)
+        table = Sheet_Needle_Table._TABLES.get(key)
+        if table is None:
+            table = Sheet_Needle_Table(sheet, gauge)
+            Sheet_Needle_Table._TABLES[key] = table
+        return table
+
+    @staticmethod
+    def get_sheet_needle(needle: Needle, gauge: int, is_slider: bool = False) -> Sheet_Needle:
+        """Convert a needle to the sheet needle at the same position in the given gauge.
+
+        Args:
+            needle (Needle): The needle to convert.
+            gauge (int): The gauge of the sheet needle.
+            is_slider (bool, optional): If True, return a slider needle. Defaults to False.
+
+        Returns:
+            Sheet_Needle: The sheet needle at the position of the given needle.
+        """
+        return Sheet_Needle_Table.get_sheet_needle_at_position(needle.is_front, needle.position, gauge, is_slider)
+
+    @staticmethod
+    def get_sheet_needle_at_position(is_front: bool, position: int, gauge: int, is_slider: bool = False) -> Sheet_Needle:
+        """Get the sheet needle at a needle position in the given gauge.
+
+        Args:
+            is_front (bool): If True, return a needle on the front bed. Otherwise, return a back-bed needle.
+            position (int): The position of the needle on the bed.
+            gauge (int): The gauge of the sheet needle.
+            is_slider (bool, optional): If True, return a slider needle. Defaults to False.
+
+        Returns:
+            Sheet_Needle: The sheet needle at the given needle position.
+        """
+        sheet_pos = Sheet_Needle.get_sheet_pos(position, gauge)
+        sheet = Sheet_Needle.get_sheet(position, sheet_pos, gauge)
+        return Sheet_Needle_Table.get_table(sheet, gauge).sheet_needle(is_front, sheet_pos, is_slider)
+
+    def sheet_needle(self, is_front: bool, sheet_pos: int, is_slider: bool = False) -> Sheet_Needle:
+        """
+        Args:
+            is_front (bool): If True, return a needle on the front bed. Otherwise, return a back-bed needle.
+            sheet_pos (int): The position of the needle in the sheet.
+            is_slider (bool, optional): If True, return a slider needle. Defaults to False.
+
+        Returns:
+            Sheet_Needle: The sheet needle in this sheet with the given parameters.
+        """
+        needles = self._needles[is_front][is_slider]
+        if 0 <= sheet_pos < len(needles):
+            return needles[sheet_pos]
+        needle_class = Slider_Sheet_Needle if is_slider else Sheet_Needle
+        if sheet_pos < 0 or sheet_pos >= Sheet_Needle_Table._MAX_TABLE_SIZE:  # Positions off the bed are not stored.
+            return needle_class(is_front, sheet_pos, self.sheet, self.gauge)
+        needles.extend(needle_class(is_front, pos, self.sheet, self.gauge) for pos in range(len(needles), sheet_pos + 1))
+        return needles[sheet_pos]
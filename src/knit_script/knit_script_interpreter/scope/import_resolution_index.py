@@ -0,0 +1,116 @@
+"""Index used to resolve the modules named by import statements in a knit script context.
+
+This module provides the Import_Resolution_Index class, which resolves the source of an import statement to a Python module or to the path of a knit script module file.
+The names of the modules in the knit script standard library and the knit script files in each importing directory are listed once, so repeated imports are resolved by dictionary lookups.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+from knit_script import knit_script_std_library
+from knit_script.knit_script_std_library import get_ks_library_path
+
+
+class Import_Resolution_Index:
+    """Resolves import sources to Python modules or knit script module files and remembers each resolution, including failed ones.
+
+    Sources are resolved in the priority order of import statements:
+    1. A Python module with the exact name.
+    2. A Python module in the knit script standard library.
+    3. A knit script file in the directory of the importing program.
+    4. A knit script file in the knit script standard library.
+
+    The knit script standard library is listed when the index is created and the directory of an importing program is listed the first time a program in that directory imports a knit script file.
+    Python modules that are already imported are found in sys.modules and other Python modules are located with their import spec instead of catching the errors raised by failed imports.
+    Sources that could not be resolved are kept in a negative cache, so a failed import is only searched for once per context.
+
+    Note:
+        Files that are added to a directory after it was listed are not found by imports in the same context.
+
+    Attributes:
+        _std_library_path (str): The path to the directory of the knit script standard library.
+        _std_library_package (str): The name of the Python package of the knit script standard library.
+        _std_library_python_modules (frozenset[str]): The names of the Python modules and packages in the knit script standard library.
+        _directory_ks_files (dict[str, frozenset[str]]): The names of the knit script files in each listed directory, keyed by the path to the directory.
+        _missing_python_modules (set[str]): The names of Python modules that could not be imported.
+        _resolutions (dict[tuple[str | None, str], ModuleType | str | None]): The resolved module, module file path, or None for unresolved sources, keyed by the directory of the importing program and the source.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index by listing the knit script standard library."""
+        self._std_library_path: str = get_ks_library_path()
+        self._std_library_package: str = knit_script_std_library.__name__
+        self._directory_ks_files: dict[str, frozenset[str]] = {}
+        self._std_library_python_modules: frozenset[str] = frozenset(
+            entry.name.removesuffix(".py")
+            for entry in os.scandir(self._std_library_path)
+            if (entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py") or (entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")))
+        )
+        self._missing_python_modules: set[str] = set()
+        self._resolutions: dict[tuple[str | None, str], ModuleType | str | None] = {}
+
+    def _ks_files(self, directory: str) -> frozenset[str]:
+        """
+        Args:
+            directory (str): The path to a directory that knit script files may be imported from. An empty path refers to the current working directory.
+
+        Returns:
+            frozenset[str]: The names of the knit script files in the directory. The directory is only listed the first time it is searched.
+        """
+        ks_files = self._directory_ks_files.get(directory)
+        if ks_files is None:
+            try:
+                ks_files = frozenset(entry.name for entry in os.scandir(directory if directory != "" else os.curdir) if entry.name.endswith(".ks") and entry.is_file())
+            except OSError:  # The directory does not exist or cannot be listed.
+                ks_files = frozenset()
+            self._directory_ks_files[directory] = ks_files
+        return ks_files
+
+    def _python_module(self, module_name: str) -> ModuleType | None:
+        """
+        Args:
+            module_name (str): The full name of a Python module.
+
+        Returns:
+            ModuleType | None: The imported Python module or None if no module with the given name can be imported.
+        """
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        elif module_name in self._missing_python_modules:
+            return None
+        try:
+            if importlib.util.find_spec(module_name) is not None:
+                return importlib.import_module(module_name)
+        except (ImportError, ValueError, AttributeError):  # A parent of the module is not a package or the module raised an import error while importing.
+            pass
+        self._missing_python_modules.add(module_name)
+        return None
+
+    def resolve(self, source: str, local_path: str | None) -> ModuleType | str | None:
+        """
+        Args:
+            source (str): The name or dot-separated path of the module to import.
+            local_path (str | None): The path to the directory of the importing program or None if the program was not parsed from a file.
+
+        Returns:
+            ModuleType | str | None: The Python module, the path to the knit script module file, or None if no module can be found for the source.
+        """
+        key = (local_path, source)
+        if key in self._resolutions:
+            return self._resolutions[key]
+        ks_file = f"{source}.ks"
+        resolution: ModuleType | str | None = self._python_module(source)
+        if resolution is None and source.split(".", 1)[0] in self._std_library_python_modules:
+            resolution = self._python_module(f"{self._std_library_package}.{source}")
+        if resolution is None and local_path is not None and ks_file in self._ks_files(local_path):
+            resolution = os.path.join(local_path, ks_file)
+        if resolution is None and ks_file in self._ks_files(self._std_library_path):
+            resolution = os.path.join(self._std_library_path, ks_file)
+        self._resolutions[key] = resolution
+        return resolution
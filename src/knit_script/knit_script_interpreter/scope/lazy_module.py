@@ -0,0 +1,70 @@
+"""Scope of a knit script module whose statements are executed on first access.
+
+This module provides the Lazy_Knit_Script_Module class, a module scope that is bound by an import statement before the module's statements are executed.
+Libraries of knit script functions are often imported for a single function, so modules without side effects defer executing their declarations until an attribute of the module is first accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+
+if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+    from knit_script.knit_script_interpreter.statements.Statement import Statement
+
+
+class Lazy_Knit_Script_Module(Knit_Script_Scope):
+    """A module scope that executes the statements of its module the first time an attribute of the module is accessed.
+
+    The scope is created as a child of the scope that imported the module, so once the statements are executed, the module's declarations resolve names exactly as they would in an eagerly imported module.
+
+    Note:
+        Only modules whose top level has no side effects (see Module_Laziness) are imported lazily, so deferring the execution of the module only changes when errors raised by its top level are reported.
+
+    Attributes:
+        _pending_statements (list[Statement] | None): The statements of the module that have not been executed yet or None if the module has been loaded.
+    """
+
+    def __init__(self, context: Knit_Script_Context, parent: Knit_Script_Scope, name: str, statements: list[Statement]):
+        """Initialize the scope of a module that has not been executed.
+
+        Args:
+            context (Knit_Script_Context): The execution context for this scope.
+            parent (Knit_Script_Scope): The scope that imports the module.
+            name (str): The name of the module.
+            statements (list[Statement]): The statements of the module to execute when the module is first accessed.
+        """
+        super().__init__(context, parent, name=name, is_module=True)
+        self._pending_statements: list[Statement] | None = statements
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Returns:
+            bool: True if the statements of the module have been executed.
+        """
+        return self._pending_statements is None
+
+    def load(self) -> None:
+        """Execute the statements of the module in this scope if they have not been executed yet.
+
+        The current scope of the context is restored after the module is executed.
+        If executing the module raises an error, the module is executed again the next time it is accessed, just as a failed import is executed again by the next import statement.
+        """
+        if self._pending_statements is None:
+            return
+        statements = self._pending_statements
+        self._pending_statements = None
+        accessing_scope = self._context.variable_scope
+        self._context.variable_scope = self
+        Knit_Script_Scope.invalidate_cached_resolutions()
+        try:
+            self._context.execute_statements(statements)
+        except BaseException:
+            self._pending_statements = statements
+            raise
+        finally:
+            self._context.variable_scope = accessing_scope
+            Knit_Script_Scope.invalidate_cached_resolutions()
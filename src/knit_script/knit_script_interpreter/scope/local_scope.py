@@ -38,6 +38,9 @@ class Knit_Script_Scope:
     """
 
     _SCOPE_COUNT: int = 0
+    _SCOPE_VERSION: int = 0  # Incremented whenever the active scope of a context is replaced by a scope outside its hierarchy.
+    _NAME_VERSIONS: dict[str, int] = {}  # Incremented per variable name whenever a variable by that name is declared or deleted or a scope that holds it is exited.
+    _PYTHON_SCOPE_LOOKUPS: dict[str, tuple[Any | None, bool]] = {}  # Memo of names resolved from the python scope.
 
     def __init__(
         self,
@@ -71,6 +74,7 @@ class Knit_Script_Scope:
         self._return_value: Any | None = None
         self._name: str | None = name
         self._parent: Knit_Script_Scope | None = parent
+        self.depth: int = 0 if parent is None else parent.depth + 1
         assert module_scope is None or module_scope.is_module, f"Expected Module for module scope but got {module_scope}"
         self._module_scope: Knit_Script_Scope | None = module_scope
         if self._parent is None:
@@ -322,6 +326,7 @@ class Knit_Script_Scope:
             if name is None:
                 raise NameError("Modules must be named")
             self._variables[name] = self._child_scope
+            Knit_Script_Scope._structure_changed(name)
         return self._child_scope
 
     def collapse_descendant_scopes(self) -> None:
@@ -357,8 +362,36 @@ class Knit_Script_Scope:
             else:
                 self.machine_scope.update_parent_machine_scope(self._parent.machine_scope)
             self._parent._child_scope = None
+        for variable_name in vars(self._variables):  # Variables in this scope are no longer accessible.
+            Knit_Script_Scope._structure_changed(variable_name)
         return self._parent
 
+    @staticmethod
+    def scope_version(variable_name: str) -> int:
+        """
+        Args:
+            variable_name (str): The name of the variable that a cached resolution was made for.
+
+        Returns:
+            int: A counter that increases whenever a variable by the given name is declared or deleted, a scope holding that variable is exited, or the active scope is replaced.
+            Variable resolutions that were cached at a given scope version remain valid until this value changes.
+        """
+        return Knit_Script_Scope._SCOPE_VERSION + Knit_Script_Scope._NAME_VERSIONS.get(variable_name, 0)
+
+    @staticmethod
+    def invalidate_cached_resolutions() -> None:
+        """Invalidate all cached variable resolutions. This must be called when the active scope of a context is replaced by a scope that was not entered from it."""
+        Knit_Script_Scope._SCOPE_VERSION += 1
+
+    @staticmethod
+    def _structure_changed(variable_name: str) -> None:
+        """Invalidate the cached resolutions of the given variable name by incrementing its scope version.
+
+        Args:
+            variable_name (str): The name of the variable that was declared or deleted or is no longer accessible.
+        """
+        Knit_Script_Scope._NAME_VERSIONS[variable_name] = Knit_Script_Scope._NAME_VERSIONS.get(variable_name, 0) + 1
+
     @staticmethod
     def get_value_from_python_scope(key: str) -> tuple[Any | None, bool]:
         """Test if key can be accessed from python scope.
@@ -370,12 +403,18 @@ class Knit_Script_Scope:
 
         Returns:
             tuple[Any | None, bool]: A tuple containing the value from python and True if value was in python scope, otherwise None and False.
+
+        Note:
+            The python scope is fixed for the life of the interpreter, so results are memoized by key to avoid repeated evaluation.
         """
-        try:
-            value = eval(key)
-            return value, True
-        except NameError:
-            return None, False
+        lookup = Knit_Script_Scope._PYTHON_SCOPE_LOOKUPS.get(key)
+        if lookup is None:
+            try:
+                lookup = eval(key), True
+            except NameError:
+                lookup = None, False
+            Knit_Script_Scope._PYTHON_SCOPE_LOOKUPS[key] = lookup
+        return lookup
 
     def set_global(self, key: str, value: Any) -> None:
         """
@@ -386,6 +425,8 @@ class Knit_Script_Scope:
             key (str): The name of the global variable to set.
             value (Any): The value of the global variable.
         """
+        if key not in self._globals:
+            Knit_Script_Scope._structure_changed(key)
         self._globals[key] = value
 
     def add_local_by_path(self, path: list[str], value: Any) -> None:
@@ -412,6 +453,28 @@ class Knit_Script_Scope:
                 scope = module_scope
         scope[path[-1]] = value  # Use the last element of the path as a variable name and set its value.
 
+    def declare_local(self, variable_name: str, value: Any) -> Variable_Space:
+        """Set a local variable in this scope and return the variable space that holds it.
+
+        Loops use the returned variable space to rebind their iteration variables on each iteration without resolving the variable name again.
+
+        Args:
+            variable_name (str): Variable name to set. Must not be the name of a machine scope property.
+            value (Any): Value to set the variable to.
+
+        Returns:
+            Variable_Space: The variable space of this scope.
+        """
+        if variable_name not in self._variables:
+            Knit_Script_Scope._structure_changed(variable_name)
+        self._variables[variable_name] = value
+        return self._variables
+
+    def clear_return(self) -> None:
+        """Clear the return value of this scope so that it can execute another iteration of a loop body as if it were a new scope."""
+        self._returned = False
+        self._return_value = None
+
     def has_local(self, key: str, stop_at_function: bool = False, stop_at_module: bool = False) -> bool:
         """Check for key in local scope. Ignores globals.
 
@@ -445,6 +508,7 @@ class Knit_Script_Scope:
         while scope is not None:
             if key in scope._variables:
                 del scope._variables[key]
+                Knit_Script_Scope._structure_changed(key)
                 return
             scope = scope._parent
         raise NameError(f"Variable {key} is not in scope. Could not be deleted")
@@ -524,8 +588,12 @@ class Knit_Script_Scope:
             while variable_name not in self:
                 assert scope._parent is not None
                 scope = scope._parent
+            if variable_name not in scope._variables:
+                Knit_Script_Scope._structure_changed(variable_name)
             scope._variables[variable_name] = value
         else:  # set at lowest scope level
+            if variable_name not in self._variables:
+                Knit_Script_Scope._structure_changed(variable_name)
             self._variables[variable_name] = value
 
     def __delitem__(self, key: str) -> None:
@@ -533,6 +601,28 @@ class Knit_Script_Scope:
             self.delete_local(key)
         elif key in self._globals:
             del self._globals[key]
+            Knit_Script_Scope._structure_changed(key)
+
+    def resolved_variable_space(self, variable_name: str) -> Variable_Space | None:
+        """Find the variable space that a lookup of the given local or global variable will read from.
+
+        This mirrors the local and global resolution order of __getitem__ so that callers can cache the variable space until the scope version changes.
+        Machine scope and python scope variables are not considered.
+
+        Args:
+            variable_name (str): The variable name to search for.
+
+        Returns:
+            Variable_Space | None:
+                The variable space holding the variable or None if the variable is not in scope or the lookup would warn that a local variable shadows a global variable.
+        """
+        is_global = variable_name in self._globals
+        scope: Knit_Script_Scope | None = self
+        while scope is not None:
+            if variable_name in scope._variables:
+                return None if is_global else scope._variables
+            scope = scope._parent
+        return self._globals if is_global else None
 
     def __hash__(self) -> int:
         return self._scope_id
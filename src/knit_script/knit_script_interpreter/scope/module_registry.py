@@ -0,0 +1,170 @@
+"""Registry of the knit script modules imported into a knit script context.
+
+This module provides the Knit_Script_Module_Registry class, which plays the role of Python's sys.modules for knit script modules.
+Each context executes a knit script module file at most once and later imports of the same file rebind the scope of that module.
+The statements parsed from module files are shared by the registries of all contexts and are reused until the file changes on disk, but each context executes its own copy of them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+    from knit_script.knit_script_interpreter.ks_element import KS_Element
+    from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+    from knit_script.knit_script_interpreter.statements.Statement import Statement
+
+
+class Knit_Script_Module_Registry:
+    """Keeps track of the knit script modules imported into a context, keyed by the resolved path of the module file.
+
+    A module is registered before its statements are executed, so a module that is imported again while it is executing (i.e., a circular import) binds the partially executed module scope instead of recursing.
+    A module that raises an error while executing is removed from the registry so that a later import executes it again.
+
+    The statements of a module file are parsed once and shared by the registries of all contexts.
+    Parsed modules are keyed by the resolved path of the file and validated by the modification time and size of the file.
+    If the modification time changed, the file is read and the parsed statements are still reused if the hash of its content is unchanged.
+    The shared statements are never executed. Each registry executes a copy of them, so the caches that statements fill as they execute are not shared between contexts.
+
+    Note:
+        Module scopes are not shared between contexts because the functions and variables declared in a module resolve names in the scope of the context that imported it.
+        A module file that changes on disk while a context is executing is not imported again in that context, but the change is parsed and executed by the next context that imports it.
+
+    Attributes:
+        _modules (dict[str, Knit_Script_Scope]): The scopes of the modules imported into the context, keyed by the resolved path of the module file.
+        _resolved_paths (dict[str, str]): The resolved path of each module file path that has been looked up, so repeated imports do not resolve symbolic links again.
+        _module_statements (dict[str, tuple[list[Statement], list[Statement]]]): The shared statements of each parsed module and this registry's copy of them, keyed by the resolved path of the module file.
+    """
+
+    _PARSED_MODULES: dict[str, tuple[int, int, str, list[Statement]]] = {}  # Modification time, size, content hash, and statements of parsed module files, ordered from least to most recently used.
+    _MAX_PARSED_MODULES: int = 64  # The least recently used modules are evicted beyond this count.
+
+    def __init__(self) -> None:
+        """Initialize an empty module registry."""
+        self._modules: dict[str, Knit_Script_Scope] = {}
+        self._resolved_paths: dict[str, str] = {}
+        self._module_statements: dict[str, tuple[list[Statement], list[Statement]]] = {}
+
+    @staticmethod
+    def resolved_path(path: str) -> str:
+        """
+        Args:
+            path (str): The path to a knit script module file.
+
+        Returns:
+            str: The absolute path to the module file with symbolic links resolved, which identifies the module in the registry.
+        """
+        return os.path.realpath(path)
+
+    def _module_key(self, path: str) -> str:
+        """
+        Args:
+            path (str): The path to a knit script module file.
+
+        Returns:
+            str: The resolved path that identifies the module in the registry. Paths are only resolved the first time they are looked up.
+        """
+        resolved_path = self._resolved_paths.get(path)
+        if resolved_path is None:
+            resolved_path = self.resolved_path(path)
+            self._resolved_paths[path] = resolved_path
+        return resolved_path
+
+    def __contains__(self, path: str) -> bool:
+        """
+        Args:
+            path (str): The path to a knit script module file.
+
+        Returns:
+            bool: True if the module at the given path has been imported into this registry's context.
+        """
+        return self._module_key(path) in self._modules
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of modules imported into this registry's context.
+        """
+        return len(self._modules)
+
+    def module(self, path: str) -> Knit_Script_Scope | None:
+        """
+        Args:
+            path (str): The path to a knit script module file.
+
+        Returns:
+            Knit_Script_Scope | None: The scope of the module imported from the given path or None if the module has not been imported into this registry's context.
+        """
+        return self._modules.get(self._module_key(path))
+
+    def register_module(self, path: str, module: Knit_Script_Scope) -> None:
+        """Register the scope of a module that is imported from the given path.
+
+        Args:
+            path (str): The path to the knit script module file.
+            module (Knit_Script_Scope): The scope that the module's statements are executed in.
+        """
+        self._modules[self._module_key(path)] = module
+
+    def unregister_module(self, path: str) -> None:
+        """Remove the module imported from the given path so that the next import executes the module again.
+
+        Args:
+            path (str): The path to the knit script module file.
+        """
+        self._modules.pop(self._module_key(path), None)
+
+    def parse_module(self, parser: Knit_Script_Parser, path: str) -> list[Statement]:
+        """
+        Args:
+            parser (Knit_Script_Parser): The parser used to parse the module file if it has not been parsed or has changed since it was parsed.
+            path (str): The path to the knit script module file.
+
+        Returns:
+            list[Statement]: This registry's copy of the statements parsed from the module file. The copy is reused until the shared statements of the module change.
+
+        Raises:
+            OSError: If the module file cannot be read.
+            Parsing_Exception: If the module has a knitscript syntax error.
+        """
+        resolved_path = self._module_key(path)
+        shared_statements = Knit_Script_Module_Registry._shared_statements(parser, path, resolved_path)
+        module_statements = self._module_statements.get(resolved_path)
+        if module_statements is None or module_statements[0] is not shared_statements:
+            copies: dict[int, KS_Element] = {}
+            module_statements = shared_statements, [cast("Statement", statement.copy_tree(copies=copies)) for statement in shared_statements]
+            self._module_statements[resolved_path] = module_statements
+        return module_statements[1]
+
+    @classmethod
+    def _shared_statements(cls, parser: Knit_Script_Parser, path: str, resolved_path: str) -> list[Statement]:
+        """
+        Args:
+            parser (Knit_Script_Parser): The parser used to parse the module file if it has not been parsed or has changed since it was parsed.
+            path (str): The path to the knit script module file.
+            resolved_path (str): The resolved path to the knit script module file.
+
+        Returns:
+            list[Statement]: The statements parsed from the module file that are shared by all registries.
+
+        Raises:
+            OSError: If the module file cannot be read.
+            Parsing_Exception: If the module has a knitscript syntax error.
+        """
+        file_stats = os.stat(resolved_path)
+        parsed_module = cls._PARSED_MODULES.pop(resolved_path, None)
+        if parsed_module is not None and parsed_module[0] == file_stats.st_mtime_ns and parsed_module[1] == file_stats.st_size:
+            cls._PARSED_MODULES[resolved_path] = parsed_module
+            return parsed_module[3]
+        with open(resolved_path, "rb") as module_file:
+            content = module_file.read()
+        content_hash = hashlib.sha256(content).hexdigest()
+        # A file that was touched without changing its content is not parsed again.
+        statements = parsed_module[3] if parsed_module is not None and parsed_module[2] == content_hash else parser.parse(path, pattern_is_file=True)
+        cls._PARSED_MODULES[resolved_path] = (file_stats.st_mtime_ns, file_stats.st_size, content_hash, statements)
+        while len(cls._PARSED_MODULES) > cls._MAX_PARSED_MODULES:
+            del cls._PARSED_MODULES[next(iter(cls._PARSED_MODULES))]
+        return statements
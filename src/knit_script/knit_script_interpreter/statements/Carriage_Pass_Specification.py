@@ -4,11 +4,13 @@ This module provides the Carriage_Pass_Specification class, which coordinates th
 It ensures proper sequencing, compatibility checking, and execution of operations while handling complex scenarios like all-needle operations and drop pass separation.
 """
 
+from __future__ import annotations
+
 import warnings
 
 from knitout_interpreter.knitout_operations.knitout_instruction import Knitout_Instruction_Type
 from knitout_interpreter.knitout_operations.knitout_instruction_factory import build_instruction
-from knitout_interpreter.knitout_operations.needle_instructions import Needle_Instruction
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
 from knitout_interpreter.knitout_operations.Rack_Instruction import Rack_Instruction
 from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
@@ -20,6 +22,62 @@ from knit_script.knit_script_interpreter.Machine_Specification import Machine_Be
 from knit_script.knit_script_warnings.Knit_Script_Warning import Repeated_Needle_Warning
 
 
+class _Carriage_Pass_Plan:
+    """The validated plan of a carriage pass that is shared by all carriage pass specifications with the same instructions on needles at the same positions.
+
+    Plans refer to the needles of a pass by their index in the pass, so a plan does not hold the needles, loops, or machine of the pass that created it.
+
+    Attributes:
+        drop_indices (list[int]): The indices of the needles whose drop operations are separated into a drop pass.
+        kept_indices (list[int]): The indices of the needles whose instructions are not separated into the drop pass.
+        instruction_types (set[Knitout_Instruction_Type]): Set of all instruction types in the pass.
+        knitting_pass (bool): True if the pass includes knitting operations.
+        require_second (bool): True if any instruction requires a second needle.
+        ordered_needles (dict[tuple[Carriage_Pass_Direction, int], tuple[list[int], bool, list[int]]]):
+            The indices of the kept needles in pass order, whether the pass requires all-needle racking, and the indices of the repeated needles, keyed by the direction and racking of the pass.
+    """
+
+    def __init__(self, instructions: tuple[Knitout_Instruction_Type, ...], undirected: bool, is_drop_pass: bool) -> None:
+        """Separate the drop operations from the pass and validate the compatibility of the remaining instructions.
+
+        Args:
+            instructions (tuple[Knitout_Instruction_Type, ...]): The instruction to perform on each needle of the pass, in the order of the needles.
+            undirected (bool): True if the pass was specified without a direction.
+            is_drop_pass (bool): True if this is a specialized drop-only pass.
+
+        Raises:
+            Incompatible_In_Carriage_Pass_Exception: If incompatible instruction types are specified for the same pass.
+            Required_Direction_Exception: If a direction-dependent instruction is specified without providing a direction.
+        """
+        self.drop_indices: list[int] = []
+        if not is_drop_pass:  # extract drop operations
+            self.drop_indices = [i for i, instruction_type in enumerate(instructions) if instruction_type is Knitout_Instruction_Type.Drop]
+        if len(self.drop_indices) > 0:
+            self.kept_indices: list[int] = [i for i, instruction_type in enumerate(instructions) if instruction_type is not Knitout_Instruction_Type.Drop]
+        else:
+            self.kept_indices = list(range(len(instructions)))
+        self.instruction_types: set[Knitout_Instruction_Type] = set()
+        first_instruction_type = None
+        self.knitting_pass: bool = False
+        self.require_second: bool = False
+
+        for i in self.kept_indices:
+            instruction_type = instructions[i]
+            self.instruction_types.add(instruction_type)
+            if first_instruction_type is None:
+                first_instruction_type = instruction_type
+                if first_instruction_type.in_knitting_pass:
+                    self.knitting_pass = True
+                if first_instruction_type.requires_second_needle:
+                    self.require_second = True
+            else:
+                if not first_instruction_type.compatible_pass(instruction_type):
+                    raise Incompatible_In_Carriage_Pass_Exception(first_instruction_type, instruction_type)
+            if instruction_type.directed_pass and undirected:
+                raise Required_Direction_Exception(instruction_type)
+        self.ordered_needles: dict[tuple[Carriage_Pass_Direction, int], tuple[list[int], bool, list[int]]] = {}
+
+
 class Carriage_Pass_Specification:
     """Manages actions on a collection of needles in a carriage pass.
 
@@ -30,6 +88,12 @@ class Carriage_Pass_Specification:
     The carriage pass specification ensures that all operations within a single pass are physically possible on the knitting machine
      and executes them in the correct order based on the carriage direction and machine racking configuration.
 
+    Row-repeat patterns execute the same pass on the same needles many times.
+    The validated plan of a pass is cached in the context by the bed, position, and slider flag of each needle, their instructions, the target bed, and the slider flag,
+     and the needle order of the plan is cached by the direction and racking of the pass.
+    Repeated passes reuse the cached plan and order and go straight to executing their instructions.
+    Plans refer to needles by their index in the pass, so each pass executes and reports its own needle objects and cached plans do not keep the needles of finished passes alive.
+
     Attributes:
         _source_statement (KS_Element): The source statement that generates this specification.
         _to_sliders (bool): True if transferring or splitting operations target sliders.
@@ -38,12 +102,16 @@ class Carriage_Pass_Specification:
         _has_drops (bool): True if this pass contains drop operations.
         _drop_pass (Carriage_Pass_Specification | None): Separate drop pass specification.
         _needle_to_instruction (dict[Needle, Knitout_Instruction_Type]): Mapping of needles to instructions.
+        _needles (list[Needle]): The needles of the pass that are not separated into the drop pass, indexed by the needle orders of the pass plan.
         _direction (Carriage_Pass_Direction | None): Direction of the carriage pass.
         _instruction_types (set[Knitout_Instruction_Type]): Set of all instruction types in this pass.
         _knitting_pass (bool): True if this pass includes knitting operations.
         _require_second (bool): True if any instruction requires a second needle.
+        _ordered_needles (dict[tuple[Carriage_Pass_Direction, int], tuple[list[int], bool, list[int]]]): The cached needle orders of the pass plan.
     """
 
+    _MAX_PASS_PLANS: int = 256  # The oldest plans in a context are evicted beyond this count.
+
     def __init__(
         self,
         source_statement: KS_Element,
@@ -53,6 +121,7 @@ class Carriage_Pass_Specification:
         racking: float | None = None,
         to_sliders: bool = False,
         is_drop_pass: bool = False,
+        context: Knit_Script_Context | None = None,
     ) -> None:
         """Initialize a carriage pass specification.
 
@@ -67,6 +136,7 @@ class Carriage_Pass_Specification:
             racking (float | None, optional): The racking position for this pass. If None, uses current racking from context. Defaults to None.
             to_sliders (bool, optional): True if transferring or splitting operations target slider needles. Defaults to False.
             is_drop_pass (bool, optional): True if this is a specialized drop-only pass. Defaults to False.
+            context (Knit_Script_Context | None, optional): The context whose pass plans are shared with this pass. Defaults to validating a plan that is not shared.
 
         Raises:
             Incompatible_In_Carriage_Pass_Exception: If incompatible instruction types are specified for the same pass.
@@ -76,42 +146,30 @@ class Carriage_Pass_Specification:
         self._to_sliders: bool = to_sliders
         self._racking: float | None = racking
         self._target_bed: Machine_Bed_Position | None = target_bed
-        self._has_drops: bool = False
+        self._direction: Carriage_Pass_Direction | None = direction
+        needles = list(needle_to_instruction)
+        instructions = tuple(needle_to_instruction.values())
+        plan_key = (is_drop_pass, direction is None, target_bed, to_sliders, tuple((n.is_front, n.position, n.is_slider) for n in needles), instructions)
+        plan = None if context is None else context.pass_plans.get(plan_key)
+        if plan is None:
+            plan = _Carriage_Pass_Plan(instructions, direction is None, is_drop_pass)
+            if context is not None:
+                if len(context.pass_plans) >= Carriage_Pass_Specification._MAX_PASS_PLANS:
+                    del context.pass_plans[next(iter(context.pass_plans))]  # evict the oldest plan
+                context.pass_plans[plan_key] = plan
+        self._has_drops: bool = len(plan.drop_indices) > 0
         self._drop_pass: Carriage_Pass_Specification | None = None
-
-        if not is_drop_pass:  # extract drop operations
-            drop_pass = {}
-            n_to_i: dict[Needle, Knitout_Instruction_Type] = {}
-            for needle, instruction_type in needle_to_instruction.items():
-                if instruction_type is Knitout_Instruction_Type.Drop:
-                    drop_pass[needle] = Knitout_Instruction_Type.Drop
-                else:
-                    n_to_i[needle] = instruction_type
-            if len(drop_pass) > 0:
-                self._has_drops = True
-                self._drop_pass = Carriage_Pass_Specification(self._source_statement, drop_pass, Carriage_Pass_Direction.Rightward, is_drop_pass=True)
-                needle_to_instruction = n_to_i
-
+        if self._has_drops:
+            drops = {needles[i]: Knitout_Instruction_Type.Drop for i in plan.drop_indices}
+            self._drop_pass = Carriage_Pass_Specification(source_statement, drops, Carriage_Pass_Direction.Rightward, is_drop_pass=True, context=context)
+            needles = [needles[i] for i in plan.kept_indices]
+            needle_to_instruction = {needle: needle_to_instruction[needle] for needle in needles}
+        self._needles: list[Needle] = needles
         self._needle_to_instruction: dict[Needle, Knitout_Instruction_Type] = needle_to_instruction
-        self._direction: Carriage_Pass_Direction | None = direction
-        self._instruction_types: set[Knitout_Instruction_Type] = set()
-        first_instruction_type = None
-        self._knitting_pass: bool = False
-        self._require_second: bool = False
-
-        for _, instruction_type in self._needle_to_instruction.items():
-            self._instruction_types.add(instruction_type)
-            if first_instruction_type is None:
-                first_instruction_type = instruction_type
-                if first_instruction_type.in_knitting_pass:
-                    self._knitting_pass = True
-                if first_instruction_type.requires_second_needle:
-                    self._require_second = True
-            else:
-                if not first_instruction_type.compatible_pass(instruction_type):
-                    raise Incompatible_In_Carriage_Pass_Exception(first_instruction_type, instruction_type)
-            if instruction_type.directed_pass and self._direction is None:
-                raise Required_Direction_Exception(instruction_type)
+        self._instruction_types: set[Knitout_Instruction_Type] = plan.instruction_types
+        self._knitting_pass: bool = plan.knitting_pass
+        self._require_second: bool = plan.require_second
+        self._ordered_needles: dict[tuple[Carriage_Pass_Direction, int], tuple[list[int], bool, list[int]]] = plan.ordered_needles
 
     def _needs_released_hook(self, context: Knit_Script_Context) -> bool:
         """Check if the yarn hook needs to be released for this pass.
@@ -157,39 +215,21 @@ class Carriage_Pass_Specification:
         if self._racking is not None:
             context.racking = self._racking
 
-        needles = [*self._needle_to_instruction.keys()]
-
-        needles = self._keep_target_bed_needles(needles)  # ignore needles that are already on target bed
-
-        needles_in_order = self._direction.sort_needles(needles, racking=int(context.racking))
-        # sort into the direction of machine pass
-
-        # calculate all-needle racking condition
-        needs_all_needle_rack = False
-        for n, m in zip(needles_in_order[0:-1], needles_in_order[1:], strict=False):
-            if n.racked_position_on_front(int(context.racking)) == m.racked_position_on_front(int(context.racking)):
-                if n.is_front == m.is_front:
-                    warnings.warn(Repeated_Needle_Warning(n), stacklevel=1)
-                    continue
-                n_instruction = self._needle_to_instruction[n]
-                if not n_instruction.all_needle_instruction:
-                    raise All_Needle_Operation_Exception(n, m, context.machine_state.rack, n_instruction)
-                needs_all_needle_rack = True
+        needles = self._needles
+        order_key = (self._direction, int(context.racking))
+        ordered_needles = self._ordered_needles.get(order_key)
+        if ordered_needles is None:
+            indices = self._keep_target_bed_needles(needles)  # ignore needles that are already on target bed
+            ordered_needles = self._order_needles(needles, indices, context)  # sort into the direction of machine pass
+            self._ordered_needles[order_key] = ordered_needles
+        order, needs_all_needle_rack, repeated_indices = ordered_needles
+        for i in repeated_indices:
+            warnings.warn(Repeated_Needle_Warning(needles[i]), stacklevel=1)
 
         if needs_all_needle_rack:
             context.knitout.append(Rack_Instruction.execute_rack(context.machine_state, context.racking + 0.25, comment=f"All Needle racking {context.racking}"))
 
-        for needle in needles_in_order:
-            instruction_type = self._needle_to_instruction[needle]
-            second_needle = context.machine_state.get_aligned_needle(needle, aligned_slider=self._to_sliders) if instruction_type.requires_second_needle else None
-            results[needle] = second_needle
-            instruction = build_instruction(instruction_type, first_needle=needle, direction=context.direction, carrier_set=context.carrier, second_needle=second_needle)
-            _ = instruction.execute(context.machine_state)
-            if isinstance(instruction, Needle_Instruction):
-                context.gauged_sheet_record.record_needle(instruction.needle)
-                if isinstance(instruction.needle_2, Needle) and instruction.needle_2.position != instruction.needle.position:
-                    context.gauged_sheet_record.record_needle(instruction.needle_2)
-            context.knitout.append(instruction)
+        self._execute_needle_instructions(context, [needles[i] for i in order], results)
         if needs_all_needle_rack:
             context.knitout.append(Rack_Instruction.execute_rack(context.machine_state, cur_rack, comment="Reset rack from all_needle"))
         context.racking = cur_rack
@@ -198,7 +238,94 @@ class Carriage_Pass_Specification:
             results.update(self._drop_pass.write_knitout(context))
         return results
 
-    def _keep_target_bed_needles(self, needles: list[Needle]) -> list[Needle]:
+    def _order_needles(self, needles: list[Needle], indices: list[int], context: Knit_Script_Context) -> tuple[list[int], bool, list[int]]:
+        """Order the needles in the direction of the carriage pass and determine if the pass requires all-needle racking.
+
+        Needles are ordered by their position on the front bed at the current racking with front needles before back needles at the same position, matching the direction's needle sorting.
+        Needle sequences that are already in pass order (e.g., slices of needle sets or the last pass) are detected in the same linear scan that checks for all-needle conflicts and are not sorted again.
+
+        Args:
+            needles (list[Needle]): The needles of the pass.
+            indices (list[int]): The indices of the needles to order.
+            context (Knit_Script_Context): The knit pass context that defines the racking of the pass.
+
+        Returns:
+            tuple[list[int], bool, list[int]]:
+                The indices of the needles in the order of the carriage pass, True if the pass requires all-needle racking, and the indices of the needles that are repeated at the same position on the same bed.
+
+        Raises:
+            All_Needle_Operation_Exception: If all-needle operations are attempted on overlapping needles without an all-needle instruction.
+        """
+        assert self._direction is not None
+        racking = int(context.racking)
+        keys = {i: (needles[i].racked_position_on_front(racking), needles[i].is_back) for i in indices}
+        rightward = self._direction is Carriage_Pass_Direction.Rightward
+        aligned_pairs: list[tuple[int, int]] = []
+        order = indices
+        for prior, i in zip(indices[0:-1], indices[1:], strict=False):
+            prior_key, key = keys[prior], keys[i]
+            if (prior_key > key) if rightward else (prior_key < key):  # needles are out of order and must be sorted
+                order = sorted(indices, key=keys.__getitem__, reverse=not rightward)
+                aligned_pairs = [(j, k) for j, k in zip(order[0:-1], order[1:], strict=False) if keys[j][0] == keys[k][0]]
+                break
+            if prior_key[0] == key[0]:
+                aligned_pairs.append((prior, i))
+        needs_all_needle_rack = False
+        repeated_indices: list[int] = []
+        for j, k in aligned_pairs:
+            if needles[j].is_front == needles[k].is_front:
+                repeated_indices.append(j)
+            else:
+                self._check_all_needle_alignment(needles[j], needles[k], context)
+                needs_all_needle_rack = True
+        return order, needs_all_needle_rack, repeated_indices
+
+    def _check_all_needle_alignment(self, n: Needle, m: Needle, context: Knit_Script_Context) -> None:
+        """Check that two adjacent needles in the pass that are aligned on opposite beds at the current racking can be operated on with all-needle racking.
+
+        Args:
+            n (Needle): The first needle in the pass order.
+            m (Needle): The following needle in the pass order, aligned with n on the opposite bed.
+            context (Knit_Script_Context): The knit pass context.
+
+        Raises:
+            All_Needle_Operation_Exception: If the instruction on n is not an all-needle instruction.
+        """
+        n_instruction = self._needle_to_instruction[n]
+        if not n_instruction.all_needle_instruction:
+            raise All_Needle_Operation_Exception(n, m, context.machine_state.rack, n_instruction)
+
+    def _execute_needle_instructions(self, context: Knit_Script_Context, needles_in_order: list[Needle], results: dict[Needle, Needle | None]) -> None:
+        """Execute the instructions of the pass on the given needles in order as one batch.
+
+        The machine state, carrier set, and direction are resolved once for the whole pass.
+        The instructions are added to the knitout in a single extension and the needles they affect are recorded in the gauged sheet record in bulk after the pass.
+        If an instruction fails, the instructions executed before it are still written and recorded so that the partial knitout matches the machine state.
+
+        Args:
+            context (Knit_Script_Context): The knit pass context to execute operations on.
+            needles_in_order (list[Needle]): The needles to execute instructions on in the order of the carriage pass.
+            results (dict[Needle, Needle | None]): Dictionary to update with each needle mapped to its target needle (for transfers/splits) or None for other operations.
+        """
+        machine_state = context.machine_state
+        direction = context.direction
+        carrier_set = context.carrier
+        to_sliders = self._to_sliders
+        needle_to_instruction = self._needle_to_instruction
+        instructions: list[Knitout_Line] = []
+        try:
+            for needle in needles_in_order:
+                instruction_type = needle_to_instruction[needle]
+                second_needle = machine_state.get_aligned_needle(needle, aligned_slider=to_sliders) if instruction_type.requires_second_needle else None
+                results[needle] = second_needle
+                instruction = build_instruction(instruction_type, first_needle=needle, direction=direction, carrier_set=carrier_set, second_needle=second_needle)
+                _ = instruction.execute(machine_state)
+                instructions.append(instruction)
+        finally:
+            context.gauged_sheet_record.record_instructions(instructions)
+            context.knitout.extend(instructions)
+
+    def _keep_target_bed_needles(self, needles: list[Needle]) -> list[int]:
         """Filter needles to only include those not already on the target bed.
 
         When a target bed is specified, filters the needle list to include only needles that need to be processed (i.e., those not already on the target bed).
@@ -207,7 +334,7 @@ class Carriage_Pass_Specification:
             needles (list[Needle]): List of needles to filter based on target bed requirements.
 
         Returns:
-            list[Needle]: Filtered list of needles that need to be processed for the target bed.
+            list[int]: The indices of the needles that need to be processed for the target bed.
 
         Raises:
             TypeError: If target_bed is not a valid Machine_Bed_Position.
@@ -216,8 +343,8 @@ class Carriage_Pass_Specification:
             if not isinstance(self._target_bed, Machine_Bed_Position):
                 raise TypeError(f"Expected xfer to Front or Back Bed but got {self._target_bed}")
             if self._target_bed is Machine_Bed_Position.Front:
-                return [n for n in needles if n.is_back]
+                return [i for i, n in enumerate(needles) if n.is_back]
             else:
-                return [n for n in needles if n.is_front]
+                return [i for i, n in enumerate(needles) if n.is_front]
         else:
-            return needles
+            return list(range(len(needles)))
@@ -62,7 +62,7 @@ class Drop_Pass(Statement):
 
         needles_to_instruction = {n: Knitout_Instruction_Type.Drop for n in needles}
 
-        machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, Carriage_Pass_Direction.Rightward, is_drop_pass=True)
+        machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, Carriage_Pass_Direction.Rightward, is_drop_pass=True, context=context)
 
         needle_results = machine_pass.write_knitout(context)
         context.last_carriage_pass_result = list(needle_results.keys())  # stores needles that were dropped
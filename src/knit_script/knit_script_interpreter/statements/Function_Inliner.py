@@ -0,0 +1,119 @@
+"""Module containing the Function_Inliner class.
+
+This module provides the Function_Inliner class, a static analysis that finds small functions whose calls can be replaced by their body when a program is parsed.
+Small helpers (e.g., needle or index arithmetic) are often called inside loops, where entering and exiting a function scope for every call costs more than evaluating the body.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from knit_script.knit_script_interpreter.expressions.accessors import Attribute_Accessor_Expression
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.function_expressions import Function_Call
+from knit_script.knit_script_interpreter.expressions.Indexed_Expression import Indexed_Expression
+from knit_script.knit_script_interpreter.expressions.list_expression import Comprehension
+from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.scope.machine_scope import Machine_Scope
+from knit_script.knit_script_interpreter.statements.assignment import Assignment
+from knit_script.knit_script_interpreter.statements.code_block_statements import Code_Block
+from knit_script.knit_script_interpreter.statements.Function_Purity import Function_Purity
+from knit_script.knit_script_interpreter.statements.return_statement import Return_Statement
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+
+
+class Function_Inliner:
+    """Static analysis of function declarations and function calls for inlining.
+
+    A function can be inlined if its body is a single return statement whose expression is small, only calls side-effect free python builtins,
+     does not bind variables (e.g., in comprehensions), and reads each parameter exactly once.
+    Knit script functions resolve variables in the scope of their caller, so a function called by the body could read a parameter by name.
+    Inlining does not bind the parameters, so bodies that call knit script functions or methods (which may be functions of knit script modules) are not inlined.
+    A call can be inlined if its arguments have no side effects (no function or method calls, indexed assignments, or comprehensions),
+     so that evaluating each argument once where its parameter is read in the body has the same result as binding the parameters before evaluating the body.
+    """
+
+    _MAX_INLINED_EXPRESSIONS: int = 32  # Bodies with more expressions than this are not inlined.
+
+    @staticmethod
+    def _nested_elements(element: KS_Element) -> Iterable[KS_Element]:
+        """
+        Args:
+            element (KS_Element): The statement or expression to search.
+
+        Returns:
+            Iterable[KS_Element]: The statements and expressions directly nested in the given element.
+        """
+        for value in vars(element).values():
+            if isinstance(value, KS_Element):
+                yield value
+            elif isinstance(value, (list, tuple)):
+                yield from (v for v in value if isinstance(v, KS_Element))
+
+    @staticmethod
+    def inline_body(func_name: str, body: Statement, parameter_names: list[str]) -> tuple[Expression, tuple[Variable_Expression, ...]] | None:
+        """
+        Args:
+            func_name (str): The name of the declared function.
+            body (Statement): The body of the function.
+            parameter_names (list[str]): The names of the parameters of the function.
+
+        Returns:
+            tuple[Expression, tuple[Variable_Expression, ...]] | None:
+                The returned expression of the function and the variable expressions in it that read a parameter, or None if the function cannot be inlined.
+        """
+        if isinstance(body, Code_Block):
+            if len(body.statements) != 1:
+                return None
+            body = body.statements[0]
+        if not isinstance(body, Return_Statement) or any(isinstance(getattr(Machine_Scope, p, None), property) for p in parameter_names):
+            return None
+        returned_expression = body.expression
+        parameter_reads: list[Variable_Expression] = []
+        expression_count = 0
+        elements: list[KS_Element] = [returned_expression]
+        while len(elements) > 0:
+            element = elements.pop()
+            expression_count += 1
+            if expression_count > Function_Inliner._MAX_INLINED_EXPRESSIONS or isinstance(element, (Statement, Comprehension)):
+                return None
+            elif isinstance(element, Function_Call):
+                called_name = element.func_name.variable_name
+                if called_name == func_name or called_name in parameter_names or called_name not in Function_Purity._PURE_BUILTINS:  # Knit script functions may read the parameters.
+                    return None
+                elements.extend(element.args)
+                elements.extend(element.kwargs)
+                continue
+            elif isinstance(element, Attribute_Accessor_Expression):  # Only the root of an access chain is a variable. The attributes are names or method calls.
+                if any(isinstance(attribute, Function_Call) for attribute in [*element.parent[1:], element.attribute]):  # Method calls may call functions of knit script modules.
+                    return None
+                elements.append(element.parent[0])
+                continue
+            elif isinstance(element, Variable_Expression) and element.variable_name in parameter_names:
+                parameter_reads.append(element)
+            elements.extend(Function_Inliner._nested_elements(element))
+        read_parameters = [read.variable_name for read in parameter_reads]
+        if sorted(read_parameters) != sorted(parameter_names):  # Each parameter must be read exactly once.
+            return None
+        return returned_expression, tuple(parameter_reads)
+
+    @staticmethod
+    def has_inlinable_arguments(args: list[Expression], kwargs: list[Assignment]) -> bool:
+        """
+        Args:
+            args (list[Expression]): The positional arguments of a function call.
+            kwargs (list[Assignment]): The keyword arguments of a function call.
+
+        Returns:
+            bool: True if evaluating the arguments has no side effects, so that the call can be inlined.
+        """
+        elements: list[KS_Element] = [*args, *kwargs]
+        while len(elements) > 0:
+            element = elements.pop()
+            is_indexed_assignment = isinstance(element, Indexed_Expression) and element.assign is not None
+            is_method_call = isinstance(element, Attribute_Accessor_Expression) and any(isinstance(a, Function_Call) for a in [*element.parent, element.attribute])
+            if isinstance(element, (Function_Call, Comprehension)) or is_indexed_assignment or is_method_call:
+                return False
+            elements.extend(Function_Inliner._nested_elements(element))
+        return True
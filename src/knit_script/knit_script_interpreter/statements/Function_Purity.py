@@ -0,0 +1,199 @@
+"""Module containing the Function_Purity class.
+
+This module provides the Function_Purity class, a static analysis of function declarations that classifies functions whose results only depend on their parameters.
+Helper functions that only compute lists, indices, or arithmetic never emit instructions or read the machine state, so their calls can be memoized by the values of their parameters.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from knit_script.knit_script_interpreter.expressions.accessors import Attribute_Accessor_Expression
+from knit_script.knit_script_interpreter.expressions.direction import Pass_Direction_Expression
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.formatted_string import Formatted_String_Value
+from knit_script.knit_script_interpreter.expressions.function_expressions import Function_Call
+from knit_script.knit_script_interpreter.expressions.Indexed_Expression import Indexed_Expression, Slice_Index
+from knit_script.knit_script_interpreter.expressions.list_expression import Comprehension, Knit_Script_Dictionary, Knit_Script_List, Sliced_List, Unpack
+from knit_script.knit_script_interpreter.expressions.Loop_Invariant_Expression import Loop_Invariant_Expression
+from knit_script.knit_script_interpreter.expressions.not_expression import Not_Expression
+from knit_script.knit_script_interpreter.expressions.operator_expressions import Operator_Expression
+from knit_script.knit_script_interpreter.expressions.values import _Context_Free_Value
+from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.scope.machine_scope import Machine_Scope
+from knit_script.knit_script_interpreter.statements.Assertion import Assertion
+from knit_script.knit_script_interpreter.statements.branch_statements import If_Statement
+from knit_script.knit_script_interpreter.statements.code_block_statements import Code_Block
+from knit_script.knit_script_interpreter.statements.control_loop_statements import For_Each_Statement, While_Statement
+from knit_script.knit_script_interpreter.statements.express_statement import Expression_Statement
+from knit_script.knit_script_interpreter.statements.return_statement import Return_Statement
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+from knit_script.knit_script_interpreter.statements.Variable_Declaration import Variable_Declaration
+
+
+class Function_Purity:
+    """Static analysis that classifies function declarations as machine-independent.
+
+    A function is machine-independent if its body only contains code blocks, local assignments, branches, loops, assertions, returns, and expression statements
+     whose expressions only read the function's parameters, its local variables, and side-effect free python builtins.
+    Such a function never emits instructions, never reads or sets the machine state (e.g., Carrier, Rack, Sheet, Gauge, needle sets, or the Last_Pass),
+     and never reads variables from the scope of its caller, so calls with equal parameter values return equal values.
+    Because names are resolved at runtime, a local variable only shadows the caller's variable of the same name once it is assigned, so reads must follow an assignment on every path.
+
+    Note:
+        Calls to other knit script functions are treated as impure because the called function is resolved at runtime.
+    """
+
+    _PURE_STATEMENTS: tuple[type[Statement], ...] = (Code_Block, Variable_Declaration, If_Statement, While_Statement, For_Each_Statement, Return_Statement, Expression_Statement, Assertion)
+    _EXPRESSION_STATEMENTS: tuple[type[Statement], ...] = (Return_Statement, Expression_Statement, Assertion)
+    _PURE_EXPRESSIONS: tuple[type[Expression], ...] = (
+        _Context_Free_Value,
+        Operator_Expression,
+        Not_Expression,
+        Indexed_Expression,
+        Slice_Index,
+        Knit_Script_List,
+        Sliced_List,
+        Unpack,
+        Knit_Script_Dictionary,
+        Comprehension,
+        Formatted_String_Value,
+        Variable_Expression,
+        Function_Call,
+        Attribute_Accessor_Expression,
+        Pass_Direction_Expression,
+        Loop_Invariant_Expression,
+    )
+    _PURE_BUILTINS: frozenset[str] = frozenset(
+        {"abs", "all", "any", "bool", "dict", "divmod", "enumerate", "float", "int", "len", "list", "max", "min", "range", "reversed", "round", "set", "sorted", "str", "sum", "tuple", "zip"}
+    )
+    _LITERAL_DIRECTIONS: frozenset[str] = frozenset({"Leftward", "Decreasing", "Rightward", "Increasing"})
+
+    @staticmethod
+    def _nested_elements(element: KS_Element) -> Iterable[KS_Element]:
+        """
+        Args:
+            element (KS_Element): The statement or expression to search.
+
+        Returns:
+            Iterable[KS_Element]: The statements and expressions directly nested in the given element.
+        """
+        for value in vars(element).values():
+            if isinstance(value, KS_Element):
+                yield value
+            elif isinstance(value, (list, tuple)):
+                yield from (v for v in value if isinstance(v, KS_Element))
+
+    @staticmethod
+    def _reads_only(expression: KS_Element, bound_names: frozenset[str]) -> bool:
+        """
+        Args:
+            expression (KS_Element): The expression, or a statement that only evaluates expressions, to search.
+            bound_names (frozenset[str]): The names of the parameters and local variables that are definitely assigned before the expression is evaluated.
+
+        Returns:
+            bool: True if the expression only reads the given names and side-effect free python builtins and does not read the machine state.
+        """
+        visited: set[int] = set()
+        elements: list[tuple[KS_Element, frozenset[str]]] = [(expression, bound_names)]
+        while len(elements) > 0:
+            element, names = elements.pop()
+            if id(element) in visited:
+                continue
+            visited.add(id(element))
+            if isinstance(element, Statement):
+                if not isinstance(element, Function_Purity._EXPRESSION_STATEMENTS):
+                    return False
+            elif not isinstance(element, Function_Purity._PURE_EXPRESSIONS):
+                return False
+            elif isinstance(element, Variable_Expression):
+                name = element.variable_name
+                if isinstance(getattr(Machine_Scope, name, None), property) or (name not in names and name not in Function_Purity._PURE_BUILTINS):  # Machine settings or variables of the caller.
+                    return False
+            elif isinstance(element, Pass_Direction_Expression):
+                if element.direction_word not in Function_Purity._LITERAL_DIRECTIONS:  # current and reverse read the carriage direction.
+                    return False
+            elif isinstance(element, Attribute_Accessor_Expression):  # Only the root of an access chain is a variable. The attributes are names or method calls.
+                elements.append((element.parent[0], names))
+                for attribute in [*element.parent[1:], element.attribute]:
+                    if isinstance(attribute, Function_Call):
+                        elements.extend((a, names) for a in attribute.args)
+                        elements.extend((k, names) for k in attribute.kwargs)
+                    elif not isinstance(attribute, Variable_Expression):  # Needle sets and other machine attributes.
+                        return False
+                continue
+            elif isinstance(element, Comprehension):  # The comprehension variables are only bound in the values and condition of the comprehension.
+                comprehension_names = names.union(v.variable_name for v in element.variables)
+                for nested in Function_Purity._nested_elements(element):
+                    if nested is element.iter_expression:
+                        elements.append((nested, names))
+                    elif not any(nested is v for v in element.variables):
+                        elements.append((nested, comprehension_names))
+                continue
+            elements.extend((nested, names) for nested in Function_Purity._nested_elements(element))
+        return True
+
+    @staticmethod
+    def _assigned_names(statement: Statement, bound_names: frozenset[str]) -> frozenset[str] | None:
+        """
+        Args:
+            statement (Statement): The statement of the function body to analyze.
+            bound_names (frozenset[str]): The names of the parameters and local variables that are definitely assigned before the statement executes.
+
+        Returns:
+            frozenset[str] | None:
+                The names that are definitely assigned after the statement executes, or None if the statement reads a name that may not be assigned yet, reads the machine state, or has an effect outside the function's scope.
+        """
+        if isinstance(statement, Code_Block):
+            assigned_names: frozenset[str] | None = bound_names
+            for nested_statement in statement.statements:
+                assert assigned_names is not None
+                assigned_names = Function_Purity._assigned_names(nested_statement, assigned_names)
+                if assigned_names is None:
+                    return None
+            return assigned_names
+        elif isinstance(statement, Variable_Declaration):
+            variable_name = statement.assignment.variable_name
+            sets_machine_state = isinstance(getattr(Machine_Scope, variable_name, None), property)
+            if statement.is_global or sets_machine_state or not Function_Purity._reads_only(statement.assignment.value_expression, bound_names):
+                return None
+            return bound_names | {variable_name}
+        elif isinstance(statement, If_Statement):
+            if not Function_Purity._reads_only(statement.condition, bound_names):
+                return None
+            true_names = Function_Purity._assigned_names(statement.true_statement, bound_names)
+            false_names = bound_names if statement.false_statement is None else Function_Purity._assigned_names(statement.false_statement, bound_names)
+            if true_names is None or false_names is None:
+                return None
+            return true_names & false_names  # Only names assigned by both branches are definitely assigned.
+        elif isinstance(statement, While_Statement):
+            if not Function_Purity._reads_only(statement.condition, bound_names) or Function_Purity._assigned_names(statement.statement, bound_names) is None:
+                return None
+            return bound_names  # The body may not execute, so names assigned in the body are not definitely assigned.
+        elif isinstance(statement, For_Each_Statement):
+            iter_expressions = [statement.iter_expression] if isinstance(statement.iter_expression, Expression) else statement.iter_expression
+            body_names = bound_names.union(v.variable_name for v in statement.variables)
+            if not all(Function_Purity._reads_only(e, bound_names) for e in iter_expressions) or Function_Purity._assigned_names(statement.statement, body_names) is None:
+                return None
+            return bound_names
+        elif isinstance(statement, Function_Purity._EXPRESSION_STATEMENTS) and Function_Purity._reads_only(statement, bound_names):
+            return bound_names
+        return None
+
+    @staticmethod
+    def is_machine_independent(body: KS_Element, parameter_names: Iterable[str]) -> bool:
+        """
+        Args:
+            body (KS_Element): The body of the function or an expression that may only read the given parameters.
+            parameter_names (Iterable[str]): The names of the parameters of the function.
+
+        Returns:
+            bool: True if the function only depends on the values of its parameters and has no effect outside of its own scope.
+
+        Note:
+            A local variable is only bound if it is assigned on every path before it is read. Otherwise, the read may resolve to a variable in the scope of the caller.
+        """
+        if isinstance(body, Statement):
+            return Function_Purity._assigned_names(body, frozenset(parameter_names)) is not None
+        return Function_Purity._reads_only(body, frozenset(parameter_names))
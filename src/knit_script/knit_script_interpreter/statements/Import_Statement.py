@@ -4,8 +4,6 @@ This module provides the Import_Statement class, which handles importing functio
 It supports both direct imports and aliased imports with comprehensive fallback logic for module resolution.
 """
 
-import importlib
-import os.path
 from types import ModuleType
 
 from parglare.parser import LRStackNode
@@ -13,9 +11,11 @@ from parglare.parser import LRStackNode
 from knit_script.knit_script_interpreter.expressions.accessors import Attribute_Accessor_Expression
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.lazy_module import Lazy_Knit_Script_Module
 from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.statements.Module_Laziness import Module_Laziness
 from knit_script.knit_script_interpreter.statements.scoped_statement import Scoped_Statement
-from knit_script.knit_script_std_library import get_ks_library_path
+from knit_script.knit_script_interpreter.statements.Statement import Statement
 
 
 class Import_Statement(Scoped_Statement):
@@ -86,53 +86,33 @@ class Import_Statement(Scoped_Statement):
         else:
             return "__temp_unnamed_module__"
 
-    def _import_from_ks_standard_library(self) -> ModuleType:
-        """
-        Returns:
-            ModuleType: The python module imported from the knitscript standard library.
-
-        Raises:
-            ModuleNotFoundError | ImportError | AttributeError: If the module cannot be imported from the knitscript standard library.
-        """
-        return importlib.import_module(f"knit_script.knit_script_std_library.{self.source_string}")
-
-    def _import_local_module(self) -> ModuleType:
-        """
-        Returns:
-            ModuleType: The python module imported locally.
-
-        Raises:
-            ModuleNotFoundError | AttributeError | ImportError: If the module cannot be imported locally.
-        """
-        return importlib.import_module(self.source_string)
-
-    def _execute_local_ks_file(self, context: Knit_Script_Context) -> Knit_Script_Scope | None:
-        """
-        Args:
-            context (Knit_Script_Context): The current context the import is being executed in.
-
-        Returns:
-            Knit_Script_Scope | None: The knitscript module imported from a local ks file. None, if no local ks file was found to import.
-        """
-        if self.local_path is None:
-            return None
-        local_path_to_src = os.path.join(self.local_path, self.source_ks_file)
-        if not os.path.isfile(local_path_to_src):
-            return None  # File not found in local directory
-        return self._execute_ks_module_from_path(context, local_path_to_src)
-
-    def _execute_ks_file_in_std_lbry(self, context: Knit_Script_Context) -> Knit_Script_Scope | None:
+    @staticmethod
+    def _side_effect_free_module(context: Knit_Script_Context, statements: list[Statement], checked_paths: set[str]) -> bool:
         """
         Args:
             context (Knit_Script_Context): The current context the import is being executed in.
+            statements (list[Statement]): The top level statements of a knitscript module.
+            checked_paths (set[str]): The paths to the knitscript modules that have already been checked, so that circular imports are only checked once.
 
         Returns:
-            Knit_Script_Scope | None: The knitscript module imported from the standard library. None, if no local ks file was found to import.
+            bool: True if the top level of the module and of the knitscript modules it imports that have not been imported yet have no side effects.
         """
-        library_path_to_src = os.path.join(get_ks_library_path(), self.source_ks_file)
-        if not os.path.isfile(library_path_to_src):
-            return None  # File not found in standard library
-        return self._execute_ks_module_from_path(context, library_path_to_src)
+        if not Module_Laziness.is_side_effect_free([s for s in statements if not isinstance(s, Import_Statement)]):
+            return False
+        for statement in statements:
+            if not isinstance(statement, Import_Statement):
+                continue
+            try:
+                resolution = context.import_index.resolve(statement.source_string, statement.local_path)
+            except (AttributeError, ImportError):
+                return False
+            if resolution is None:
+                return False
+            elif isinstance(resolution, str) and resolution not in checked_paths and resolution not in context.module_registry:
+                checked_paths.add(resolution)
+                if not Import_Statement._side_effect_free_module(context, context.module_registry.parse_module(context.parser, resolution), checked_paths):
+                    return False
+        return True
 
     def _execute_ks_module_from_path(self, context: Knit_Script_Context, path: str) -> Knit_Script_Scope:
         """
@@ -141,35 +121,37 @@ class Import_Statement(Scoped_Statement):
             path (str): The path to the knitscript module to import.
 
         Returns:
-            Knit_Script_Scope: The knitscript module imported from the given path.
+            Knit_Script_Scope:
+                The knitscript module imported from the given path. A module that was already imported into the context is not executed again.
+                If the context imports modules lazily and the module has no side effects, the module is executed when it is first accessed.
 
         Raises:
             Parsing_Exception: If the imported module has a knitscript syntax error.
         """
-        statements = context.parser.parse(path, pattern_is_file=True)
+        module = context.module_registry.module(path)
+        if module is not None:
+            return module
+        statements = context.module_registry.parse_module(context.parser, path)
+        if context.lazy_modules and context.debugger is None and self._side_effect_free_module(context, statements, {path}):
+            module = Lazy_Knit_Script_Module(context, context.variable_scope, self.alias_name, statements)
+            context.module_registry.register_module(path, module)
+            return module
         module = context.enter_sub_scope(module_name=self.alias_name)  # enter sub scope for module
-        context.execute_statements(statements)
+        context.module_registry.register_module(path, module)
+        try:
+            context.execute_statements(statements)
+        except BaseException:
+            context.module_registry.unregister_module(path)
+            raise
         context.exit_current_scope()
         return module
 
-    def _get_python_module(self) -> ModuleType | None:
-        """
-        Returns:
-            ModuleType | None: The python module imported or None if a module could not be found.
-        """
-        try:
-            try:
-                return self._import_local_module()
-            except (ImportError, ModuleNotFoundError) as _failed_local_python_import:
-                return self._import_from_ks_standard_library()
-        except (ImportError, ModuleNotFoundError) as _failed_ks_python_import:
-            return None
-
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the import by loading the module and adding it to scope.
 
         Attempts to import in the following order: 1. Python module with the exact name 2. Knit script standard library module 3. Local knit script file 4. Standard library knit script file.
         Once found, adds the module to the current variable scope with the appropriate name or alias.
+        Knit script modules are executed once per context, like Python modules in sys.modules, so importing the same module file again rebinds the existing module scope.
 
         Args:
             context (Knit_Script_Context): The current execution context to import into.
@@ -179,13 +161,10 @@ class Import_Statement(Scoped_Statement):
                 If the module cannot be found in any location after trying all resolution methods.
         """
 
-        module: ModuleType | Knit_Script_Scope | None = self._get_python_module()
-        if module is None:
-            module = self._execute_local_ks_file(context)
-        if module is None:
-            module = self._execute_ks_file_in_std_lbry(context)
-        if module is None:
+        resolution = context.import_index.resolve(self.source_string, self.local_path)
+        if resolution is None:
             raise ImportError(f"Could not find a python or knitscript module <{self.source_ks_file}> in local module or ks standard library")
+        module: ModuleType | Knit_Script_Scope = resolution if isinstance(resolution, ModuleType) else self._execute_ks_module_from_path(context, resolution)
         if self.alias is not None or isinstance(self.src, Variable_Expression):
             context.variable_scope[self.alias_name] = module
         else:  # attribute accessor path
@@ -0,0 +1,68 @@
+"""Module containing the Knitout_Recording class.
+
+This module provides the Knitout_Recording class, the knitout produced by executing a piece of a knit script program and the interpreter state it ended in.
+Row replay and memoized function calls use recordings to reproduce the effect of statements on the machine without interpreting them again.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
+from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import KnitScript_Logging_Level
+
+
+class Knitout_Recording:
+    """The knitout and resulting interpreter state of a recorded piece of execution.
+
+    Attributes:
+        knitout (list[Knitout_Line]): The knitout lines produced by the recorded execution.
+        direction (Carriage_Pass_Direction): The carriage pass direction at the end of the recorded execution.
+        last_carriage_pass_result (list[Needle] | dict[Needle, Needle | None]): The result of the last carriage pass at the end of the recorded execution.
+        printed_messages (list[tuple[str, Any, KnitScript_Logging_Level]]): The message, source, and log type of each message printed by the recorded execution.
+    """
+
+    def __init__(
+        self,
+        knitout: list[Knitout_Line],
+        direction: Carriage_Pass_Direction,
+        last_carriage_pass_result: list[Needle] | dict[Needle, Needle | None],
+        printed_messages: list[tuple[str, Any, KnitScript_Logging_Level]] | None = None,
+    ) -> None:
+        """
+        Args:
+            knitout (list[Knitout_Line]): The knitout lines produced by the recorded execution.
+            direction (Carriage_Pass_Direction): The carriage pass direction at the end of the recorded execution.
+            last_carriage_pass_result (list[Needle] | dict[Needle, Needle | None]): The result of the last carriage pass at the end of the recorded execution.
+            printed_messages (list[tuple[str, Any, KnitScript_Logging_Level]] | None, optional): The messages printed by the recorded execution. Defaults to no messages.
+        """
+        self.knitout: list[Knitout_Line] = knitout
+        self.direction: Carriage_Pass_Direction = direction
+        self.last_carriage_pass_result: list[Needle] | dict[Needle, Needle | None] = copy.copy(last_carriage_pass_result)
+        self.printed_messages: list[tuple[str, Any, KnitScript_Logging_Level]] = [] if printed_messages is None else printed_messages
+
+    def replay(self, context: Knit_Script_Context) -> None:
+        """Print the recorded messages again, execute copies of the recorded knitout lines on the machine, and restore the interpreter state at the end of the recording.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        for message, source, log_type in self.printed_messages:
+            context.print(message, source, log_type)
+        machine_state = context.machine_state
+        instructions: list[Knitout_Line] = []
+        try:
+            for recorded_instruction in self.knitout:
+                instruction = copy.copy(recorded_instruction)
+                _ = instruction.execute(machine_state)
+                instructions.append(instruction)
+        finally:
+            context.gauged_sheet_record.record_instructions(instructions)
+            context.knitout.extend(instructions)
+        context.direction = self.direction
+        context.last_carriage_pass_result = copy.copy(self.last_carriage_pass_result)
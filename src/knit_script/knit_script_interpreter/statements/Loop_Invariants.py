@@ -0,0 +1,277 @@
+"""Module containing the Loop_Invariants class.
+
+This module provides the Loop_Invariants class, a static analysis of loops that hoists expressions whose value cannot change while the loop executes.
+Patterns routinely evaluate needle sets (e.g., Front_Needles), machine attributes (e.g., machine.needle_count), or lengths of unchanging lists in every iteration of a loop,
+ rebuilding lists and searching the scope chain each time.
+Hoisted expressions are evaluated once per execution of the loop instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import cast
+
+from knit_script.knit_script_interpreter.expressions.accessors import Attribute_Accessor_Expression
+from knit_script.knit_script_interpreter.expressions.direction import Pass_Direction_Expression
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.formatted_string import Formatted_String_Value
+from knit_script.knit_script_interpreter.expressions.function_expressions import Function_Call
+from knit_script.knit_script_interpreter.expressions.Indexed_Expression import Indexed_Expression, Slice_Index
+from knit_script.knit_script_interpreter.expressions.list_expression import Comprehension
+from knit_script.knit_script_interpreter.expressions.Loop_Invariant_Expression import Loop_Invariant_Expression
+from knit_script.knit_script_interpreter.expressions.machine_accessor import Machine_Accessor
+from knit_script.knit_script_interpreter.expressions.needle_set_expression import Needle_Set_Expression, Needle_Sets
+from knit_script.knit_script_interpreter.expressions.not_expression import Not_Expression
+from knit_script.knit_script_interpreter.expressions.operator_expressions import Operator_Expression
+from knit_script.knit_script_interpreter.expressions.values import _Context_Free_Value
+from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.scope.machine_scope import Machine_Scope
+from knit_script.knit_script_interpreter.statements.assignment import Assignment
+from knit_script.knit_script_interpreter.statements.code_block_statements import Code_Block
+from knit_script.knit_script_interpreter.statements.control_loop_statements import For_Each_Statement
+from knit_script.knit_script_interpreter.statements.function_dec_statement import Function_Declaration
+from knit_script.knit_script_interpreter.statements.Function_Purity import Function_Purity
+from knit_script.knit_script_interpreter.statements.Import_Statement import Import_Statement
+from knit_script.knit_script_interpreter.statements.Print import Print
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+from knit_script.knit_script_interpreter.statements.try_catch_statements import Try_Catch_Statement
+
+
+class Loop_Invariants:
+    """Static analysis that finds and hoists the loop-invariant expressions of a loop.
+
+    An expression is loop-invariant if it only reads variables that are not assigned in the loop, needle sets, the machine, and side-effect free python builtins that return new values (not iterators).
+    The analysis is conservative about what the loop body can change:
+     if the body calls knit script functions or python methods, or assigns to indexed values, variables may be changed or mutated without an assignment, so expressions that read variables are not hoisted;
+     if the body contains instructions, carriage passes, or other statements that may change the machine, expressions that read loops, the Last_Pass, the carriage direction, or machine settings are not hoisted;
+     and if the body assigns the Sheet or Gauge, needle sets are not hoisted.
+    Only the largest invariant expressions that are more expensive to evaluate than a variable or a constant are hoisted.
+
+    Note:
+        Expressions nested in function declarations are not hoisted because their bodies execute in the scope of each call.
+    """
+
+    _MACHINE_INDEPENDENT_STATEMENTS: tuple[type[Statement], ...] = (*Function_Purity._PURE_STATEMENTS, Print, Try_Catch_Statement)
+    _HOISTED_BUILTINS: frozenset[str] = Function_Purity._PURE_BUILTINS - {"enumerate", "reversed", "zip"}  # Iterators are consumed by their first use and cannot be reused.
+    _STATIC_MACHINE_ATTRIBUTES: frozenset[str] = frozenset({"needle_count", "max_rack", "front_bed", "back_bed", "carrier_system", "machine_specification"})
+    _SHEET_NEEDLE_SETS: frozenset[Needle_Sets] = frozenset(
+        {Needle_Sets.Needles, Needle_Sets.Front_Needles, Needle_Sets.Back_Needles, Needle_Sets.Sliders, Needle_Sets.Front_Sliders, Needle_Sets.Back_Sliders}
+    )
+    _HOISTED_EXPRESSIONS: tuple[type[Expression], ...] = (
+        Needle_Set_Expression,
+        Function_Call,
+        Attribute_Accessor_Expression,
+        Indexed_Expression,
+        Operator_Expression,
+        Not_Expression,
+        Formatted_String_Value,
+        Loop_Invariant_Expression,
+    )
+
+    def __init__(self, body: Statement, loop_variables: Iterable[str], loop_expressions: Iterable[Expression]) -> None:
+        """Analyze what the loop can change in each iteration.
+
+        Args:
+            body (Statement): The body of the loop.
+            loop_variables (Iterable[str]): The names of the variables assigned by the loop on each iteration.
+            loop_expressions (Iterable[Expression]): Expressions evaluated by the loop on each iteration (e.g., the condition of a while loop).
+        """
+        self._assigned_names: set[str] = set(loop_variables)
+        self._mutates_values: bool = False
+        self._changes_machine: bool = False
+        called_names: set[str] = set()
+        elements: list[KS_Element] = [body, *loop_expressions]
+        while len(elements) > 0:
+            element = elements.pop()
+            if isinstance(element, (Function_Declaration, Import_Statement)):  # Binds names whose values are unknown until the statement executes.
+                self._mutates_values = True
+                continue
+            elif isinstance(element, Assignment):
+                self._assigned_names.add(element.variable_name)
+            elif isinstance(element, (For_Each_Statement, Comprehension)):
+                self._assigned_names.update(v.variable_name for v in element.variables)
+            elif isinstance(element, Function_Call):
+                called_names.add(element.func_name.variable_name)
+            elif isinstance(element, Attribute_Accessor_Expression):
+                if any(isinstance(a, Function_Call) for a in [*element.parent, element.attribute]):  # method calls may mutate their parent.
+                    self._mutates_values = True
+            elif isinstance(element, Indexed_Expression):
+                if element.assign is not None:
+                    self._mutates_values = True
+            elif isinstance(element, Statement) and not isinstance(element, Loop_Invariants._MACHINE_INDEPENDENT_STATEMENTS):
+                self._changes_machine = True
+            elements.extend(Function_Purity._nested_elements(element))
+        if any(n not in Function_Purity._PURE_BUILTINS or n in self._assigned_names for n in called_names):  # knit script functions and other python functions.
+            self._mutates_values = True
+        if self._mutates_values or any(isinstance(getattr(Machine_Scope, n, None), property) for n in self._assigned_names):  # Called functions may execute instructions.
+            self._changes_machine = True
+
+    def _invariant_variable(self, variable_name: str) -> bool:
+        """
+        Args:
+            variable_name (str): The name of a variable read in the loop.
+
+        Returns:
+            bool: True if the value of the variable cannot change while the loop executes.
+        """
+        if variable_name in self._assigned_names or self._mutates_values:
+            return False
+        elif isinstance(getattr(Machine_Scope, variable_name, None), property) or variable_name == Needle_Sets.Last_Pass.value:  # Carrier, Rack, direction, and other machine settings.
+            return not self._changes_machine
+        return True
+
+    def _invariant_needle_set(self, kp_set: Needle_Sets) -> bool:
+        """
+        Args:
+            kp_set (Needle_Sets): A needle set read in the loop.
+
+        Returns:
+            bool: True if the needles in the set cannot change while the loop executes.
+        """
+        if kp_set in Loop_Invariants._SHEET_NEEDLE_SETS:
+            return "Sheet" not in self._assigned_names and "Gauge" not in self._assigned_names
+        return not self._changes_machine  # Needles with loops and the Last_Pass change with the machine.
+
+    def is_invariant(self, expression: Expression) -> bool:
+        """
+        Args:
+            expression (Expression): An expression evaluated in the loop.
+
+        Returns:
+            bool: True if the value of the expression cannot change while the loop executes.
+        """
+        elements: list[KS_Element] = [expression]
+        while len(elements) > 0:
+            element = elements.pop()
+            if isinstance(element, (_Context_Free_Value, Machine_Accessor)):
+                continue
+            elif isinstance(element, Variable_Expression):
+                if not self._invariant_variable(element.variable_name):
+                    return False
+                continue
+            elif isinstance(element, Pass_Direction_Expression):
+                if element.direction_word not in Function_Purity._LITERAL_DIRECTIONS and self._changes_machine:  # current and reverse read the carriage direction.
+                    return False
+                continue
+            elif isinstance(element, Needle_Set_Expression):
+                if not self._invariant_needle_set(element.kp_set):
+                    return False
+                continue
+            elif isinstance(element, Function_Call):
+                func_name = element.func_name.variable_name
+                if func_name not in Loop_Invariants._HOISTED_BUILTINS or func_name in self._assigned_names:
+                    return False
+                elements.extend(element.args)
+                elements.extend(element.kwargs)
+                continue
+            elif isinstance(element, Attribute_Accessor_Expression):  # Only the root of an access chain is an expression. The attributes are names or needle sets.
+                root = element.parent[0]
+                attributes = [*element.parent[1:], element.attribute]
+                for attribute in attributes:
+                    if isinstance(attribute, Needle_Set_Expression):
+                        if not self._invariant_needle_set(attribute.kp_set):
+                            return False
+                    elif not isinstance(attribute, Variable_Expression):  # method calls, needles, and carriers.
+                        return False
+                static_attribute = isinstance(root, Machine_Accessor) and len(attributes) == 1 and cast(Variable_Expression, attributes[0]).variable_name in Loop_Invariants._STATIC_MACHINE_ATTRIBUTES
+                if self._changes_machine and not static_attribute:  # The attributes of machine components change with the machine.
+                    return False
+                elements.append(root)
+                continue
+            elif isinstance(element, Indexed_Expression):
+                if element.assign is not None:
+                    return False
+            elif not isinstance(element, (Loop_Invariant_Expression, Operator_Expression, Not_Expression, Slice_Index, Formatted_String_Value, Assignment)):
+                return False
+            elements.extend(Function_Purity._nested_elements(element))
+        return True
+
+    def _hoisted(self, value: object, invariants: list[Loop_Invariant_Expression]) -> Loop_Invariant_Expression | None:
+        """
+        Args:
+            value (object): An attribute of an element nested in the loop.
+            invariants (list[Loop_Invariant_Expression]): The expressions hoisted so far. A new hoisted expression is added to this list.
+
+        Returns:
+            Loop_Invariant_Expression | None: The value wrapped as a loop-invariant expression or None if the value should not be hoisted.
+        """
+        if isinstance(value, Loop_Invariants._HOISTED_EXPRESSIONS) and self.is_invariant(value):
+            invariant = Loop_Invariant_Expression(value)
+            invariants.append(invariant)
+            return invariant
+        return None
+
+    @staticmethod
+    def reuses_body_scope(body: Statement, loop_variables: Iterable[str]) -> bool:
+        """
+        Args:
+            body (Statement): The body of a for-each loop.
+            loop_variables (Iterable[str]): The names of the variables assigned by the loop on each iteration.
+
+        Returns:
+            bool: True if the loop can execute all of its iterations in one scope for the body instead of entering and collapsing a new scope for each iteration.
+            This requires that the body is a code block that does not bind the loop variables, set machine settings, or declare functions or modules that capture the scope.
+        """
+        if not isinstance(body, Code_Block):
+            return False
+        loop_variables = set(loop_variables)
+        if any(isinstance(getattr(Machine_Scope, v, None), property) for v in loop_variables):
+            return False
+        elements: list[KS_Element] = [body]
+        while len(elements) > 0:
+            element = elements.pop()
+            if isinstance(element, (Function_Declaration, Import_Statement)):
+                return False
+            elif isinstance(element, Assignment):
+                if element.variable_name in loop_variables or isinstance(getattr(Machine_Scope, element.variable_name, None), property):
+                    return False
+            elif isinstance(element, (For_Each_Statement, Comprehension)) and any(v.variable_name in loop_variables for v in element.variables):
+                return False
+            elements.extend(Function_Purity._nested_elements(element))
+        return True
+
+    @staticmethod
+    def hoist(body: Statement, loop_variables: Iterable[str], loop_expressions: Iterable[Expression] = ()) -> list[Loop_Invariant_Expression]:
+        """Replace the largest loop-invariant expressions nested in a loop with loop-invariant expressions that evaluate them once per execution of the loop.
+
+        Args:
+            body (Statement): The body of the loop.
+            loop_variables (Iterable[str]): The names of the variables assigned by the loop on each iteration.
+            loop_expressions (Iterable[Expression], optional): Expressions evaluated by the loop on each iteration (e.g., the condition of a while loop). Defaults to no expressions.
+
+        Returns:
+            list[Loop_Invariant_Expression]: The hoisted expressions, which the loop activates each time it executes.
+        """
+        loop_expressions = list(loop_expressions)
+        loop_invariants = Loop_Invariants(body, loop_variables, loop_expressions)
+        invariants: list[Loop_Invariant_Expression] = []
+        visited: set[int] = set()
+        elements: list[KS_Element] = [body, *loop_expressions]
+        while len(elements) > 0:
+            element = elements.pop()
+            if id(element) in visited or isinstance(element, (Function_Declaration, Import_Statement)):
+                continue
+            visited.add(id(element))
+            if isinstance(element, Attribute_Accessor_Expression):  # The parent path and attribute of an access cannot be replaced, but the arguments of method calls can be hoisted.
+                elements.append(element.parent[0])
+                elements.extend(a for a in [*element.parent[1:], element.attribute] if isinstance(a, Function_Call))
+                continue
+            for attribute_name, value in vars(element).items():
+                if isinstance(value, KS_Element):
+                    invariant = loop_invariants._hoisted(value, invariants)
+                    if invariant is None:
+                        elements.append(value)
+                    else:
+                        setattr(element, attribute_name, invariant)
+                elif isinstance(value, list):
+                    for i, item in enumerate(value):
+                        if isinstance(item, KS_Element):
+                            invariant = loop_invariants._hoisted(item, invariants)
+                            if invariant is None:
+                                elements.append(item)
+                            else:
+                                value[i] = invariant
+                elif isinstance(value, tuple):
+                    elements.extend(v for v in value if isinstance(v, KS_Element))
+        return invariants
@@ -0,0 +1,48 @@
+"""Module containing the Module_Laziness class.
+
+This module provides the Module_Laziness class, a static analysis of the top level of knit script modules that finds modules whose execution can be deferred until they are first accessed.
+Libraries of knit script functions only declare functions and constants at their top level, so executing them when they are imported has no effect other than binding those names.
+"""
+
+from __future__ import annotations
+
+from knit_script.knit_script_interpreter.statements.function_dec_statement import Function_Declaration
+from knit_script.knit_script_interpreter.statements.Function_Purity import Function_Purity
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+from knit_script.knit_script_interpreter.statements.Variable_Declaration import Variable_Declaration
+
+
+class Module_Laziness:
+    """Static analysis that classifies the top level of knit script modules as side-effect free.
+
+    The top level of a module is side-effect free if it only contains function declarations and local variable declarations,
+     and the assigned values and default parameter values only read the constants declared before them and side-effect free python builtins (see Function_Purity).
+    Such a module never emits instructions, never reads or sets the machine state, never prints, and never declares global variables,
+     so executing it later (e.g., when one of its functions is first called) binds the same values as executing it when it is imported.
+
+    Note:
+        Calls to the functions declared in the module are not side-effect free because the declared functions may emit instructions.
+        Import statements at the top level of a module are not classified by this analysis because the module they import is only known when they are executed.
+    """
+
+    @staticmethod
+    def is_side_effect_free(statements: list[Statement]) -> bool:
+        """
+        Args:
+            statements (list[Statement]): The top level statements of a module, excluding its import statements.
+
+        Returns:
+            bool: True if executing the statements only declares functions and constants in the module's scope.
+        """
+        declared_names: list[str] = []
+        for statement in statements:
+            if isinstance(statement, Function_Declaration):
+                if not all(Function_Purity.is_machine_independent(kwarg._value_expression, declared_names) for kwarg in statement._kwargs):
+                    return False
+            elif isinstance(statement, Variable_Declaration) and not statement._is_global:
+                if not Function_Purity.is_machine_independent(statement._assignment._value_expression, declared_names):
+                    return False
+                declared_names.append(statement._assignment.variable_name)
+            else:
+                return False
+        return True
@@ -0,0 +1,119 @@
+"""Module containing the Row_Replay class.
+
+This module provides the Row_Replay class, which replays the iterations of a loop body that only depend on the state of the machine.
+Row-repeat patterns (e.g., stockinette rows) execute the same carriage passes many times from a small number of repeating machine states.
+When replaying is enabled on the context, the knitout of an iteration is recorded with the state fingerprint it started from,
+ and later iterations that start from the same fingerprint print the recorded messages and execute the recorded instructions on the machine instead of interpreting the loop body again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.function_expressions import Function_Call
+from knit_script.knit_script_interpreter.expressions.needle_set_expression import Needle_Set_Expression, Needle_Sets
+from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import KnitScript_Logging_Level
+from knit_script.knit_script_interpreter.ks_element import KS_Element
+from knit_script.knit_script_interpreter.statements.code_block_statements import Code_Block
+from knit_script.knit_script_interpreter.statements.Drop_Pass import Drop_Pass
+from knit_script.knit_script_interpreter.statements.in_direction_statement import In_Direction_Statement
+from knit_script.knit_script_interpreter.statements.Knitout_Recording import Knitout_Recording
+from knit_script.knit_script_interpreter.statements.Statement import Statement
+from knit_script.knit_script_interpreter.statements.xfer_pass_statement import Xfer_Pass_Statement
+
+
+class Row_Replay:
+    """Records and replays the iterations of a loop body whose knitout only depends on the state of the machine.
+
+    A loop body can be replayed if it only contains code blocks and carriage pass statements (in-direction, transfer, and drop passes)
+     whose expressions do not call functions, do not reference the loop variables, and do not reference the Last_Pass.
+    The variables read by such a body cannot change between iterations, so two iterations that start from the same state fingerprint produce the same knitout.
+
+    Attributes:
+        replayable (bool): True if the loop body can be replayed.
+        recorded_iterations (int): The number of iterations that were interpreted and recorded because no recorded iteration started from their state fingerprint.
+        replayed_iterations (int): The number of iterations that were replayed from a recorded iteration.
+    """
+
+    _MAX_RECORDINGS: int = 16  # The oldest recordings are evicted beyond this count.
+    _REPLAYABLE_STATEMENTS: tuple[type[Statement], ...] = (Code_Block, In_Direction_Statement, Xfer_Pass_Statement, Drop_Pass)
+
+    def __init__(self, body: Statement, loop_variables: Iterable[str], loop_expressions: Iterable[Expression] = ()) -> None:
+        """
+        Args:
+            body (Statement): The body of the loop.
+            loop_variables (Iterable[str]): The names of the variables assigned by the loop on each iteration.
+            loop_expressions (Iterable[Expression], optional): Expressions evaluated by the loop on each iteration (e.g., the condition of a while loop). Defaults to no expressions.
+        """
+        self._body: Statement = body
+        loop_variables = set(loop_variables)
+        self.replayable: bool = Row_Replay._is_replayable(body, loop_variables) and all(Row_Replay._is_replayable(e, loop_variables) for e in loop_expressions)
+        self._recordings: dict[int, Knitout_Recording] = {}
+        self.recorded_iterations: int = 0
+        self.replayed_iterations: int = 0
+
+    @staticmethod
+    def _is_replayable(element: KS_Element, loop_variables: set[str]) -> bool:
+        """
+        Args:
+            element (KS_Element): The statement or expression to check.
+            loop_variables (set[str]): The names of the variables assigned by the loop on each iteration.
+
+        Returns:
+            bool: True if the element and all elements nested in it only depend on the machine state and loop-invariant variables.
+        """
+        visited: set[int] = set()
+        elements: list[KS_Element] = [element]
+        while len(elements) > 0:
+            element = elements.pop()
+            if id(element) in visited:
+                continue
+            visited.add(id(element))
+            if isinstance(element, Statement):
+                if not isinstance(element, Row_Replay._REPLAYABLE_STATEMENTS):
+                    return False
+            elif isinstance(element, Function_Call):
+                return False
+            elif isinstance(element, Variable_Expression):
+                if element.variable_name in loop_variables or element.variable_name == Needle_Sets.Last_Pass.value:
+                    return False
+            elif isinstance(element, Needle_Set_Expression) and element.kp_set is Needle_Sets.Last_Pass:
+                return False
+            for value in vars(element).values():
+                if isinstance(value, KS_Element):
+                    elements.append(value)
+                elif isinstance(value, (list, tuple)):
+                    elements.extend(v for v in value if isinstance(v, KS_Element))
+        return True
+
+    def reset(self) -> None:
+        """Forget the recorded iterations but keep the counts of recorded and replayed iterations. Called at the start of each execution of the loop because the variables read by the body may have changed since the last execution."""
+        self._recordings.clear()
+
+    def execute_iteration(self, context: Knit_Script_Context) -> None:
+        """Execute one iteration of the loop body, replaying a recorded iteration if one started from the current state fingerprint.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        fingerprint = context.state_fingerprint
+        recording = self._recordings.get(fingerprint)
+        if recording is not None:
+            recording.replay(context)
+            self.replayed_iterations += 1
+            return
+        start = len(context.knitout)
+        printed_messages: list[tuple[str, Any, KnitScript_Logging_Level]] = []
+        context.print_recordings.append(printed_messages)
+        try:
+            self._body.execute(context)
+        finally:
+            context.print_recordings.pop()
+        if len(self._recordings) >= Row_Replay._MAX_RECORDINGS:
+            del self._recordings[next(iter(self._recordings))]  # evict the oldest recording
+        self._recordings[fingerprint] = Knitout_Recording(context.knitout[start:], context.direction, context.last_carriage_pass_result, printed_messages)
+        self.recorded_iterations += 1
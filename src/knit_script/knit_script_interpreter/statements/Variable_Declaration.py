@@ -37,6 +37,22 @@ class Variable_Declaration(Statement):
         self._is_global = is_global
         self._assignment: Assignment = assignment
 
+    @property
+    def is_global(self) -> bool:
+        """
+        Returns:
+            bool: True if the variable is declared in the global scope.
+        """
+        return self._is_global
+
+    @property
+    def assignment(self) -> Assignment:
+        """
+        Returns:
+            Assignment: The assignment operation that defines the variable name and value.
+        """
+        return self._assignment
+
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the variable declaration by performing the assignment.
 
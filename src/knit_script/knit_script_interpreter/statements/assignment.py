@@ -38,6 +38,14 @@ class Assignment(KS_Element):
         self._value_expression: Expression = value_expression
         self.variable_name: str = var_name
 
+    @property
+    def value_expression(self) -> Expression:
+        """
+        Returns:
+            Expression: The expression whose value is assigned to the variable.
+        """
+        return self._value_expression
+
     def assign_value(self, context: Knit_Script_Context, is_global: bool = False) -> Any:
         """Assign the evaluated value to the variable.
 
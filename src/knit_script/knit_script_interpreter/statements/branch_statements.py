@@ -41,6 +41,30 @@ class If_Statement(Statement):
         self._true_statement: Statement = true_statement
         self._false_statement: Statement | None = false_statement
 
+    @property
+    def condition(self) -> Expression:
+        """
+        Returns:
+            Expression: The boolean expression that determines which branch to execute.
+        """
+        return self._condition
+
+    @property
+    def true_statement(self) -> Statement:
+        """
+        Returns:
+            Statement: The statement to execute when the condition is True.
+        """
+        return self._true_statement
+
+    @property
+    def false_statement(self) -> Statement | None:
+        """
+        Returns:
+            Statement | None: The statement to execute when the condition is False or None if nothing is executed when the condition is False.
+        """
+        return self._false_statement
+
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the appropriate branch based on the condition result.
 
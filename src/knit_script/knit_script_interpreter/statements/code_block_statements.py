@@ -29,3 +29,11 @@ class Code_Block(Scoped_Statement):
         """
         super().__init__(parser_node, statements, collapse_scope_into_parent=True)
         self._statements: list[Statement] = statements
+
+    @property
+    def statements(self) -> list[Statement]:
+        """
+        Returns:
+            list[Statement]: The statements executed in the code block.
+        """
+        return self._statements
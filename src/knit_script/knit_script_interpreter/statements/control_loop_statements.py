@@ -5,13 +5,18 @@ It includes while loops for condition-based iteration and for-each loops for ite
 """
 
 from collections.abc import Iterable
-from typing import Any
+from typing import Any, cast
 
 from parglare.parser import LRStackNode
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.Loop_Invariant_Expression import Loop_Invariant_Expression
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+from knit_script.knit_script_interpreter.scope.variable_space import Variable_Space
+from knit_script.knit_script_interpreter.statements.code_block_statements import Code_Block
+from knit_script.knit_script_interpreter.statements.Row_Replay import Row_Replay
 from knit_script.knit_script_interpreter.statements.Statement import Statement
 
 
@@ -26,32 +31,89 @@ class While_Statement(Statement):
     Attributes:
         _condition (Expression): The boolean expression to evaluate before each iteration.
         _statement (Statement): The statement to execute with each iteration.
+        _row_replay (Row_Replay | None): The replay of the loop body's iterations, created on the first execution with loop replaying enabled.
+        _invariants (list[Loop_Invariant_Expression]): The loop-invariant expressions hoisted out of the condition and statement, evaluated once per execution of the loop.
     """
 
-    def __init__(self, parser_node: LRStackNode, condition: Expression, statement: Statement) -> None:
+    def __init__(self, parser_node: LRStackNode, condition: Expression, statement: Statement, invariants: list[Loop_Invariant_Expression] | None = None) -> None:
         """Initialize a while loop.
 
         Args:
             parser_node (LRStackNode): The parser node from the abstract syntax tree.
             condition (Expression): The boolean expression to evaluate before each iteration. Loop continues while this evaluates to a truthy value.
             statement (Statement): The statement to execute with each iteration of the loop.
+            invariants (list[Loop_Invariant_Expression] | None, optional): The loop-invariant expressions hoisted out of the condition and statement. Defaults to no hoisted expressions.
         """
         super().__init__(parser_node)
         self._condition: Expression = condition
         self._statement: Statement = statement
+        self._row_replay: Row_Replay | None = None
+        self._invariants: list[Loop_Invariant_Expression] = [] if invariants is None else invariants
+
+    @property
+    def condition(self) -> Expression:
+        """
+        Returns:
+            Expression: The boolean expression to evaluate before each iteration.
+        """
+        return self._condition
+
+    @property
+    def statement(self) -> Statement:
+        """
+        Returns:
+            Statement: The statement to execute with each iteration.
+        """
+        return self._statement
+
+    @property
+    def row_replay(self) -> Row_Replay | None:
+        """
+        Returns:
+            Row_Replay | None: The replay of the loop body's iterations or None if the loop has not been executed with loop replaying enabled.
+        """
+        return self._row_replay
+
+    def _get_row_replay(self, context: Knit_Script_Context) -> Row_Replay | None:
+        """
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+
+        Returns:
+            Row_Replay | None: The reset replay of the loop body or None if loop replaying is disabled, a debugger is attached, or the body cannot be replayed.
+        """
+        if not context.replay_loops or context.debugger is not None:
+            return None
+        if self._row_replay is None:
+            self._row_replay = Row_Replay(self._statement, [], [self._condition])
+        if not self._row_replay.replayable:
+            return None
+        self._row_replay.reset()
+        return self._row_replay
 
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the while loop.
 
         Evaluates the condition and executes the statement repeatedly until the condition becomes false. The condition is re-evaluated before each iteration.
+        If loop replaying is enabled, iterations that start from the same machine state as a recorded iteration are replayed.
+        Loop-invariant expressions are evaluated at most once in each execution of the loop.
 
         Args:
             context (Knit_Script_Context): The current execution context of the knit script interpreter.
         """
-        condition = self._condition.evaluate(context)
-        while condition:
-            self._statement.execute(context)
+        row_replay = self._get_row_replay(context)
+        prior_activations = [invariant.activate(context) for invariant in self._invariants]
+        try:
             condition = self._condition.evaluate(context)
+            while condition:
+                if row_replay is None:
+                    self._statement.execute(context)
+                else:
+                    row_replay.execute_iteration(context)
+                condition = self._condition.evaluate(context)
+        finally:
+            for invariant, prior_activation in zip(self._invariants, prior_activations, strict=True):
+                invariant.deactivate(prior_activation)
 
     def __str__(self) -> str:
         """Return string representation of the while loop.
@@ -84,9 +146,20 @@ class For_Each_Statement(Statement):
         var_name (str | None): Single variable name for simple iterations.
         _iter_expression (Expression | list[Expression]): Expression that evaluates to an iterable.
         _statement (Statement): Statement to execute with each iteration.
+        _row_replay (Row_Replay | None): The replay of the loop body's iterations, created on the first execution with loop replaying enabled.
+        _invariants (list[Loop_Invariant_Expression]): The loop-invariant expressions hoisted out of the statement, evaluated once per execution of the loop.
+        _reuse_body_scope (bool): True if all iterations can execute the body in one scope instead of entering and collapsing a new scope for each iteration.
     """
 
-    def __init__(self, parser_node: LRStackNode, variables: list[Variable_Expression], iter_expression: Expression | Iterable[Expression], statement: Statement) -> None:
+    def __init__(
+        self,
+        parser_node: LRStackNode,
+        variables: list[Variable_Expression],
+        iter_expression: Expression | Iterable[Expression],
+        statement: Statement,
+        invariants: list[Loop_Invariant_Expression] | None = None,
+        reuse_body_scope: bool = False,
+    ) -> None:
         """Initialize a for-each loop.
 
         Args:
@@ -95,6 +168,9 @@ class For_Each_Statement(Statement):
             If multiple variables, unpacks each iterated value.
             iter_expression (Expression | list[Expression]): Expression that evaluates to an iterable, or list of expressions to iterate over.
             statement (Statement): Statement to execute with each iteration of the loop.
+            invariants (list[Loop_Invariant_Expression] | None, optional): The loop-invariant expressions hoisted out of the statement. Defaults to no hoisted expressions.
+            reuse_body_scope (bool, optional):
+                True if the statement is a code block that does not bind the loop variables or machine settings, so one scope can be reused by all iterations. Defaults to False.
         """
         super().__init__(parser_node)
         self._variables: list[Variable_Expression] = variables
@@ -104,6 +180,58 @@ class For_Each_Statement(Statement):
             self.var_name = None  # multiple variables require unpacking
         self._iter_expression: Expression | Iterable[Expression] = iter_expression
         self._statement = statement
+        self._row_replay: Row_Replay | None = None
+        self._invariants: list[Loop_Invariant_Expression] = [] if invariants is None else invariants
+        self._reuse_body_scope: bool = reuse_body_scope
+
+    @property
+    def variables(self) -> list[Variable_Expression]:
+        """
+        Returns:
+            list[Variable_Expression]: The variables assigned on each iteration of the loop.
+        """
+        return self._variables
+
+    @property
+    def iter_expression(self) -> Expression | Iterable[Expression]:
+        """
+        Returns:
+            Expression | Iterable[Expression]: The expression that evaluates to the iterable or the list of expressions to iterate over.
+        """
+        return self._iter_expression
+
+    @property
+    def statement(self) -> Statement:
+        """
+        Returns:
+            Statement: The statement to execute with each iteration.
+        """
+        return self._statement
+
+    @property
+    def row_replay(self) -> Row_Replay | None:
+        """
+        Returns:
+            Row_Replay | None: The replay of the loop body's iterations or None if the loop has not been executed with loop replaying enabled.
+        """
+        return self._row_replay
+
+    def _get_row_replay(self, context: Knit_Script_Context) -> Row_Replay | None:
+        """
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+
+        Returns:
+            Row_Replay | None: The reset replay of the loop body or None if loop replaying is disabled, a debugger is attached, or the body cannot be replayed.
+        """
+        if not context.replay_loops or context.debugger is not None:
+            return None
+        if self._row_replay is None:
+            self._row_replay = Row_Replay(self._statement, [v.variable_name for v in self._variables])
+        if not self._row_replay.replayable:
+            return None
+        self._row_replay.reset()
+        return self._row_replay
 
     def _get_iterable(self, context: Knit_Script_Context) -> Iterable[Any]:
         if isinstance(self._iter_expression, Expression):
@@ -112,11 +240,61 @@ class For_Each_Statement(Statement):
         else:
             return [e.evaluate(context) for e in self._iter_expression]
 
+    def _iteration_values(self, var: Any) -> list[Any]:
+        """
+        Args:
+            var (Any): The value of the iterable for one iteration.
+
+        Returns:
+            list[Any]: The values to assign to each of the loop variables.
+
+        Raises:
+            ValueError: If unpacking multiple variables and the number of values doesn't match the number of variables.
+        """
+        if self.var_name is not None:
+            return [var]
+        iterated_var = [*var]
+        if len(iterated_var) != len(self._variables):
+            raise ValueError(f"Expected {len(self._variables)} variables, got {len(iterated_var)} from {iterated_var}")
+        return iterated_var
+
+    def _execute_in_body_scope(self, context: Knit_Script_Context, iterable: Iterable[Any]) -> None:
+        """Execute the iterations of the loop, reusing one scope for the body across all iterations.
+
+        The loop variables are declared once in the scope of the loop and rebound directly in its variable space on later iterations.
+        The body's statements execute in one child scope that is collapsed into the loop's scope when the loop ends, which has the same effect as collapsing a new scope after each iteration
+         because the body does not bind the loop variables or machine settings.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            iterable (Iterable[Any]): The values to iterate over.
+        """
+        body = cast(Code_Block, self._statement)
+        variable_names = [v.variable_name for v in self._variables]
+        loop_variable_space: Variable_Space | None = None
+        body_scope: Knit_Script_Scope | None = None
+        for var in iterable:
+            values = self._iteration_values(var)
+            if loop_variable_space is None or body_scope is None:
+                for variable_name, value in zip(variable_names, values, strict=True):
+                    loop_variable_space = context.variable_scope.declare_local(variable_name, value)
+                body_scope = context.enter_sub_scope()
+            else:
+                for variable_name, value in zip(variable_names, values, strict=True):
+                    loop_variable_space[variable_name] = value
+                body_scope.clear_return()  # a return does not stop the iterations of a loop.
+            body.execute_subscope_statements(context)
+        if body_scope is not None:
+            context.exit_current_scope(collapse_into_parent=True)
+
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the for-each loop.
 
         Iterates over the iterable expression, assigning values and executing the statement for each iteration.
         Handles both single variable assignment and multiple variable unpacking.
+        If loop replaying is enabled, iterations that start from the same machine state as a recorded iteration are replayed.
+        Otherwise, if the body does not bind the loop variables, all iterations reuse one scope for the body.
+        Loop-invariant expressions are evaluated at most once in each execution of the loop.
 
         Args:
             context (Knit_Script_Context): The current execution context of the knit script interpreter.
@@ -125,19 +303,25 @@ class For_Each_Statement(Statement):
             ValueError: If unpacking multiple variables and the number of values doesn't match the number of variables.
         """
         iterable = self._get_iterable(context)
+        row_replay = self._get_row_replay(context)
         new_var_names = set()
         for var_expression in self._variables:
             if var_expression.variable_name not in context.variable_scope:
                 new_var_names.add(var_expression.variable_name)
-        for var in iterable:
-            if self.var_name is not None:
-                context.variable_scope[self.var_name] = var  # update iterator variable in scope
-            else:  # multiple vars to unpack
-                iterated_var = [*var]
-                if len(iterated_var) != len(self._variables):
-                    raise ValueError(f"Expected {len(self._variables)} variables, got {len(iterated_var)} from {iterated_var}")
-                for var_name, var_val in zip(self._variables, iterated_var, strict=False):
-                    context.variable_scope[var_name.variable_name] = var_val
-            self._statement.execute(context)
+        prior_activations = [invariant.activate(context) for invariant in self._invariants]
+        try:
+            if row_replay is None and self._reuse_body_scope and context.debugger is None:
+                self._execute_in_body_scope(context, iterable)
+            else:
+                for var in iterable:
+                    for var_name, var_val in zip(self._variables, self._iteration_values(var), strict=True):
+                        context.variable_scope[var_name.variable_name] = var_val  # update iterator variable in scope
+                    if row_replay is None:
+                        self._statement.execute(context)
+                    else:
+                        row_replay.execute_iteration(context)
+        finally:
+            for invariant, prior_activation in zip(self._invariants, prior_activations, strict=True):
+                invariant.deactivate(prior_activation)
         for new_var in new_var_names:
             del context.variable_scope[new_var]
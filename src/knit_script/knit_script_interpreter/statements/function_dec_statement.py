@@ -4,17 +4,24 @@ This module provides classes for function declaration and execution in knit scri
 It includes the Function_Signature class for managing function objects and the Function_Declaration statement for creating and registering user-defined functions.
 """
 
+from __future__ import annotations
+
+import copy
 import warnings
-from typing import Any
+from typing import Any, cast
 
 from parglare.parser import LRStackNode
+from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
 
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
+from knit_script.knit_script_interpreter.expressions.values import Constant_Value
 from knit_script.knit_script_interpreter.expressions.variables import Variable_Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import KnitScript_Logging_Level
 from knit_script.knit_script_interpreter.ks_element import KS_Element
 from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
 from knit_script.knit_script_interpreter.statements.assignment import Assignment
+from knit_script.knit_script_interpreter.statements.Knitout_Recording import Knitout_Recording
 from knit_script.knit_script_interpreter.statements.Statement import Statement
 from knit_script.knit_script_warnings.Knit_Script_Warning import Shadow_Variable_Warning
 
@@ -28,15 +35,48 @@ class Function_Signature:
     This class provides the runtime representation of user-defined functions, encapsulating their parameters, body, default values, and execution context.
     It ensures proper scope isolation while allowing access to the module scope where the function was defined.
 
+    Functions declared with the pure decorator (e.g., "@pure def alt_tuck_cast_on(...)") promise that their knitout and effect on the machine only depend on the values of their parameters and the state of the machine.
+    Calls to these functions are memoized in a least-recently-used table of the context, keyed by the declaration, the parameter values, and the state fingerprint of the context at the start of the body.
+    A call that hits the table prints the recorded messages again, executes copies of the recorded knitout on the machine, and restores the resulting direction and Last_Pass instead of interpreting the body.
+
+    Functions that the static analysis of their declaration classifies as machine-independent only depend on the values of their parameters and never touch the machine.
+    Their arguments are evaluated in the scope of the caller and calls with immutable argument values (None, bools, numbers, strings, directions, and tuples of these) are memoized by value in a bounded table,
+     so a call that hits the table returns a copy of the memoized return value without setting up a function scope.
+
+    Small functions whose body is a single return statement may be inlined: calls with side-effect free arguments evaluate a copy of the returned expression in which each parameter read is replaced by its argument expression.
+    The copied expressions keep the parser nodes of the function body, so errors raised by an inlined call are attributed to the lines of the function.
+
+    Note:
+        Calls are not memoized if a parameter value is not hashable, the function returns a value other than None, a bool, a number, or a string, the function changes the gauged sheet layers, or a debugger is attached.
+
     Attributes:
         _name (str): The name of the function.
         _parameter_names (list[str]): List of parameter names in declaration order.
         _body (Statement): The statement body to execute when the function is called.
         _defaults (dict[str, Any]): Dictionary mapping parameter names to their default values.
         _module_scope (Knit_Script_Scope): The scope in which the function was defined.
+        _state_pure (bool): True if the function was declared pure and its calls are memoized.
+        _machine_independent (bool): True if the function only depends on the values of its parameters.
+        _inline_body (tuple[Expression, tuple[Variable_Expression, ...]] | None): The returned expression of an inlinable function and the variable expressions in it that read a parameter.
     """
 
-    def __init__(self, name: str, parameter_names: list[str], body: Statement, defaults: dict[str, Any], module_scope: Knit_Script_Scope | None, source_statement: KS_Element):
+    _MAX_STATE_PURE_CALLS: int = 64  # The least recently used calls in each context are evicted beyond this count.
+    _MEMOIZED_RETURN_TYPES: tuple[type, ...] = (type(None), bool, int, float, str)
+    _MAX_MACHINE_INDEPENDENT_CALLS: int = 1024  # The least recently used calls in each context are evicted beyond this count.
+    _IMMUTABLE_TYPES: tuple[type, ...] = (type(None), bool, int, float, str, Carriage_Pass_Direction)
+
+    def __init__(
+        self,
+        name: str,
+        parameter_names: list[str],
+        body: Statement,
+        defaults: dict[str, Any],
+        module_scope: Knit_Script_Scope | None,
+        source_statement: KS_Element,
+        state_pure: bool = False,
+        machine_independent: bool = False,
+        inline_body: tuple[Expression, tuple[Variable_Expression, ...]] | None = None,
+    ):
         """Initialize a function signature.
 
         Args:
@@ -46,6 +86,10 @@ class Function_Signature:
             body (Statement): The statement body to execute when the function is called.
             defaults (dict[str, Any]): Dictionary mapping parameter names to their default values.
             module_scope (Knit_Script_Scope): The scope in which the function was defined, used for lexical scoping.
+            state_pure (bool, optional): If True, the function was declared pure and its calls are memoized. Defaults to False.
+            machine_independent (bool, optional): If True, the function only depends on the values of its parameters and its calls are memoized by value. Defaults to False.
+            inline_body (tuple[Expression, tuple[Variable_Expression, ...]] | None, optional):
+                The returned expression of an inlinable function and the variable expressions in it that read a parameter. Defaults to None for functions that cannot be inlined.
         """
         self._source_statement: KS_Element = source_statement
         self._name: str = name
@@ -53,56 +97,267 @@ class Function_Signature:
         self._body: Statement = body
         self._defaults: dict[str, Any] = defaults
         self._module_scope: Knit_Script_Scope | None = module_scope
+        self._state_pure: bool = state_pure
+        self._machine_independent: bool = machine_independent
+        self._inline_body: tuple[Expression, tuple[Variable_Expression, ...]] | None = inline_body
+        self._declaration_key: tuple[str | None, str] | None = None
+        if state_pure or machine_independent:  # Functions are identified by their source so that declarations parsed by different programs share memoized calls.
+            location = source_statement.location
+            self._declaration_key = (source_statement.file_name, str(location.input_str)[location.start_position : location.end_position])
 
-    def execute(self, context: Knit_Script_Context, args: list[Expression], kwargs: list[Assignment]) -> Any:
-        """Execute the function with the given arguments.
+    @property
+    def machine_independent(self) -> bool:
+        """
+        Returns:
+            bool: True if the function only depends on the values of its parameters and never emits instructions or reads the machine state.
+        """
+        return self._machine_independent
 
-        Creates a new function scope, binds parameters to arguments, executes the function body, and returns the result.
-        Handles parameter validation, default value assignment, and proper scope management throughout the function call.
+    def inline_call(self, call: KS_Element, args: list[Expression], kwargs: list[Assignment]) -> Expression | None:
+        """
+        Args:
+            call (KS_Element): The function call to inline.
+            args (list[Expression]): Positional arguments passed to the function. Their evaluation must not have side effects.
+            kwargs (list[Assignment]): Keyword arguments passed as assignment objects with parameter names and values. Their evaluation must not have side effects.
 
+        Returns:
+            Expression | None: An expression that evaluates to the return value of the call or None if this function or the call cannot be inlined.
+        """
+        if self._inline_body is None or self._module_scope is not None or len(args) > len(self._parameter_names):  # Functions from modules resolve variables in their module scope.
+            return None
+        parameter_expressions: dict[str, Expression] = {p: Constant_Value(call.parser_node, v) for p, v in self._defaults.items()}
+        for param, exp in zip(self._parameter_names, args, strict=False):
+            if isinstance(exp, Assignment):  # passed keyword argument
+                kwargs = [exp, *kwargs]
+            else:
+                parameter_expressions[param] = exp
+        for assignment in kwargs:
+            if assignment.variable_name not in self._parameter_names or not isinstance(assignment.value_expression, Expression):
+                return None
+            parameter_expressions[assignment.variable_name] = assignment.value_expression
+        if any(p not in parameter_expressions for p in self._parameter_names):  # The call raises a missing parameter error when executed.
+            return None
+        returned_expression, parameter_reads = self._inline_body
+        substitutions: dict[int, KS_Element] = {id(read): parameter_expressions[read.variable_name] for read in parameter_reads}
+        return cast(Expression, returned_expression.copy_tree(substitutions))
+
+    @staticmethod
+    def _immutable_value_key(value: Any) -> tuple[Any, ...] | None:
+        """
         Args:
-            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            value (Any): A parameter value passed to a machine-independent function.
+
+        Returns:
+            tuple[Any, ...] | None: A key that identifies the given value and its type (so that equal values such as 1 and True are distinguished) or None if the value is not immutable.
+        """
+        if isinstance(value, tuple):
+            item_keys = tuple(Function_Signature._immutable_value_key(v) for v in value)
+            return None if None in item_keys else (tuple, item_keys)
+        elif isinstance(value, Function_Signature._IMMUTABLE_TYPES):
+            return type(value), value
+        return None
+
+    def _bind_arguments(self, context: Knit_Script_Context, args: list[Expression], kwargs: list[Assignment]) -> dict[str, Any]:
+        """Evaluate the arguments of a call in the scope of the caller and bind them to the parameters of this function.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter, in the scope of the caller.
             args (list[Expression]): Positional arguments passed to the function, evaluated in order.
             kwargs (list[Assignment]): Keyword arguments passed as assignment objects with parameter names and values.
 
         Returns:
-            Any: The return value of the function, or None if no return statement was executed.
+            dict[str, Any]: The value of each parameter of the function, starting from its default values.
 
         Raises:
             NameError: If an unexpected keyword argument is provided that doesn't match any parameter name.
             TypeError: If required parameters are missing values after processing all arguments and defaults.
         """
-        context.enter_sub_scope(function_name=self._name, module_scope=self._module_scope)  # enter function scope
-        filled_params = set()
-        for param, arg in self._defaults.items():  # assign defaults, may get overridden
-            context.variable_scope[param] = arg
-            filled_params.add(param)
+        parameter_values = dict(self._defaults)
         for param, exp in zip(self._parameter_names, args, strict=False):
             if isinstance(exp, Assignment):  # passed keyword argument
-                key = exp.variable_name
-                arg = exp.value(context)
-                if key not in self._parameter_names:
-                    raise NameError(f"Unexpected key {key} given to function {self._name}")
-                context.variable_scope[key] = arg
+                if exp.variable_name not in self._parameter_names:
+                    raise NameError(f"Unexpected key {exp.variable_name} given to function {self._name}")
+                parameter_values[exp.variable_name] = exp.value(context)
             else:
-                arg = exp.evaluate(context)
-                context.variable_scope[param] = arg
-                filled_params.add(param)
+                parameter_values[param] = exp.evaluate(context)
         for assignment in kwargs:
-            key = assignment.variable_name
-            if key not in self._parameter_names:
-                raise NameError(f"Unexpected key {key} given to function {self._name}")
-            assignment.assign_value(context)
-            filled_params.add(key)
-        missing_parameters = [p for p in self._parameter_names if p not in filled_params]
+            if assignment.variable_name not in self._parameter_names:
+                raise NameError(f"Unexpected key {assignment.variable_name} given to function {self._name}")
+            parameter_values[assignment.variable_name] = assignment.value(context)
+        missing_parameters = [p for p in self._parameter_names if p not in parameter_values]
         if len(missing_parameters) > 0:
             raise TypeError(f"Knit Script function {self._name} expected a value(s) for parameters: {missing_parameters}")
+        return parameter_values
+
+    def _enter_scope(self, context: Knit_Script_Context, parameter_values: dict[str, Any]) -> None:
+        """Enter a new function scope with the given parameter values.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            parameter_values (dict[str, Any]): The value of each parameter of the function.
+        """
+        context.enter_sub_scope(function_name=self._name, module_scope=self._module_scope)  # enter function scope
+        for param, value in parameter_values.items():
+            context.variable_scope[param] = value
+
+    def _execute_machine_independent(self, context: Knit_Script_Context, args: list[Expression], kwargs: list[Assignment]) -> Any:
+        """Execute a call to this machine-independent function, returning a memoized return value if the function was called with the same immutable argument values.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            args (list[Expression]): Positional arguments passed to the function, evaluated in order.
+            kwargs (list[Assignment]): Keyword arguments passed as assignment objects with parameter names and values.
+
+        Returns:
+            Any: The return value of the function, or None if no return statement was executed.
+        """
+        parameter_values = self._bind_arguments(context, args, kwargs)
+        value_keys = tuple(Function_Signature._immutable_value_key(parameter_values[p]) for p in self._parameter_names)
+        call_key = None if None in value_keys else (self._declaration_key, value_keys)
+        if call_key is not None and call_key in context.machine_independent_calls:
+            return_value = context.machine_independent_calls.pop(call_key)
+            context.machine_independent_calls[call_key] = return_value  # reinsert as the most recently used call
+            return copy.deepcopy(return_value)
+        self._enter_scope(context, parameter_values)
+        context.execute_body(self._body)  # execute function body
+        return_value = Function_Signature.exit_call(context)
+        if call_key is not None:
+            if len(context.machine_independent_calls) >= Function_Signature._MAX_MACHINE_INDEPENDENT_CALLS:
+                del context.machine_independent_calls[next(iter(context.machine_independent_calls))]  # evict the least recently used call
+            context.machine_independent_calls[call_key] = copy.deepcopy(return_value)  # copied so that the caller cannot modify the memoized value
+        return return_value
+
+    @staticmethod
+    def _memo_value(value: Any) -> Any:
+        """
+        Args:
+            value (Any): A parameter value passed to a pure function.
+
+        Returns:
+            Any: A hashable value that identifies the given value in the key of a memoized call.
 
-        self._body.execute(context)  # execute function body
+        Raises:
+            TypeError: If the value is not hashable.
+        """
+        if isinstance(value, (list, tuple)):
+            return type(value), tuple(Function_Signature._memo_value(v) for v in value)
+        hash(value)
+        return value
+
+    def _memoized_call_key(self, context: Knit_Script_Context) -> tuple[Any, ...] | None:
+        """
+        Args:
+            context (Knit_Script_Context): The current execution context with the parameters of this function bound in the current scope.
+
+        Returns:
+            tuple[Any, ...] | None: The key of this call in the memoized calls or None if the call cannot be memoized.
+        """
+        if not self._state_pure or context.debugger is not None:
+            return None
+        try:
+            parameter_values = tuple(Function_Signature._memo_value(context.variable_scope[p]) for p in self._parameter_names)
+        except TypeError:  # unhashable parameter value
+            return None
+        return self._declaration_key, parameter_values, context.state_fingerprint
+
+    @property
+    def body(self) -> Statement:
+        """
+        Returns:
+            Statement: The statement body executed when the function is called.
+        """
+        return self._body
+
+    @property
+    def trampolined(self) -> bool:
+        """
+        Returns:
+            bool: True if calls to this function can be executed by entering the call, executing the body, and exiting the call, without the memoization of pure or machine-independent functions.
+        """
+        return not self._machine_independent and not self._state_pure
+
+    def enter_call(self, context: Knit_Script_Context, args: list[Expression], kwargs: list[Assignment]) -> None:
+        """Bind the arguments of a call to the parameters of this function and enter a new function scope with the parameter values.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            args (list[Expression]): Positional arguments passed to the function, evaluated in order in the scope of the caller.
+            kwargs (list[Assignment]): Keyword arguments passed as assignment objects with parameter names and values.
+
+        Raises:
+            NameError: If an unexpected keyword argument is provided that doesn't match any parameter name.
+            TypeError: If required parameters are missing values after processing all arguments and defaults.
+        """
+        self._enter_scope(context, self._bind_arguments(context, args, kwargs))
+
+    @staticmethod
+    def exit_call(context: Knit_Script_Context) -> Any:
+        """Exit the function scope of a call whose body has been executed.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter, in the function scope entered by enter_call.
+
+        Returns:
+            Any: The return value of the call, or None if no return statement was executed.
+        """
         return_value = context.variable_scope.return_value  # store return value before exiting scope
         context.exit_current_scope()  # leave parameter scope
         return return_value
 
+    def execute(self, context: Knit_Script_Context, args: list[Expression], kwargs: list[Assignment]) -> Any:
+        """Execute the function with the given arguments.
+
+        Creates a new function scope, binds parameters to arguments, executes the function body, and returns the result.
+        Handles parameter validation, default value assignment, and proper scope management throughout the function call.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            args (list[Expression]): Positional arguments passed to the function, evaluated in order.
+            kwargs (list[Assignment]): Keyword arguments passed as assignment objects with parameter names and values.
+
+        Returns:
+            Any: The return value of the function, or None if no return statement was executed.
+
+        Raises:
+            NameError: If an unexpected keyword argument is provided that doesn't match any parameter name.
+            TypeError: If required parameters are missing values after processing all arguments and defaults.
+        """
+        if self._machine_independent and context.debugger is None:
+            return self._execute_machine_independent(context, args, kwargs)
+        self.enter_call(context, args, kwargs)
+
+        call_key = self._memoized_call_key(context)
+        if call_key is not None:
+            memoized_call = context.pure_calls.pop(call_key, None)
+            if memoized_call is not None:
+                context.pure_calls[call_key] = memoized_call  # reinsert as the most recently used call
+                context.exit_current_scope()
+                recording, return_value = memoized_call
+                recording.replay(context)
+                return return_value
+        start = len(context.knitout)
+        gauged_sheet_record = context.gauged_sheet_record
+        layer_hash = gauged_sheet_record.layer_hash
+        printed_messages: list[tuple[str, Any, KnitScript_Logging_Level]] = []
+        if call_key is not None:
+            context.print_recordings.append(printed_messages)
+        try:
+            context.execute_body(self._body)  # execute function body
+        finally:
+            if call_key is not None:
+                context.print_recordings.pop()
+        return_value = Function_Signature.exit_call(context)
+        if (
+            call_key is not None
+            and isinstance(return_value, Function_Signature._MEMOIZED_RETURN_TYPES)
+            and context.gauged_sheet_record is gauged_sheet_record
+            and gauged_sheet_record.layer_hash == layer_hash
+        ):
+            if len(context.pure_calls) >= Function_Signature._MAX_STATE_PURE_CALLS:
+                del context.pure_calls[next(iter(context.pure_calls))]  # evict the least recently used call
+            context.pure_calls[call_key] = Knitout_Recording(context.knitout[start:], context.direction, context.last_carriage_pass_result, printed_messages), return_value
+        return return_value
+
 
 class Function_Declaration(Statement):
     """Statement structure for declaring functions.
@@ -117,9 +372,22 @@ class Function_Declaration(Statement):
         _args (list[Variable_Expression]): List of variable expressions representing positional parameters.
         _kwargs (list[Assignment]): List of assignment objects representing keyword parameters with defaults.
         _body (Statement): The statement body to execute when the function is called.
+        _state_pure (bool): True if the function is declared pure and its calls are memoized.
+        _machine_independent (bool): True if the static analysis of the function found that it only depends on the values of its parameters.
+        _inline_body (tuple[Expression, tuple[Variable_Expression, ...]] | None): The returned expression of an inlinable function and the variable expressions in it that read a parameter.
     """
 
-    def __init__(self, parser_node: LRStackNode, func_name: str, args: list[Variable_Expression], kwargs: list[Assignment], body: Statement) -> None:
+    def __init__(
+        self,
+        parser_node: LRStackNode,
+        func_name: str,
+        args: list[Variable_Expression],
+        kwargs: list[Assignment],
+        body: Statement,
+        state_pure: bool = False,
+        machine_independent: bool = False,
+        inline_body: tuple[Expression, tuple[Variable_Expression, ...]] | None = None,
+    ) -> None:
         """Initialize a function declaration.
 
         Args:
@@ -128,12 +396,19 @@ class Function_Declaration(Statement):
             args (list[Variable_Expression]): List of variable expressions representing positional parameters.
             kwargs (list[Assignment]): List of assignment objects representing keyword parameters with default values.
             body (Statement): The statement body to execute when the function is called.
+            state_pure (bool, optional): If True, the function is declared pure and its calls are memoized. Defaults to False.
+            machine_independent (bool, optional): If True, the static analysis of the function found that it only depends on the values of its parameters. Defaults to False.
+            inline_body (tuple[Expression, tuple[Variable_Expression, ...]] | None, optional):
+                The returned expression of an inlinable function and the variable expressions in it that read a parameter. Defaults to None for functions that cannot be inlined.
         """
         super().__init__(parser_node)
         self._kwargs: list[Assignment] = kwargs
         self._args: list[Variable_Expression] = args
         self._body: Statement = body
         self._func_name: str = func_name
+        self._state_pure: bool = state_pure
+        self._machine_independent: bool = machine_independent
+        self._inline_body: tuple[Expression, tuple[Variable_Expression, ...]] | None = inline_body
 
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the function declaration by creating and storing the function.
@@ -156,5 +431,5 @@ class Function_Declaration(Statement):
                 warnings.warn(Shadow_Variable_Warning(kwarg.variable_name), self, stacklevel=1)
             defaults[kwarg.variable_name] = kwarg.value(context)
 
-        function = Function_Signature(self._func_name, params, self._body, defaults, context.variable_scope.module_scope, self)
+        function = Function_Signature(self._func_name, params, self._body, defaults, context.variable_scope.module_scope, self, self._state_pure, self._machine_independent, self._inline_body)
         context.variable_scope[self._func_name] = function  # assign to current scope
@@ -74,7 +74,7 @@ class In_Direction_Statement(Statement):
             for needle in needles:
                 needles_to_instruction[needle] = instruction
 
-        machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, direction)
+        machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, direction, context=context)
         context.last_carriage_pass_result = machine_pass.write_knitout(context)
         if not has_splits:  # no second needle to report
             context.last_carriage_pass_result = list(context.last_carriage_pass_result.keys())
@@ -34,6 +34,14 @@ class Return_Statement(Statement):
         super().__init__(parser_node)
         self._expression: Expression = exp
 
+    @property
+    def expression(self) -> Expression:
+        """
+        Returns:
+            Expression: The expression whose value is returned.
+        """
+        return self._expression
+
     def execute(self, context: Knit_Script_Context) -> None:
         """Execute the return by setting the return value and return flag.
 
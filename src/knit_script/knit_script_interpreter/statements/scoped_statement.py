@@ -48,8 +48,17 @@ class Scoped_Statement(Statement):
         context.enter_sub_scope()  # make sub scope with variable changes
         execute_statements = self.pre_scope_action(context)
         if execute_statements:
-            for statement in self._subscope_statements:
-                statement.execute(context)
-                if context.variable_scope.returned:  # executed statement updated scope with return value
-                    break  # don't continue to execute block statements
+            self.execute_subscope_statements(context)
         context.exit_current_scope(collapse_into_parent=self._collapse_scope_into_parent)
+
+    def execute_subscope_statements(self, context: Knit_Script_Context) -> None:
+        """Execute the sub-scoped statement(s) in the current scope, without entering a new scope or taking the pre-scope action.
+        If any statement triggers a return, execution stops early.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+        """
+        for statement in self._subscope_statements:
+            statement.execute(context)
+            if context.variable_scope.returned:  # executed statement updated scope with return value
+                break  # don't continue to execute block statements
@@ -6,6 +6,7 @@ It allows programs to gracefully handle errors and exceptions that may occur dur
 
 from parglare.parser import LRStackNode
 
+from knit_script.knit_script_exceptions.execution_limit_exceptions import Execution_Interrupted_Exception
 from knit_script.knit_script_interpreter.expressions.expressions import Expression
 from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
 from knit_script.knit_script_interpreter.statements.assignment import Assignment
@@ -49,19 +50,51 @@ class Try_Catch_Statement(Statement):
         Attempts to execute the try statement. If an exception occurs and matches one of the specified error types (or if no types are specified), executes the catch statement.
         If the error expression is an Assignment, binds the exception to the specified variable name in a new scope.
 
+        If the context has transactional try statements, the try statement is executed in a transaction of the machine state journal.
+        The changes that the try statement made to the machine state, knitout, and machine scope are rolled back when it raises an exception, so the catch statement starts from the state before the try statement.
+
+        Exceptions raised when the program exceeds its execution limits or is cancelled are not caught, so that they stop the program.
+
         Args:
             context (Knit_Script_Context): The current execution context of the knit script interpreter.
         """
+        if not context.transactional_try:
+            try:
+                self._try_statement.execute(context)
+            except Execution_Interrupted_Exception:
+                raise
+            except Exception as e:
+                self._catch(context, e)
+            return
+        context.begin_transaction()
         try:
             self._try_statement.execute(context)
+        except Execution_Interrupted_Exception:
+            context.commit_transaction()  # Keep the partial state so that it is written to the error file.
+            raise
         except Exception as e:
-            if len(self._errors) > 0:
-                for error_exp in self._errors:
-                    error = error_exp.value(context) if isinstance(error_exp, Assignment) else error_exp.evaluate(context)
-                    if isinstance(e, error):
-                        if isinstance(error_exp, Assignment):
-                            context.variable_scope[error_exp.variable_name] = e
-                        self._catch_statement.execute(context)
-                        break
-            else:  # accept all errors
-                self._catch_statement.execute(context)
+            context.rollback_transaction()
+            self._catch(context, e)
+        except BaseException:
+            context.commit_transaction()  # Keep the partial state so that it is written to the error file.
+            raise
+        else:
+            context.commit_transaction()
+
+    def _catch(self, context: Knit_Script_Context, e: Exception) -> None:
+        """Execute the catch statement if the given exception matches one of the specified error types or if no types are specified.
+
+        Args:
+            context (Knit_Script_Context): The current execution context of the knit script interpreter.
+            e (Exception): The exception raised by the try statement.
+        """
+        if len(self._errors) > 0:
+            for error_exp in self._errors:
+                error = error_exp.value(context) if isinstance(error_exp, Assignment) else error_exp.evaluate(context)
+                if isinstance(e, error):
+                    if isinstance(error_exp, Assignment):
+                        context.variable_scope[error_exp.variable_name] = e
+                    self._catch_statement.execute(context)
+                    break
+        else:  # accept all errors
+            self._catch_statement.execute(context)
@@ -85,14 +85,14 @@ class Xfer_Pass_Statement(Statement):
             results = {}
             front_needles_to_instruction = {n: i for n, i in needles_to_instruction.items() if n.is_front}
             if len(front_needles_to_instruction) > 0:
-                machine_pass = Carriage_Pass_Specification(self, front_needles_to_instruction, target_bed=target_bed, racking=racking, to_sliders=self._is_sliders)
+                machine_pass = Carriage_Pass_Specification(self, front_needles_to_instruction, target_bed=target_bed, racking=racking, to_sliders=self._is_sliders, context=context)
                 results.update(machine_pass.write_knitout(context))
             back_needles_to_instruction = {n: i for n, i in needles_to_instruction.items() if n.is_back}
             if len(back_needles_to_instruction) > 0:
-                machine_pass = Carriage_Pass_Specification(self, back_needles_to_instruction, target_bed=target_bed, racking=racking * -1, to_sliders=self._is_sliders)
+                machine_pass = Carriage_Pass_Specification(self, back_needles_to_instruction, target_bed=target_bed, racking=racking * -1, to_sliders=self._is_sliders, context=context)
                 # racking is reversed for back bed xfers
                 results.update(machine_pass.write_knitout(context))
             context.last_carriage_pass_result = results
         else:
-            machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, target_bed=target_bed, racking=racking, to_sliders=self._is_sliders)
+            machine_pass = Carriage_Pass_Specification(self, needles_to_instruction, target_bed=target_bed, racking=racking, to_sliders=self._is_sliders, context=context)
             context.last_carriage_pass_result = machine_pass.write_knitout(context)
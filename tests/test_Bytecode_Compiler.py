@@ -0,0 +1,214 @@
+from typing import Any
+from unittest import TestCase
+
+from resources.load_test_resources import load_test_resource
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.bytecode.Bytecode_Compiler import Bytecode_Compiler, Opcode
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import KnitScript_Warning_Log
+
+
+class _Recording_Warning_Log(KnitScript_Warning_Log):
+    def __init__(self) -> None:
+        super().__init__(log_to_console=False)
+        self.messages: list[str] = []
+
+    def print(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class Test_Bytecode_Compiler(TestCase):
+
+    @staticmethod
+    def _execute(program: str, compile_bytecode: bool, pattern_is_file: bool = False, **python_variables: Any) -> tuple[list[str], Any]:
+        interpreter = Knit_Script_Interpreter(
+            info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), compile_bytecode=compile_bytecode
+        )
+        knitout, _, __, return_value = interpreter.write_knitout(program, "test.k", pattern_is_file, **python_variables)
+        return [str(k) for k in knitout], return_value
+
+    def _assert_bytecode_matches(self, program: str, pattern_is_file: bool = False, **python_variables: Any) -> Any:
+        """Differential test: the register machine must produce the same knitout and return value as the tree-walking interpreter."""
+        tree_walked = self._execute(program, False, pattern_is_file, **python_variables)
+        compiled = self._execute(program, True, pattern_is_file, **python_variables)
+        self.assertEqual(tree_walked, compiled)
+        return compiled[1]
+
+    def test_compiled_control_flow(self):
+        program = r"""
+        total = 0;
+        for i in range(4):{
+            if i % 2 == 0 and i > 0:{
+                total = total + i;
+            } else:{
+                total = total - 1;
+            }
+        }
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:4];
+            }
+        }
+        """
+        statements = Knit_Script_Parser().parse(program)
+        for_opcodes = Bytecode_Compiler().compile(statements[1]).opcodes
+        self.assertIn(Opcode.FOR_NEXT, for_opcodes)
+        self.assertIn(Opcode.JUMP_IF_FALSE, for_opcodes)
+        self.assertIn(Opcode.BINARY, for_opcodes)
+        self.assertNotIn(Opcode.EXEC, for_opcodes)
+        self.assertEqual(for_opcodes.count(Opcode.CALL), 1)
+        self.assertNotIn(Opcode.EVAL, for_opcodes)
+        with_opcodes = Bytecode_Compiler().compile(statements[2]).opcodes
+        self.assertIn(Opcode.CARRIAGE_PASS, with_opcodes)
+        self.assertIn(Opcode.PRE_SCOPE, with_opcodes)
+        self.assertEqual(Bytecode_Compiler(replay_loops=True).compile(statements[1]).opcodes, [Opcode.EXEC])
+
+    def test_loops_and_branches(self):
+        program = r"""
+        total = 0;
+        for i in range(6):{
+            if i % 2 == 0 and i > 0:{
+                total = total + i;
+            } elif i == 3 or i == 5:{
+                total = total * 2;
+            } else:{
+                total = total - 1;
+            }
+        }
+        for i, j in [[1, 2], [3, 4]]:{
+            total = total + i * j;
+        }
+        n = 0;
+        done = False;
+        while not done:{
+            n = n + 1;
+            done = n >= 5;
+        }
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:width:2];
+            }
+            in Rightward direction:{
+                tuck Front_Needles[1:width:2];
+            }
+            releasehook;
+            for _ in range(height):{
+                in reverse direction:{
+                    knit Loops;
+                }
+                xfer Front_Loops across;
+                xfer Last_Pass across;
+            }
+        }
+        return [total, n];
+        """
+        self.assertEqual(self._assert_bytecode_matches(program, width=6, height=3), [20, 5])
+
+    def test_functions(self):
+        program = r"""
+        def fib(n):{
+            if n < 2:{
+                return n;
+            }
+            return fib(n - 1) + fib(n - 2);
+        }
+        def last(values, offset=0):{
+            for v in values:{
+                return v + offset;
+            }
+        }
+        def declare():{
+            global declared = fib(6);
+        }
+        declare();
+        return [fib(10), last([1, 2, 3], offset=10), declared];
+        """
+        self.assertEqual(self._assert_bytecode_matches(program), [55, 13, 8])
+
+    def test_deep_recursion(self):
+        program = r"""
+        def depth(n):{
+            if n == 0:{
+                return 0;
+            }
+            return depth(n - 1) + 1;
+        }
+        return depth(levels);
+        """
+        with self.assertRaises(RecursionError):
+            self._execute(program, False, levels=2000)
+        self.assertEqual(self._execute(program, True, levels=2000)[1], 2000)
+
+    def test_loop_variable_scope(self):
+        program = r"""
+        for i in range(3):{
+            x = i;
+        }
+        k = 10;
+        for k in range(2):{
+            y = k;
+        }
+        return [x, y, k, "i" in dir()];
+        """
+        self._assert_bytecode_matches(program)
+
+    def test_errors_annotated(self):
+        program = r"""
+        x = 0;
+        for i in range(3):{
+            x = 1 / (1 - i);
+        }
+        """
+        notes = []
+        for compile_bytecode in [False, True]:
+            with self.assertRaises(ZeroDivisionError) as raised:
+                self._execute(program, compile_bytecode)
+            notes.append(raised.exception.__notes__)
+        self.assertEqual(notes[0], notes[1])
+
+    @staticmethod
+    def _warnings(program: str, compile_bytecode: bool, pattern_is_file: bool = False, **python_variables: Any) -> list[str]:
+        warning_logger = _Recording_Warning_Log()
+        interpreter = Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=warning_logger, error_logger=get_test_error_logger(), compile_bytecode=compile_bytecode)
+        interpreter.write_knitout(program, "test.k", pattern_is_file, **python_variables)
+        return warning_logger.messages
+
+    def test_warnings_match_tree_walking(self):
+        program = r"""
+        global g = 1;
+        g = 2;
+        def add_g(x):{ return x + g; }
+        total = 0;
+        for i in range(2):{
+            total = total + add_g(i);
+            print(f"{g}");
+        }
+        """
+        programs = {
+            "shadowed global": (program, False, {}),
+            "xfer_rackings.ks": (load_test_resource("xfer_rackings.ks"), True, {"c": 1, "pattern_width": 6, "pattern_height": 4}),
+            "weird_carriage_moves.ks": (load_test_resource("weird_carriage_moves.ks"), True, {"c": 1, "pattern_width": 6, "pattern_height": 4}),
+        }
+        for name, (source, pattern_is_file, python_variables) in programs.items():
+            with self.subTest(program=name):
+                tree_walked = self._warnings(source, False, pattern_is_file, **python_variables)
+                self.assertGreater(len(tree_walked), 0)
+                self.assertEqual(self._warnings(source, True, pattern_is_file, **python_variables), tree_walked)
+
+    def test_examples(self):
+        examples = {
+            "stst.ks": {"c": 1, "pattern_width": 4, "pattern_height": 4},
+            "cable.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "gauged_sheets.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "lace.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "rib.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "short_rows.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4, "base": 2, "shorts": 1},
+            "splits.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "tube.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "jacquard_stripes.ks": {"pattern_width": 6, "pattern_height": 4, "white": 1, "black": 2},
+        }
+        for example, python_variables in examples.items():
+            with self.subTest(example=example):
+                self._assert_bytecode_matches(load_test_resource(example), pattern_is_file=True, **python_variables)
@@ -1,6 +1,11 @@
 from unittest import TestCase
 
+from knitout_interpreter.knitout_operations.needle_instructions import Knit_Instruction, Tuck_Instruction
 from resources.interpret_test_ks import interpret_test_ks
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
 
 
 class TestCarriage_Pass_Specification(TestCase):
@@ -15,3 +20,128 @@ class TestCarriage_Pass_Specification(TestCase):
             miss Front_Loops;
         }"""
         interpret_test_ks(program, print_k_lines=False)
+
+    def test_wide_knit_pass_order(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:200];
+        }
+        releasehook;
+        in Rightward direction:{
+            knit Front_Loops;
+        }"""
+        klines, _, __ = interpret_test_ks(program, print_k_lines=False)
+        knits = [k for k in klines if isinstance(k, Knit_Instruction)]
+        self.assertEqual(200, len(knits))
+        self.assertEqual(list(range(200)), [k.needle.position for k in knits])
+
+    def test_gauged_pass_records_sheets(self):
+        program = r"""
+        Carrier = c1;
+        Gauge = 2;
+        Sheet = s0;
+        in Leftward direction:{
+            tuck Front_Needles[0:10];
+        }
+        releasehook;
+        Sheet = s1;
+        in Rightward direction:{
+            tuck Back_Needles[0:10];
+        }
+        Sheet = s0;
+        assert len(Front_Loops) == 10 and len(Back_Loops) == 0;
+        """
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_unordered_needles_are_sorted(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck [f3, f1, f5, f2, f4];
+        }
+        releasehook;
+        in Rightward direction:{
+            knit [f4, f2, f5, f1, f3];
+        }"""
+        klines, _, __ = interpret_test_ks(program, print_k_lines=False)
+        tucks = [k.needle.position for k in klines if isinstance(k, Tuck_Instruction)]
+        knits = [k.needle.position for k in klines if isinstance(k, Knit_Instruction)]
+        self.assertEqual([5, 4, 3, 2, 1], tucks)
+        self.assertEqual([1, 2, 3, 4, 5], knits)
+
+    def test_all_needle_pass_order(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            knit Front_Needles[0:4], Back_Needles[0:4];
+        }
+        """
+        klines, _, __ = interpret_test_ks(program, print_k_lines=False)
+        knits = [str(k.needle) for k in klines if isinstance(k, Knit_Instruction)]
+        self.assertEqual(["b3", "f3", "b2", "f2", "b1", "f1", "b0", "f0"], knits)
+
+    def test_repeated_pass_order(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:4];
+        }
+        releasehook;
+        for r in range(4):{
+            in reverse direction:{
+                knit [f2, f0, f3, f1];
+            }
+        }"""
+        klines, _, __ = interpret_test_ks(program, print_k_lines=False)
+        knits = [k.needle.position for k in klines if isinstance(k, Knit_Instruction)]
+        self.assertEqual([0, 1, 2, 3, 3, 2, 1, 0] * 2, knits)
+
+    def test_repeated_pass_with_drops(self):
+        program = r"""
+        Carrier = c1;
+        for r in range(2):{
+            in Leftward direction:{
+                tuck Front_Needles[0:4];
+            }
+            releasehook;
+            in Rightward direction:{
+                knit Front_Needles[0:2];
+                drop Front_Needles[2:4];
+            }
+            assert len(Front_Loops) == 2;
+            in Leftward direction:{
+                drop Front_Needles[0:2];
+            }
+            assert len(Front_Loops) == 0;
+        }"""
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_pass_plans_are_kept_per_context_by_needle_position(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:4];
+        }
+        releasehook;
+        for r in range(4):{
+            in reverse direction:{
+                knit Front_Loops;
+            }
+        }
+        in reverse direction:{
+            knit [f0, f1, f2, f3];
+        }
+        return Last_Pass;
+        """
+        contexts = []
+        for _ in range(2):
+            interpreter = Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger())
+            context = interpreter._knitscript_context
+            last_pass = context.execute_statements(interpreter.parse(program))
+            self.assertEqual(sorted(needle.position for needle in last_pass), [0, 1, 2, 3])
+            self.assertEqual(len(context.pass_plans), 2)  # The tuck pass and the knit passes on the same needle positions.
+            for plan_key in context.pass_plans:
+                self.assertFalse(any(isinstance(value, Needle) for needle_key in plan_key[4] for value in needle_key))
+            contexts.append(context)
+        self.assertIsNot(contexts[0].pass_plans, contexts[1].pass_plans)
@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from unittest import TestCase
+
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_exceptions.execution_limit_exceptions import Execution_Cancelled_Exception, Execution_Limit_Exception
+from knit_script.knit_script_interpreter.Execution_Limits import Cancellation_Token, Execution_Limits
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+
+
+class Test_Execution_Limits(TestCase):
+    cast_on = r"""
+    width = 6;
+    Carrier = c;
+    in Leftward direction:{
+        tuck Front_Needles[1:width:2];
+    }
+    in reverse direction:{
+        tuck Front_Needles[0:width:2];
+    }
+    releasehook;
+    """
+    endless_rows = r"""
+    while True:{
+        in reverse direction:{
+            knit Loops;
+        }
+    }
+    """
+
+    def tearDown(self):
+        if os.path.exists("error.k"):
+            os.remove("error.k")
+
+    @staticmethod
+    def _interpreter(execution_limits: Execution_Limits, compile_bytecode: bool = False) -> Knit_Script_Interpreter:
+        return Knit_Script_Interpreter(
+            info_logger=get_test_info_logger(),
+            warning_logger=get_test_warning_logger(),
+            error_logger=get_test_error_logger(),
+            compile_bytecode=compile_bytecode,
+            execution_limits=execution_limits,
+        )
+
+    def _assert_limit(self, program: str, execution_limits: Execution_Limits, limit_name: str, compile_bytecode: bool = False) -> None:
+        with self.assertRaises(Execution_Limit_Exception) as raised:
+            self._interpreter(execution_limits, compile_bytecode).write_knitout(program, "test.k", c=1)
+        self.assertEqual(raised.exception.limit_name, limit_name)
+
+    def test_statement_limit_stops_endless_loop(self):
+        counts = []
+        for compile_bytecode in [False, True]:
+            with self.subTest(compile_bytecode=compile_bytecode):
+                execution_limits = Execution_Limits(max_statements=100)
+                self._assert_limit(self.cast_on + self.endless_rows, execution_limits, "max_statements", compile_bytecode)
+                self.assertEqual(execution_limits.statements_executed, 101)
+                with open("error.k") as error_file:
+                    self.assertIn("knit", error_file.read())  # The rows knit before the limit are written to the error file.
+                unlimited = Execution_Limits()
+                self._interpreter(unlimited, compile_bytecode).write_knitout(self.cast_on + "i = 0; while i < 3:{ i = i + 1; }", "test.k", c=1)
+                counts.append(unlimited.statements_executed)
+        self.assertEqual(counts[0], counts[1])  # Compiled statements are charged like the statements of the tree-walking interpreter.
+
+    def test_knitout_line_limit(self):
+        self._assert_limit(self.cast_on + self.endless_rows, Execution_Limits(max_knitout_lines=100), "max_knitout_lines")
+
+    def test_wall_time_limit(self):
+        for compile_bytecode in [False, True]:
+            with self.subTest(compile_bytecode=compile_bytecode):
+                start = time.monotonic()
+                self._assert_limit("i = 0; while True:{ i = i + 1; squares = [j * j for j in range(10)]; }", Execution_Limits(max_wall_time=0.2), "max_wall_time", compile_bytecode)
+                self.assertLess(time.monotonic() - start, 5)
+
+    def test_scope_depth_limit(self):
+        recursion = r"""
+        def recurse(n):{
+            return recurse(n + 1);
+        }
+        recurse(0);
+        """
+        for compile_bytecode in [False, True]:
+            with self.subTest(compile_bytecode=compile_bytecode):
+                self._assert_limit(recursion, Execution_Limits(max_scope_depth=20), "max_scope_depth", compile_bytecode)
+
+    def test_limits_are_not_caught_by_try_catch(self):
+        program = r"""
+        try:{
+            while True:{
+                spin = True;
+            }
+        }
+        catch:{
+            caught = True;
+        }
+        """
+        self._assert_limit(program, Execution_Limits(max_statements=50), "max_statements")
+
+    def test_limits_reset_for_each_program(self):
+        execution_limits = Execution_Limits(max_statements=20)
+        interpreter = self._interpreter(execution_limits)
+        for _ in range(3):
+            interpreter.write_knitout("i = 0; while i < 5:{ i = i + 1; }", "test.k")
+            self.assertLessEqual(execution_limits.statements_executed, 20)
+
+    def test_cancellation_from_another_thread(self):
+        for compile_bytecode in [False, True]:
+            with self.subTest(compile_bytecode=compile_bytecode):
+                token = Cancellation_Token()
+                interpreter = self._interpreter(Execution_Limits(cancellation_token=token), compile_bytecode)
+                raised: list[BaseException] = []
+
+                def run() -> None:
+                    try:
+                        interpreter.write_knitout(self.cast_on + self.endless_rows, "test.k", c=1)
+                    except BaseException as e:
+                        raised.append(e)
+
+                worker = threading.Thread(target=run)
+                worker.start()
+                time.sleep(0.2)
+                token.cancel("shutting down")
+                worker.join(timeout=10)
+                self.assertFalse(worker.is_alive())
+                self.assertEqual(len(raised), 1)
+                self.assertIsInstance(raised[0], Execution_Cancelled_Exception)
+                self.assertEqual(raised[0].reason, "shutting down")
+                with open("error.k") as error_file:
+                    self.assertIn("outhook", error_file.read())  # The partial knitout ends by cutting the active carriers.
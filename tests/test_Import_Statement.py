@@ -1,8 +1,17 @@
+import os
+from types import ModuleType
 from unittest import TestCase
 
 from knitout_interpreter.knitout_operations.needle_instructions import Tuck_Instruction
 from resources.interpret_test_ks import count_lines, interpret_test_ks, interpret_test_ks_with_return
 from resources.load_test_resources import load_test_resource
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.scope.import_resolution_index import Import_Resolution_Index
+from knit_script.knit_script_interpreter.scope.lazy_module import Lazy_Knit_Script_Module
+from knit_script.knit_script_interpreter.scope.module_registry import Knit_Script_Module_Registry
 
 
 class Test_Imports(TestCase):
@@ -38,3 +47,71 @@ class Test_Imports(TestCase):
     def test_import_local_ks_module(self):
         program = load_test_resource("imports_ks.ks")
         interpret_test_ks(program, pattern_is_filename=True, print_k_lines=False)
+
+    def test_reimport_local_ks_module(self):
+        program = load_test_resource("reimports_ks.ks")
+        for _ in range(2):  # The second program reuses the parsed module but executes it in its own context.
+            module_loads = []
+            _, __, ___, return_value = interpret_test_ks_with_return(program, pattern_is_filename=True, print_k_lines=False, module_loads=module_loads)
+            self.assertEqual([1, "dog"], return_value)
+            self.assertEqual(["counted_import_ks"], module_loads)
+        module_path = Knit_Script_Module_Registry.resolved_path(load_test_resource("counted_import_ks.ks"))
+        self.assertIn(module_path, Knit_Script_Module_Registry._PARSED_MODULES)
+
+    def test_parsed_module_copied_for_each_context(self):
+        module_path = load_test_resource("counted_import_ks.ks")
+        parser = Knit_Script_Parser()
+        first_registry, second_registry = Knit_Script_Module_Registry(), Knit_Script_Module_Registry()
+        first_statements = first_registry.parse_module(parser, module_path)
+        self.assertIs(first_statements, first_registry.parse_module(parser, module_path))  # Repeated imports in a context reuse its copy.
+        second_statements = second_registry.parse_module(parser, module_path)
+        self.assertEqual(len(first_statements), len(second_statements))
+        for first_statement, second_statement in zip(first_statements, second_statements, strict=True):
+            self.assertIsNot(first_statement, second_statement)  # Caches filled by executing the statements are not shared between contexts.
+            self.assertIs(first_statement.parser_node, second_statement.parser_node)  # The copies share the parse of the module file.
+
+    def test_import_resolution_index(self):
+        index = Import_Resolution_Index()
+        local_path = os.path.dirname(load_test_resource("importable_ks.ks"))
+        self.assertIsInstance(index.resolve("random", None), ModuleType)
+        self.assertEqual("knit_script.knit_script_std_library.needles", index.resolve("needles", None).__name__)
+        self.assertEqual("cast_ons.ks", os.path.basename(index.resolve("cast_ons", local_path)))
+        self.assertEqual(os.path.join(local_path, "importable_ks.ks"), index.resolve("importable_ks", local_path))
+        self.assertIsNone(index.resolve("importable_ks", None))
+        self.assertIsNone(index.resolve("not_a_module", local_path))
+        self.assertIn("not_a_module", index._missing_python_modules)
+        self.assertIn((local_path, "not_a_module"), index._resolutions)
+        index._directory_ks_files[local_path] = frozenset()  # Repeated imports are resolved from the index without listing the directory again.
+        self.assertEqual(os.path.join(local_path, "importable_ks.ks"), index.resolve("importable_ks", local_path))
+
+    def test_import_missing_module(self):
+        program = r"""
+        for i in range(2):{
+            import not_a_module;
+        }
+        """
+        with self.assertRaises(ImportError):
+            interpret_test_ks(program, print_k_lines=False)
+
+    def test_lazy_import_local_ks_module(self):
+        program = load_test_resource("lazy_imports_ks.ks")
+        for access in [False, True]:
+            module_loads = []
+            interpreter = Knit_Script_Interpreter(
+                info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), lazy_modules=True
+            )
+            _, __, ___, (module, width) = interpreter.write_knitout(program, "test.k", pattern_is_file=True, access=access, module_loads=module_loads)
+            self.assertIsInstance(module, Lazy_Knit_Script_Module)
+            self.assertEqual(access, module.loaded)
+            self.assertEqual(4 if access else None, width)
+            self.assertEqual(["counted_import_ks"], module_loads)  # Modules with side effects are executed when they are imported.
+
+    def test_lazy_import_ks_in_std_library(self):
+        program = r"""
+        import cast_ons;
+        Carrier = c1;
+        cast_ons.alt_tuck_cast_on(5, knit_lines =1, tuck_lines=1);
+        """
+        interpreter = Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), lazy_modules=True)
+        klines, _, __, ___ = interpreter.write_knitout(program, "test.k")
+        self.assertEqual(5, count_lines(klines, include_types={Tuck_Instruction}))
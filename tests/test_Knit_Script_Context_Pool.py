@@ -0,0 +1,91 @@
+from typing import Any
+from unittest import TestCase
+
+from resources.load_test_resources import load_test_resource
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knit_script_context_pool import Knit_Script_Context_Pool
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+
+
+class Test_Knit_Script_Context_Pool(TestCase):
+
+    @staticmethod
+    def _interpreter(context_pool: Knit_Script_Context_Pool | None = None) -> Knit_Script_Interpreter:
+        return Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), context_pool=context_pool)
+
+    @staticmethod
+    def _knitout(interpreter: Knit_Script_Interpreter, example: str, **python_variables: Any) -> list[str]:
+        knitout, _, __, ___ = interpreter.write_knitout(load_test_resource(example), "test.k", pattern_is_file=True, **python_variables)
+        return [str(k) for k in knitout]
+
+    def test_pooled_interpreter_matches_new_contexts(self):
+        pooled_interpreter = self._interpreter(Knit_Script_Context_Pool())
+        examples = {
+            "stst.ks": {"c": 1, "pattern_width": 4, "pattern_height": 4},
+            "gauged_sheets.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4},
+            "short_rows.ks": {"c": 1, "pattern_width": 6, "pattern_height": 4, "base": 2, "shorts": 1},
+            "jacquard_stripes.ks": {"pattern_width": 6, "pattern_height": 4, "white": 1, "black": 2},
+        }
+        for example, python_variables in examples.items():
+            with self.subTest(example=example):
+                expected_knitout = self._knitout(self._interpreter(), example, **python_variables)
+                self.assertEqual(self._knitout(pooled_interpreter, example, **python_variables), expected_knitout)
+                self.assertEqual(self._knitout(pooled_interpreter, example, **python_variables), expected_knitout)
+
+    def test_pooled_interpreter_returns_program_results(self):
+        program = r"""
+        with Carrier as 1:{
+            in Leftward direction:{ tuck Front_Needles[0:6]; }
+        }
+        """
+        interpreter = self._interpreter(Knit_Script_Context_Pool())
+        for _ in range(2):  # The second program runs in a context released to the pool by the first.
+            _, knit_graph, machine, __ = interpreter.write_knitout(program, "test.k")
+            self.assertEqual(len(machine.all_loops()), 6)
+            self.assertIs(machine.knit_graph, knit_graph)
+            self.assertEqual(len(knit_graph.stitch_graph), 6)
+
+    def test_released_context_is_pristine(self):
+        pool = Knit_Script_Context_Pool()
+        context = pool.acquire()
+        header = [str(k) for k in context.knitout]
+        program = r"""
+        leaked = 1;
+        def add(a, b):{ return a + b; }
+        assert add(1, 2) == 3;
+        with Carrier as 1, Gauge as 2:{
+            in Leftward direction:{ tuck Front_Needles[0:6]; }
+        }
+        """
+        context.add_variable("access", True)
+        context.add_variable("module_loads", [])
+        context.execute_statements(context.parser.parse(load_test_resource("lazy_imports_ks.ks"), pattern_is_file=True))
+        context.execute_statements(context.parser.parse(program))
+        knitout, knit_graph = context.knitout, context.machine_state.knit_graph
+        generated_lines, generated_loops = len(knitout), len(knit_graph.stitch_graph)
+        pool.release(context)
+        self.assertIs(pool.acquire(), context)
+        self.assertEqual([str(k) for k in context.knitout], header)
+        self.assertFalse(any(needle.has_loops for needle in context.machine_state.front_bed.needles))
+        self.assertEqual(len(context.machine_state.carrier_system.active_carriers), 0)
+        self.assertIsNone(context.machine_state.carrier_system.hooked_carrier)
+        self.assertEqual(context.gauge, 1)
+        self.assertNotIn("leaked", context.variable_scope)
+        self.assertEqual(len(context.module_registry), 0)
+        self.assertEqual(len(context.machine_independent_calls), 0)
+        self.assertIsNot(context.machine_state.knit_graph, knit_graph)
+        self.assertEqual(len(context.machine_state.knit_graph.stitch_graph), 0)
+        self.assertEqual((len(knitout), len(knit_graph.stitch_graph)), (generated_lines, generated_loops))  # Results of the released program are not changed.
+        self.assertEqual(context.state_fingerprint, Knit_Script_Context(parser=pool.parser).state_fingerprint)
+
+    def test_release_limits(self):
+        pool = Knit_Script_Context_Pool(max_idle_contexts=1)
+        first_context, second_context = pool.acquire(), pool.acquire()
+        pool.release(first_context)
+        pool.release(first_context)
+        pool.release(second_context)
+        self.assertEqual(len(pool), 1)
+        with self.assertRaises(ValueError):
+            pool.release(Knit_Script_Context(parser=pool.parser))
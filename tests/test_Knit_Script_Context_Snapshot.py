@@ -0,0 +1,105 @@
+import os
+from unittest import TestCase, skipUnless
+
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.knit_script_context_pool import Knit_Script_Context_Pool
+from knit_script.knit_script_interpreter.knit_script_context_snapshot import Knit_Script_Context_Snapshot
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+
+
+class Test_Knit_Script_Context_Snapshot(TestCase):
+    prefix = r"""
+    width = 6;
+    def knit_rows(rows):{
+        for _ in range(rows):{
+            in reverse direction:{
+                knit Loops;
+            }
+        }
+    }
+    Carrier = c;
+    in Leftward direction:{
+        tuck Front_Needles[1:width:2];
+    }
+    in reverse direction:{
+        tuck Front_Needles[0:width:2];
+    }
+    knit_rows(2);
+    releasehook;
+    """
+    suffixes = [
+        r"""
+        knit_rows(3);
+        return len(Loops);
+        """,
+        r"""
+        xfer Front_Needles[0:width:2] across to Back bed;
+        knit_rows(1);
+        return width;
+        """,
+    ]
+
+    @staticmethod
+    def _interpreter(context_pool: Knit_Script_Context_Pool | None = None) -> Knit_Script_Interpreter:
+        return Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), context_pool=context_pool)
+
+    def test_suffixes_match_full_programs(self):
+        for context_pool in [None, Knit_Script_Context_Pool()]:
+            interpreter = self._interpreter(context_pool)
+            snapshot = interpreter.interpret_prefix(self.prefix, c=1)
+            for suffix in self.suffixes:
+                with self.subTest(suffix=suffix, pooled=context_pool is not None):
+                    expected_knitout, expected_graph, _, expected_return = self._interpreter().write_knitout(self.prefix + suffix, "test.k", c=1)
+                    interpreter.restore_snapshot(snapshot)
+                    knitout, knit_graph, __, return_value = interpreter.write_knitout(suffix, "test.k")
+                    self.assertEqual([str(k) for k in knitout], [str(k) for k in expected_knitout])
+                    self.assertEqual(len(knit_graph.stitch_graph), len(expected_graph.stitch_graph))
+                    self.assertEqual(return_value, expected_return)
+
+    def test_restored_contexts_are_independent(self):
+        interpreter = self._interpreter()
+        context = interpreter._knitscript_context
+        context.add_variable("c", 1)
+        context.execute_statements(interpreter.parse(self.prefix))
+        snapshot = Knit_Script_Context_Snapshot(context)
+        prefix_lines, prefix_fingerprint = len(context.knitout), context.state_fingerprint
+        first_context, second_context = snapshot.restore(), snapshot.restore()
+        for restored_context in [first_context, second_context]:
+            self.assertIsNot(restored_context.machine_state, context.machine_state)
+            self.assertIsNot(restored_context.machine_state.knit_graph, context.machine_state.knit_graph)
+            self.assertIs(restored_context.variable_scope._context, restored_context)
+            self.assertIs(restored_context.parser, context.parser)
+            self.assertEqual(restored_context.state_fingerprint, prefix_fingerprint)
+            self.assertEqual(restored_context.gauged_sheet_record.sheets[0].loop_record, context.gauged_sheet_record.sheets[0].loop_record)
+        first_context.execute_statements(interpreter.parse(self.suffixes[0]))
+        context.execute_statements(interpreter.parse(self.suffixes[1]))
+        self.assertGreater(len(first_context.knitout), prefix_lines)
+        self.assertEqual(len(second_context.knitout), prefix_lines)
+        self.assertEqual(second_context.state_fingerprint, prefix_fingerprint)
+        self.assertEqual(snapshot.restore().state_fingerprint, prefix_fingerprint)
+
+    @skipUnless(hasattr(os, "fork"), "Snapshots are restored in forked worker processes.")
+    def test_restore_in_forked_worker(self):
+        interpreter = self._interpreter()
+        snapshot = interpreter.interpret_prefix(self.prefix, c=1)
+        expected_knitout, _, __, ___ = self._interpreter().write_knitout(self.prefix + self.suffixes[0], "test.k", c=1)
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # Worker process
+            os.close(read_end)
+            exit_code = 1
+            try:
+                interpreter.restore_snapshot(snapshot)
+                knitout, _, __, ___ = interpreter.write_knitout(self.suffixes[0], "test.k")
+                with os.fdopen(write_end, "w") as worker_output:
+                    worker_output.write("".join(str(k) for k in knitout))
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        os.close(write_end)
+        with os.fdopen(read_end) as worker_output:
+            worker_knitout = worker_output.read()
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertEqual(worker_knitout, "".join(str(k) for k in expected_knitout))
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.Machine_State_Fingerprint import Machine_State_Fingerprint
+
+
+def _run(program: str, context: Knit_Script_Context | None = None) -> Knit_Script_Context:
+    if context is None:
+        context = Knit_Script_Context(parser=Knit_Script_Parser(), info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger())
+    context.execute_statements(context.parser.parse(program))
+    return context
+
+
+class TestMachine_State_Fingerprint(TestCase):
+    cast_on = r"""
+    Carrier = c1;
+    in Leftward direction:{
+        tuck Front_Needles[0:6];
+    }
+    releasehook;
+    """
+
+    def test_same_state_same_fingerprint(self):
+        context_a = _run(self.cast_on)
+        context_b = _run(self.cast_on)
+        self.assertEqual(context_a.state_fingerprint, context_b.state_fingerprint)
+
+    def test_incremental_matches_rescan(self):
+        context = _run(self.cast_on)
+        context = _run(
+            r"""
+            Carrier = c1;
+            in Rightward direction:{
+                knit Front_Loops;
+            }
+            xfer Front_Needles[0:3] across to back bed;
+            in Leftward direction:{
+                tuck Back_Needles[0:3];
+            }
+            in Rightward direction:{
+                drop Front_Needles[3:6];
+            }
+            """,
+            context,
+        )
+        _ = context.state_fingerprint
+        self.assertEqual(Machine_State_Fingerprint(context).needle_hash, context._state_fingerprint.needle_hash)
+
+    def test_loop_changes_fingerprint(self):
+        context = _run(self.cast_on)
+        cast_on_fingerprint = context.state_fingerprint
+        context = _run(
+            r"""
+            Carrier = c1;
+            in Rightward direction:{
+                tuck Front_Needles[0:1];
+            }
+            """,
+            context,
+        )
+        self.assertNotEqual(cast_on_fingerprint, context.state_fingerprint)
+
+    def test_knitting_rows_restores_fingerprint(self):
+        context = _run(self.cast_on)
+        context = _run(
+            r"""
+            Carrier = c1;
+            in Rightward direction:{
+                knit Front_Loops;
+            }
+            """,
+            context,
+        )
+        row_fingerprint = context.state_fingerprint
+        context = _run(
+            r"""
+            Carrier = c1;
+            in Leftward direction:{
+                knit Front_Loops;
+            }
+            in Rightward direction:{
+                knit Front_Loops;
+            }
+            """,
+            context,
+        )
+        self.assertEqual(row_fingerprint, context.state_fingerprint)
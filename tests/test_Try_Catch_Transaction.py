@@ -0,0 +1,143 @@
+from typing import Any
+from unittest import TestCase
+
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+
+
+class Test_Try_Catch_Transaction(TestCase):
+    prefix = r"""
+    width = 6;
+    Carrier = c;
+    in Leftward direction:{
+        tuck Front_Needles[1:width:2];
+    }
+    in reverse direction:{
+        tuck Front_Needles[0:width:2];
+    }
+    for _ in range(2):{
+        in reverse direction:{
+            knit Loops;
+        }
+    }
+    releasehook;
+    xfer Front_Needles[2:4] across to Back bed;
+    """
+    suffix = r"""
+    in reverse direction:{
+        knit Loops;
+    }
+    """
+    failed_attempt = r"""
+    try:{
+        in reverse direction:{
+            knit Loops;
+        }
+        xfer Back_Loops 2 to Left to Front bed;
+        xfer Front_Needles[4:6] across to Back bed;
+        in reverse direction:{
+            knit Loops;
+        }
+        assert False;
+    }
+    catch:{
+        fallback = True;
+    }
+    """
+
+    @staticmethod
+    def _context(program: str, transactional_try: bool = True, compile_bytecode: bool = False) -> Knit_Script_Context:
+        interpreter = Knit_Script_Interpreter(
+            info_logger=get_test_info_logger(),
+            warning_logger=get_test_warning_logger(),
+            error_logger=get_test_error_logger(),
+            transactional_try=transactional_try,
+            compile_bytecode=compile_bytecode,
+        )
+        context = interpreter._knitscript_context
+        context.add_variable("c", 1)
+        context.execute_statements(interpreter.parse(program))
+        return context
+
+    @staticmethod
+    def _state(context: Knit_Script_Context) -> dict[str, Any]:
+        machine = context.machine_state
+        knit_graph = machine.knit_graph
+        return {
+            "knitout": [str(k) for k in context.knitout],
+            "needles": [(n.is_front, n.position, [loop.loop_id for loop in n.held_loops]) for n in [*machine.front_bed.needles, *machine.back_bed.needles] if n.has_loops],
+            "stitches": sorted((u.loop_id, v.loop_id) for u, v in knit_graph.stitch_graph.edges),
+            "crossings": sorted((u.loop_id, v.loop_id) for u, v in knit_graph.braid_graph.loop_crossing_graph.edges),
+            "yarns": sorted((yarn.yarn_id, len(yarn.loop_graph), len(yarn.active_loops)) for yarn in knit_graph.yarns),
+            "carriers": [(c.carrier_id, c.position, c.is_active, c.is_hooked) for c in machine.carrier_system.carriers],
+            "carriage": (machine.carriage.current_needle_position, machine.carriage.last_direction, machine.rack),
+            "sheets": [sorted(sheet.loop_record.items()) for sheet in context.gauged_sheet_record.sheets],
+            "fingerprint": context.state_fingerprint,
+        }
+
+    def test_rollback_matches_program_without_try_block(self):
+        expected_state = self._state(self._context(self.prefix + self.suffix))
+        for compile_bytecode in [False, True]:
+            with self.subTest(compile_bytecode=compile_bytecode):
+                context = self._context(self.prefix + self.failed_attempt + self.suffix, compile_bytecode=compile_bytecode)
+                self.assertTrue(context.variable_scope["fallback"])
+                self.assertEqual(self._state(context), expected_state)
+                self.assertEqual(len(context.machine_journal), 0)
+                self.assertNotIn("knit", vars(context.machine_state))  # The journaled operations are removed from the machine when the transaction closes.
+
+    def test_nested_transactions(self):
+        committed_inner_failure = r"""
+        try:{
+            in reverse direction:{
+                knit Loops;
+            }
+            try:{
+                xfer Front_Needles[0:width:2] across to Back bed;
+                assert False;
+            }
+            catch:{
+                inner = True;
+            }
+            in reverse direction:{
+                knit Loops;
+            }
+        }
+        catch:{
+            outer = True;
+        }
+        """
+        rolled_back_inner_success = r"""
+        try:{
+            try:{
+                xfer Front_Needles[0:width:2] across to Back bed;
+            }
+            catch:{
+                inner = True;
+            }
+            in reverse direction:{
+                knit Loops;
+            }
+            assert False;
+        }
+        catch:{
+            outer = True;
+        }
+        """
+        two_rows = self.suffix + self.suffix
+        for program, expected_program in [(committed_inner_failure, two_rows), (rolled_back_inner_success, "")]:
+            with self.subTest(program=program):
+                context = self._context(self.prefix + program + self.suffix)
+                self.assertEqual(self._state(context), self._state(self._context(self.prefix + expected_program + self.suffix)))
+
+    def test_successful_try_block_is_kept(self):
+        successful_attempt = self.failed_attempt.replace("assert False;", "")
+        context = self._context(self.prefix + successful_attempt + self.suffix)
+        self.assertNotIn("fallback", context.variable_scope)
+        self.assertEqual(self._state(context), self._state(self._context(self.prefix + successful_attempt + self.suffix, transactional_try=False)))
+
+    def test_try_blocks_are_not_rolled_back_by_default(self):
+        context = self._context(self.prefix + self.failed_attempt + self.suffix, transactional_try=False)
+        expected_state = self._state(self._context(self.prefix + self.suffix))
+        self.assertGreater(len(context.knitout), len(expected_state["knitout"]))
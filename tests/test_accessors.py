@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from resources.interpret_test_ks import interpret_test_ks
+from knitout_interpreter.knitout_operations.needle_instructions import Tuck_Instruction
+from resources.interpret_test_ks import count_lines, interpret_test_ks
 
 
 class TestAttribute_Accessor_Expression(TestCase):
@@ -18,3 +19,26 @@ class TestAttribute_Accessor_Expression(TestCase):
         assert 1 in machine.carrier_system.active_carriers;
         """
         interpret_test_ks(pattern, print_k_lines=False)
+
+    def test_repeated_module_method_calls(self):
+        program = r"""
+        import cast_ons;
+        Carrier = c1;
+        for i in range(2):{
+            cast_ons.alt_tuck_cast_on(5, knit_lines =0, tuck_lines=1);
+        }
+        """
+        klines, _, __ = interpret_test_ks(program, print_k_lines=False)
+        assert count_lines(klines, include_types={Tuck_Instruction}) == 10
+
+    def test_chained_attribute_access(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:10];
+        }
+        for i in range(3):{
+            assert 1 in machine.carrier_system.active_carriers;
+        }
+        """
+        interpret_test_ks(program, print_k_lines=False)
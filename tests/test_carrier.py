@@ -30,3 +30,10 @@ class TestCarrier_Expression(TestCase):
                 assert Carrier[0] == 1;
                 """
         interpret_test_ks(pattern, print_k_lines=False)
+
+    def test_carrier_literals_are_machine_carriers(self):
+        pattern = r"""
+                assert c2 is c2;
+                assert c2 is machine.carrier_system.carriers[1];
+                """
+        interpret_test_ks(pattern, print_k_lines=False)
@@ -1,6 +1,12 @@
+from typing import Any
 from unittest import TestCase
 
-from resources.interpret_test_ks import interpret_test_ks
+from resources.interpret_test_ks import interpret_test_ks, interpret_test_ks_with_return
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.Knit_Script_Interpreter import Knit_Script_Interpreter
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
 
 
 class Test_Loops(TestCase):
@@ -13,3 +19,190 @@ class Test_Loops(TestCase):
         }
         """
         interpret_test_ks(program, print_k_lines=False)
+
+    @staticmethod
+    def _knitout_lines(program: str, replay_loops: bool, **python_variables: Any) -> list[str]:
+        interpreter = Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), replay_loops=replay_loops)
+        knitout, _, __, ___ = interpreter.write_knitout(program, "test.k", **python_variables)
+        return [str(k) for k in knitout]
+
+    def _assert_replay_matches(self, program: str, **python_variables: Any) -> None:
+        self.assertEqual(self._knitout_lines(program, False, **python_variables), self._knitout_lines(program, True, **python_variables))
+
+    def test_replay_stockinette_rows(self):
+        program = r"""
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:width:2];
+            }
+            in Rightward direction:{
+                tuck Front_Needles[1:width:2];
+            }
+            releasehook;
+            for _ in range(height):{
+                in reverse direction:{
+                    knit Loops;
+                }
+            }
+            i = 0;
+            while i < 4:{
+                i = i + 1;
+                in reverse direction:{
+                    knit Loops;
+                }
+            }
+        }
+        """
+        self._assert_replay_matches(program, width=10, height=10)
+
+    def test_replay_changing_state(self):
+        program = r"""
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:6];
+            }
+            releasehook;
+            while len(Front_Loops) > 0:{
+                in Rightward direction:{
+                    drop Front_Loops[0:1];
+                }
+            }
+            assert len(Front_Loops) == 0;
+        }
+        """
+        self._assert_replay_matches(program)
+
+    def test_replay_loop_variable(self):
+        program = r"""
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:6];
+            }
+            releasehook;
+            for i in range(6):{
+                in reverse direction:{
+                    knit Front_Needles[0:i];
+                }
+            }
+        }
+        """
+        self._assert_replay_matches(program)
+
+    @staticmethod
+    def _replayed_statements(program: str) -> list[Any]:
+        parser = Knit_Script_Parser()
+        context = Knit_Script_Context(parser=parser, info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), replay_loops=True)
+        statements = parser.parse(program)
+        context.execute_statements(statements)
+        return statements
+
+    def test_replay_counts_replayed_iterations(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:6];
+        }
+        releasehook;
+        for _ in range(10):{
+            in reverse direction:{
+                knit Loops;
+            }
+        }
+        """
+        row_replay = self._replayed_statements(program)[-1].row_replay
+        self.assertIsNotNone(row_replay)
+        self.assertEqual(row_replay.recorded_iterations, 2)  # One row in each direction is interpreted.
+        self.assertEqual(row_replay.replayed_iterations, 8)
+
+    def test_replay_loops_in_supplied_context(self):
+        context = Knit_Script_Context(parser=Knit_Script_Parser(), info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger())
+        Knit_Script_Interpreter(info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger(), context=context, replay_loops=True)
+        self.assertTrue(context.replay_loops)
+
+    def test_replay_falls_back_to_interpreting_after_state_changes(self):
+        program = r"""
+        Carrier = c1;
+        in Leftward direction:{
+            tuck Front_Needles[0:6];
+        }
+        releasehook;
+        for _ in range(6):{
+            in Rightward direction:{
+                drop Front_Loops[0:1];
+            }
+        }
+        assert len(Front_Loops) == 0;
+        """
+        row_replay = self._replayed_statements(program)[-2].row_replay
+        self.assertIsNotNone(row_replay)
+        self.assertEqual(row_replay.recorded_iterations, 6)  # Each drop starts from a new state, so no iteration is replayed.
+        self.assertEqual(row_replay.replayed_iterations, 0)
+
+    def test_hoisted_loop_invariants(self):
+        program = r"""
+        l = [1, 2, 3];
+        total = 0;
+        for i in range(4):{
+            total = total + len(l) * i + len(Front_Needles);
+        }
+        while total > len(l):{
+            total = total - machine.needle_count;
+        }
+        Carrier = c1;
+        for i in range(2):{
+            in reverse direction:{
+                tuck Front_Needles[0:6];
+            }
+            assert len(Front_Loops) == 6;
+        }
+        """
+        statements = Knit_Script_Parser().parse(program)
+
+        def hoisted_source(loop: Any) -> set[str]:
+            return {program[e.location.start_position : e.location.end_position] for e in loop._invariants}
+
+        self.assertEqual(hoisted_source(statements[2]), {"len(l)", "len(Front_Needles)"})
+        self.assertEqual(hoisted_source(statements[3]), {"len(l)", "machine.needle_count"})
+        self.assertEqual(hoisted_source(statements[5]), {"Front_Needles[0:6]"})
+
+    def test_loop_invariants_reevaluated(self):
+        program = r"""
+        lengths = [];
+        for l in [[1], [1, 2], [1, 2, 3]]:{
+            for _ in range(2):{
+                lengths = lengths + [len(l)];
+            }
+        }
+        appended = [];
+        for i in range(3):{
+            appended.append(i);
+            lengths = lengths + [len(appended)];
+        }
+        return lengths;
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, [1, 1, 2, 2, 3, 3, 1, 2, 3])
+
+    def test_for_loop_reuses_body_scope(self):
+        program = r"""
+        def first_of(values):{
+            for v in values:{
+                first = v;
+                return first;
+            }
+        }
+        total = 0;
+        for i, j in [[1, 2], [3, 4]]:{
+            total = total + i * j;
+            last = total;
+        }
+        for i in range(3):{
+            i = i + 10;
+            shifted = i;
+        }
+        return [first_of([1, 2, 3]), total, last, shifted];
+        """
+        statements = Knit_Script_Parser().parse(program)
+        self.assertEqual([s._reuse_body_scope for s in statements[2:4]], [True, False])
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, [3, 14, 14, 12])
@@ -28,3 +28,8 @@ class Test_KnitScript_Parser(TestCase):
         program = r""" return f" before string:\n{2+2}\n after string\n{2+3}\n."; """
         _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
         self.assertEqual(return_value, f" before string:\n{2+2}\n after string\n{2+3}\n.")
+
+    def test_constant_sections(self):
+        program = r""" return f"{1+1} and {True}"; """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, "2 and True")
@@ -1,7 +1,21 @@
 from unittest import TestCase
 
-from knitout_interpreter.knitout_operations.needle_instructions import Tuck_Instruction
-from resources.interpret_test_ks import count_lines, interpret_test_ks
+from knitout_interpreter.knitout_operations.needle_instructions import Knit_Instruction, Tuck_Instruction
+from resources.interpret_test_ks import count_lines, interpret_test_ks, interpret_test_ks_with_return
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.knitscript_logging.knitscript_logger import Knit_Script_Logger
+
+
+class _Recording_Logger(Knit_Script_Logger):
+    def __init__(self) -> None:
+        super().__init__(log_to_console=False)
+        self.messages: list[str] = []
+
+    def print(self, message: str) -> None:
+        self.messages.append(message)
 
 
 class TestFunctions(TestCase):
@@ -119,3 +133,208 @@ class TestFunctions(TestCase):
         """
         klines, _, __ = interpret_test_ks(program)
         assert count_lines(klines, include_types={Tuck_Instruction}) == 4
+
+    def test_pure_function_memoized(self):
+        program = r"""
+        global calls = 0;
+        {declaration} two_rows():{{
+            global calls = calls + 1;
+            print "two rows";
+            in Rightward direction:{{
+                knit Front_Loops;
+            }}
+            in Leftward direction:{{
+                knit Front_Loops;
+            }}
+            return 2;
+        }}
+        with Carrier as c1:{{
+            in Leftward direction:{{
+                tuck Front_Needles[0:4];
+            }}
+            releasehook;
+            rows = two_rows() + two_rows() + two_rows();
+            return [calls, rows];
+        }}
+        """
+        results = {}
+        for declaration in ["def", "@pure def"]:
+            info_logger = _Recording_Logger()
+            klines, _, __, return_value = interpret_test_ks_with_return(program.format(declaration=declaration), info_logger=info_logger)
+            results[declaration] = [str(k) for k in klines], return_value, info_logger.messages.count("two rows")
+        self.assertEqual(results["def"][0], results["@pure def"][0])
+        self.assertEqual(results["def"][1:], ([3, 6], 3))
+        self.assertEqual(results["@pure def"][1:], ([1, 6], 3))  # The memoized calls are not interpreted but print their messages again.
+
+    def test_pure_function_depends_on_machine_state(self):
+        program = r"""
+        global calls = 0;
+        @pure
+        def knit_row():{
+            global calls = calls + 1;
+            in reverse direction:{
+                knit Front_Loops;
+            }
+        }
+        with Carrier as c1:{
+            in Leftward direction:{
+                tuck Front_Needles[0:4];
+            }
+            releasehook;
+            knit_row();
+            knit_row();
+            in Leftward direction:{
+                tuck Front_Needles[4:6];
+            }
+            knit_row();
+        }
+        return calls;
+        """
+        klines, _, __, calls = interpret_test_ks_with_return(program)
+        self.assertEqual(calls, 3)
+        assert count_lines(klines, include_types={Knit_Instruction}) == 14
+
+    def test_pure_is_not_reserved(self):
+        program = r"""
+        pure = 1;
+        def pure_sum(pure):{ return pure + 1; }
+        return pure_sum(pure);
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, execute_knitout=False)
+        self.assertEqual(return_value, 2)
+
+    def test_arguments_bound_in_caller_scope(self):
+        program = r"""
+        def reads_carrier(a, b=1):{
+            c = Carrier;
+            return [a, b];
+        }
+        def independent(a, b=1):{ return [a, b]; }
+        b = 7;
+        return [reads_carrier(b), independent(b), reads_carrier(b=b, a=b), independent(b=b, a=b)];
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, execute_knitout=False)
+        self.assertEqual(return_value, [[7, 1], [7, 1], [7, 7], [7, 7]])
+
+    def test_machine_independent_analysis(self):
+        program = r"""
+        def add(x, y=2):{ return x + y; }
+        def evens(n):{ return [i for i in range(0, n) if i % 2 == 0]; }
+        def tucks(w):{
+            in Leftward direction:{
+                tuck Front_Needles[0:w];
+            }
+        }
+        def carrier_id(x):{ return Carrier; }
+        def caller_variable(x):{ return x + z; }
+        def calls_function(x):{ return add(x); }
+        """
+        declarations = {d._func_name: d._machine_independent for d in Knit_Script_Parser().parse(program)}
+        self.assertEqual(declarations, {"add": True, "evens": True, "tucks": False, "carrier_id": False, "caller_variable": False, "calls_function": False})
+
+    def test_machine_independent_memoized(self):
+        program = r"""
+        def evens(n):{ return [i for i in range(0, n) if i % 2 == 0]; }
+        first = evens(6);
+        first.append(10);
+        second = evens(6);
+        assert second == [0, 2, 4];
+        assert evens(n=4) == [0, 2];
+        """
+        context = Knit_Script_Context(parser=Knit_Script_Parser(), info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger())
+        context.execute_statements(context.parser.parse(program))
+        self.assertEqual(len(context.machine_independent_calls), 2)
+        self.assertEqual(len(Knit_Script_Context(parser=context.parser).machine_independent_calls), 0)  # Memoized calls are not shared between contexts.
+
+    def test_conditionally_assigned_names_are_not_local(self):
+        program = r"""
+        def conditional(a):{
+            if a > 0:{
+                y = 1;
+            }
+            return y;
+        }
+        def both_branches(a):{
+            if a > 0:{
+                y = 1;
+            }
+            else:{
+                y = 2;
+            }
+            return y;
+        }
+        def loop_assigned(a):{
+            for i in range(a):{
+                y = i;
+            }
+            return y;
+        }
+        def assigned_first(a):{
+            y = a;
+            return y;
+        }
+        """
+        declarations = {d._func_name: d._machine_independent for d in Knit_Script_Parser().parse(program)}
+        self.assertEqual(declarations, {"conditional": False, "both_branches": True, "loop_assigned": False, "assigned_first": True})
+        program = r"""
+        y = 10;
+        def f(a):{
+            if a > 0:{
+                y = 1;
+            }
+            return y;
+        }
+        r1 = f(0);
+        y = 20;
+        r2 = f(0);
+        return [r1, r2];
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, [10, 20])
+
+    def test_inline_small_functions(self):
+        program = r"""
+        def add(x, y=2):{ return x + y; }
+        def twice(x):{ return x + x; }
+        def factorial(n):{ return n * factorial(n - 1); }
+        """
+        declarations = {d._func_name: d._inline_body is not None for d in Knit_Script_Parser().parse(program)}
+        self.assertEqual(declarations, {"add": True, "twice": False, "factorial": False})
+        program = r"""
+        def add(x, y=2):{ return x + y; }
+        total = 0;
+        for i in range(0, 4):{
+            total = total + add(i) + add(y=i, x=10);
+        }
+        return total;
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, 60)
+
+    def test_inlining_keeps_caller_parameters(self):
+        program = r"""
+        def add(a):{ return a * 10 + x; }
+        def outer(x):{ return add(x); }
+        def method_call(l):{ return l.count(1); }
+        """
+        declarations = {d._func_name: d._inline_body is not None for d in Knit_Script_Parser().parse(program)}
+        self.assertEqual(declarations, {"add": True, "outer": False, "method_call": False})
+        program = r"""
+        x = 5;
+        def add(a):{ return a * 10 + x; }
+        def outer(x):{ return add(x); }
+        return [outer(1), outer(2)];
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, [11, 22])
+
+    def test_inlined_error_location(self):
+        program = r"""
+        def divide(x):{
+            return x / 0;
+        }
+        divide(1);
+        """
+        with self.assertRaises(ZeroDivisionError) as error:
+            interpret_test_ks(program, print_k_lines=False)
+        self.assertIn("on line 3", error.exception.__notes__[-1])
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase, skipUnless
+
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+
+
+class Test_Import_Time(TestCase):
+    _IMPORT_TIME_BUDGET_VARIABLE: str = "KNIT_SCRIPT_IMPORT_TIME_BUDGET"  # Seconds to import knit_script.interpret_knit_script on the benchmarking machine. Timings vary by machine, so the benchmark is opt-in.
+    _LAZY_MODULES: tuple[str, ...] = ("knit_script.debugger.knitscript_debugger", "knit_script.debugger.knitscript_frame", "knit_script.knit_script_interpreter.bytecode.")
+
+    @staticmethod
+    def _import_times(module_name: str) -> dict[str, tuple[float, float]]:
+        """Import the module in a fresh python process with -X importtime and return the self and cumulative import time of each imported module in seconds."""
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"], capture_output=True, text=True, check=True)
+        import_times: dict[str, tuple[float, float]] = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_time, cumulative_time, imported_module = line.removeprefix("import time:").split("|")
+            import_times[imported_module.strip()] = (int(self_time) / 1_000_000, int(cumulative_time) / 1_000_000)
+        return import_times
+
+    @skipUnless(os.environ.get(_IMPORT_TIME_BUDGET_VARIABLE), f"Set {_IMPORT_TIME_BUDGET_VARIABLE} to benchmark the import time.")
+    def test_import_time_benchmark(self):
+        import_times = self._import_times("knit_script.interpret_knit_script")
+        self.assertLess(import_times["knit_script.interpret_knit_script"][1], float(os.environ[self._IMPORT_TIME_BUDGET_VARIABLE]))
+
+    def test_rarely_used_modules_are_not_imported(self):
+        import_times = self._import_times("knit_script.interpret_knit_script")
+        for module_name in import_times:
+            with self.subTest(module_name=module_name):
+                self.assertFalse(module_name.startswith(self._LAZY_MODULES))
+
+    def test_parsers_share_grammar(self):
+        first_parser = Knit_Script_Parser()
+        second_parser = Knit_Script_Parser()
+        self.assertIs(first_parser._grammar, second_parser._grammar)
+        self.assertIs(first_parser._parser.table, second_parser._parser.table)
+        self.assertIsNot(first_parser._parser, second_parser._parser)
+        self.assertEqual([str(s) for s in first_parser.parse("x = 1;")], [str(s) for s in second_parser.parse("x = 1;")])
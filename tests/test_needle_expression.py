@@ -23,3 +23,28 @@ class TestNeedle_Expression(TestCase):
         for i in range(3):
             program = f"assert bs{i}.position == {i} and not bs{i}.is_front and bs{i}.is_slider;"
             interpret_test_ks(program, print_k_lines=False)
+
+    def test_needles_are_interned(self):
+        program = r"""
+        assert f1 is f1;
+        assert not (f1 is b1);
+        assert not (f1 is fs1);
+        """
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_interned_needles_by_sheet_and_gauge(self):
+        program = r"""
+        Gauge = 2;
+        Sheet = s0;
+        n0 = f1;
+        Sheet = s1;
+        n1 = f1;
+        Sheet = s0;
+        assert n0 is f1;
+        assert not (n1 is f1);
+        Gauge = 1;
+        assert n0.position == 2;
+        assert n1.position == 3;
+        assert f1.position == 1;
+        """
+        interpret_test_ks(program, print_k_lines=False)
@@ -160,3 +160,12 @@ class TestNeedle_Set_Expression(TestCase):
         assert len(Front_Loops) == 4;
         """
         interpret_test_ks(program)
+
+    def test_last_pass_of_machine_and_sheet(self):
+        program = r"""
+        assert machine.Last_Pass is None;
+        assert s0.Last_Pass is None;
+        return len(machine.Front_Needles);
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(return_value, 540)
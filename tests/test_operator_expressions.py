@@ -83,3 +83,11 @@ class TestOperator_Expression(TestCase):
     def test_and(self):
         program = r"""assert 1==1 and True;"""
         interpret_test_ks(program, print_k_lines=False)
+
+    def test_or_short_circuit(self):
+        program = r"""assert True or undefined_variable;"""
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_and_short_circuit(self):
+        program = r"""assert not (False and undefined_variable);"""
+        interpret_test_ks(program, print_k_lines=False)
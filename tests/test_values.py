@@ -1,7 +1,7 @@
 import random
 from unittest import TestCase
 
-from resources.interpret_test_ks import interpret_test_ks
+from resources.interpret_test_ks import interpret_test_ks, interpret_test_ks_with_return
 
 
 class TestFloat_Value(TestCase):
@@ -20,3 +20,39 @@ class TestFloat_Value(TestCase):
             val = random.randrange(-100, 100)
             program = f"assert isinstance({val}, int);"
             interpret_test_ks(program, print_k_lines=False)
+
+    def test_repeated_literal_evaluation(self):
+        program = r"""
+        total = 0;
+        for i in range(3):{
+            total = total + 2 * 3 - 1;
+        }
+        return total;
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(15, return_value)
+
+    def test_constant_list_is_not_shared(self):
+        program = r"""
+        lists = [];
+        for i in range(2):{
+            l = [1, 2, 3];
+            l.append(i);
+            lists.append(l);
+        }
+        return lists;
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual([[1, 2, 3, 0], [1, 2, 3, 1]], return_value)
+
+    def test_constant_error_raised_at_execution(self):
+        program = r"""
+        x = 1;
+        try:{
+            x = 1 / 0;
+        }catch ZeroDivisionError:{
+            x = 2;
+        }
+        assert x == 2;
+        """
+        interpret_test_ks(program, print_k_lines=False)
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from resources.interpret_test_ks import interpret_test_ks, interpret_test_ks_with_return
+from resources.test_loggers import get_test_error_logger, get_test_info_logger, get_test_warning_logger
+
+from knit_script.knit_script_interpreter.Knit_Script_Parser import Knit_Script_Parser
+from knit_script.knit_script_interpreter.knit_script_context import Knit_Script_Context
+from knit_script.knit_script_interpreter.scope.local_scope import Knit_Script_Scope
+
+
+class TestVariable_Expression(TestCase):
+    def test_repeated_lookup_in_loop(self):
+        program = r"""
+        total = 0;
+        for i in range(5):{
+            total = total + i;
+        }
+        return total;
+        """
+        _, __, ___, return_value = interpret_test_ks_with_return(program, print_k_lines=False)
+        self.assertEqual(10, return_value)
+
+    def test_lookup_after_local_declaration(self):
+        program = r"""
+        x = 1;
+        def get_x():{
+            return x;
+        }
+        def shadow_x():{
+            a = get_x();
+            x = 2;
+            return a + x;
+        }
+        assert get_x() == 1;
+        assert shadow_x() == 3;
+        assert get_x() == 1;
+        """
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_lookup_after_delete(self):
+        program = r"""
+        x = 1;
+        def get_x():{
+            return x;
+        }
+        def get_i():{
+            return i;
+        }
+        for i in range(3):{
+            assert get_x() == 1;
+            assert get_i() == i;
+        }
+        i = 5;
+        assert get_i() == 5;
+        """
+        interpret_test_ks(program, print_k_lines=False)
+
+    def test_scope_exit_only_invalidates_its_variables(self):
+        context = Knit_Script_Context(parser=Knit_Script_Parser(), info_logger=get_test_info_logger(), warning_logger=get_test_warning_logger(), error_logger=get_test_error_logger())
+        context.variable_scope["outer"] = 1
+        outer_version = Knit_Script_Scope.scope_version("outer")
+        context.enter_sub_scope()
+        context.variable_scope["inner"] = 2
+        inner_version = Knit_Script_Scope.scope_version("inner")
+        context.exit_current_scope()
+        self.assertEqual(outer_version, Knit_Script_Scope.scope_version("outer"))
+        self.assertNotEqual(inner_version, Knit_Script_Scope.scope_version("inner"))
+
+    def test_lookup_in_sibling_scopes(self):
+        program = r"""
+        y = 0;
+        def get_y():{
+            return y;
+        }
+        def with_y():{
+            y = 5;
+            return get_y();
+        }
+        for i in range(3):{
+            assert with_y() == 5;
+            assert get_y() == 0;
+        }
+        """
+        interpret_test_ks(program, print_k_lines=False)